@@ -0,0 +1,7 @@
+"""
+Modules shared by the Tkinter and PyQt versions of the school management system.
+
+Both applications import them as `common.<module>`. Their entry points put the repository root on
+`sys.path` before importing anything else, so these modules are found when the applications are
+run from their own folders.
+"""
@@ -0,0 +1,38 @@
+from contextlib import closing
+
+"""
+SQLite connection settings shared by the school management system's databases.
+
+Both front ends open their database connections with `DEFAULT_CONNECTION_PROFILE` unless they are
+given another profile, and apply it with `apply_profile`.
+"""
+
+DEFAULT_CONNECTION_PROFILE = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -65536,
+    'mmap_size': 268435456,
+    'temp_store': 'MEMORY',
+}
+"""
+The PRAGMA settings applied to every database connection by default.
+
+WAL journaling lets readers keep working while a long write, such as an import, is in progress, and
+`synchronous=NORMAL` is safe in WAL mode while avoiding an fsync on every commit. `cache_size` is
+given in KiB when negative (64 MiB here) and `mmap_size` in bytes (256 MiB). An empty dict keeps
+SQLite's defaults.
+"""
+
+
+def apply_profile(connection, profile):
+    """
+    Apply a connection profile by issuing one `PRAGMA name = value` statement per entry.
+
+    :param connection: The connection to configure.
+    :type connection: sqlite3.Connection
+    :param profile: The PRAGMA settings to apply.
+    :type profile: dict
+    """
+    with closing(connection.cursor()) as cursor:
+        for name, value in profile.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
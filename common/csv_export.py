@@ -0,0 +1,109 @@
+import csv
+import os
+from itertools import islice
+
+"""
+Streaming CSV export for the school management system.
+
+This module provides `CsvExport`, which writes rows to a CSV file a fixed-size chunk at a time.
+Rows are pulled lazily from any iterable, such as a database cursor or a generator, so only one
+chunk is held in memory however large the export is. Between chunks the caller can report progress
+and cancel the export, in which case the partly written file is removed.
+"""
+
+CHUNK_SIZE = 1000
+"""
+The default number of rows written per chunk.
+"""
+
+
+class CsvExport:
+    """
+    An export of rows to a CSV file, written in chunks.
+
+    The file is created and the header written by the first call to `step`.
+
+    :param filename: The path of the CSV file to write.
+    :type filename: str
+    :param header: The column titles written as the first line of the file.
+    :type header: list[str]
+    :param rows: The rows to write, as sequences of column values.
+    :type rows: iterable
+    :param total: The number of rows expected, used to report progress, or None if unknown.
+    :type total: int or None
+    :param chunk_size: The number of rows written per call to `step`.
+    :type chunk_size: int
+    """
+    def __init__(self, filename, header, rows, total=None, chunk_size=CHUNK_SIZE):
+        self.filename = filename
+        self.header = header
+        self.rows = iter(rows)
+        self.total = total
+        self.chunk_size = chunk_size
+        self.written = 0
+        self.file = None
+        self.writer = None
+        self.done = False
+
+    def step(self):
+        """
+        Write the next chunk of rows.
+
+        :return: True if there may be more rows to write, False once the export is complete.
+        :rtype: bool
+        """
+        if self.done:
+            return False
+        if self.file is None:
+            self.file = open(self.filename, 'w', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(self.header)
+        chunk = list(islice(self.rows, self.chunk_size))
+        self.writer.writerows(chunk)
+        self.written += len(chunk)
+        if len(chunk) < self.chunk_size:
+            self.close()
+            return False
+        return True
+
+    def close(self):
+        """
+        Finish the export and close the file.
+        """
+        self.done = True
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def cancel(self):
+        """
+        Abandon the export and remove the partly written file.
+        """
+        started = self.file is not None
+        self.close()
+        if started and os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def run(self, progress=None):
+        """
+        Write every row, calling `progress` after each chunk.
+
+        If `progress` returns False the export is cancelled. If writing fails the export is
+        cancelled and the error re-raised.
+
+        :param progress: Called as `progress(written, total)` after each chunk.
+        :type progress: callable or None
+        :return: True if the export completed, False if it was cancelled.
+        :rtype: bool
+        """
+        try:
+            while self.step():
+                if progress is not None and progress(self.written, self.total) is False:
+                    self.cancel()
+                    return False
+        except BaseException:
+            self.cancel()
+            raise
+        if progress is not None:
+            progress(self.written, self.total)
+        return True
@@ -0,0 +1,223 @@
+"""
+Two-sided relationship containers for the school management system.
+
+This module provides `LinkSet`, which holds the objects on the far side of a relationship, such
+as a student's registered courses. A link set keeps its items in insertion order like a list and,
+like a set, holds each object at most once. It also keeps the other side of the relationship in
+step: adding a course to a student's registered courses adds the student to the course's enrolled
+students, and removing it removes the student again.
+
+A class declares a relationship with a `LinkField`, which stores the linked objects in one of
+the owner's own slots and hands out a `LinkSet` over them when the relationship is accessed. The
+slot holds None until the first object is linked, so an entity without links costs no more than
+the empty slot. Up to `SMALL_SIZE` objects are kept in a list, and larger sets, such as a course's
+roster, in a dict, so adds, removes, and membership tests take constant time at any size.
+"""
+
+SMALL_SIZE = 8
+"""
+The largest link set kept in a list rather than a dict.
+
+Most students have only a few courses, and a short list takes far less memory than a dict. While
+one side of a link is a short list, a membership test scans whichever side is shorter, so checking
+whether a large course lists a student looks at the student's few courses.
+"""
+
+
+class LinkSet:
+    """
+    An insertion-ordered set of the objects linked to an owner, stored in one of its attributes.
+
+    The far side of the relationship is the attribute named `reverse` on each linked object. If
+    it holds a `LinkSet` the relationship is many-to-many and the owner is added to or removed
+    from that set. Otherwise it is a reference to a single owner, such as a course's instructor,
+    and it is set to the owner or cleared. That reference must be a property that moves the object
+    between its owners' link sets with `link` and `unlink` when it is set, as `Course.instructor`
+    does.
+
+    The objects are stored in the owner's attribute named `field`, which holds None while nothing
+    is linked, a list of up to `SMALL_SIZE` objects, or a dict, whose keys keep the insertion
+    order, for larger sets. The link set itself holds no objects, so it can be created whenever
+    it is needed, as `LinkField` does.
+
+    :param owner: The object the set belongs to.
+    :type owner: object
+    :param field: The name of the owner's attribute that stores the linked objects.
+    :type field: str
+    :param reverse: The name of the attribute on each linked object that refers back to the owner.
+    :type reverse: str
+    """
+    __slots__ = ('owner', 'field', 'reverse')
+
+    def __init__(self, owner, field, reverse):
+        self.owner = owner
+        self.field = field
+        self.reverse = reverse
+
+    @property
+    def items(self):
+        """
+        The list or dict of linked objects, or an empty tuple if nothing is linked.
+        """
+        return getattr(self.owner, self.field) or ()
+
+    def link(self, item):
+        """
+        Add an object to this side of the relationship only.
+
+        This is called by the other side when it changes, once it has checked that the object is
+        not linked yet; use `add` otherwise.
+
+        :param item: The object to link.
+        :type item: object
+        """
+        items = getattr(self.owner, self.field)
+        if items is None:
+            setattr(self.owner, self.field, [item])
+        elif type(items) is dict:
+            items[item] = None
+        else:
+            items.append(item)
+            if len(items) > SMALL_SIZE:
+                setattr(self.owner, self.field, dict.fromkeys(items))
+
+    def unlink(self, item):
+        """
+        Remove an object from this side of the relationship only, if it is linked.
+
+        This is called by the other side when it changes; use `discard` otherwise.
+
+        :param item: The object to unlink.
+        :type item: object
+        """
+        items = getattr(self.owner, self.field)
+        if not items:
+            return
+        if type(items) is dict:
+            items.pop(item, None)
+        elif item in items:
+            items.remove(item)
+        if not items:
+            setattr(self.owner, self.field, None)
+
+    def add(self, item):
+        """
+        Link an object to the owner on both sides. Linking an object twice has no effect.
+
+        :param item: The object to link.
+        :type item: object
+        """
+        if item in self:
+            return
+        back = getattr(item, self.reverse)
+        if isinstance(back, LinkSet):
+            self.link(item)
+            back.link(self.owner)
+        else:
+            setattr(item, self.reverse, self.owner)
+
+    def discard(self, item):
+        """
+        Unlink an object from the owner on both sides, if it is linked.
+
+        :param item: The object to unlink.
+        :type item: object
+        """
+        if item not in self:
+            return
+        back = getattr(item, self.reverse)
+        if isinstance(back, LinkSet):
+            self.unlink(item)
+            back.unlink(self.owner)
+        else:
+            setattr(item, self.reverse, None)
+
+    def remove(self, item):
+        """
+        Unlink an object from the owner on both sides.
+
+        :param item: The object to unlink.
+        :type item: object
+        :raises KeyError: If the object is not linked.
+        """
+        if item not in self:
+            raise KeyError(item)
+        self.discard(item)
+
+    def clear(self):
+        """
+        Unlink every object from the owner on both sides.
+        """
+        items = getattr(self.owner, self.field)
+        if not items:
+            return
+        setattr(self.owner, self.field, None)
+        for item in items:
+            back = getattr(item, self.reverse)
+            if isinstance(back, LinkSet):
+                back.unlink(self.owner)
+            elif back is self.owner:
+                setattr(item, self.reverse, None)
+
+    def replace(self, items):
+        """
+        Unlink every object, then link the given ones.
+
+        :param items: The objects to link.
+        :type items: iterable
+        """
+        items = list(items)
+        self.clear()
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item):
+        items = self.items
+        if not items:
+            return False
+        if type(items) is dict:
+            return item in items
+        back = getattr(item, self.reverse, None)
+        if not isinstance(back, LinkSet):
+            return back is self.owner
+        others = back.items
+        if type(others) is dict or len(others) < len(items):
+            return self.owner in others
+        return item in items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+
+class LinkField:
+    """
+    A class attribute that gives access to one side of a relationship as a `LinkSet`.
+
+    The linked objects are stored in the slot named `field`, which the owner's `__init__` must set
+    to None before anything is linked. Reading the attribute returns a `LinkSet` over that slot,
+    and assigning an iterable to it replaces the linked objects, updating both sides.
+
+    :param field: The name of the slot that stores the linked objects.
+    :type field: str
+    :param reverse: The name of the attribute on each linked object that refers back to the owner.
+    :type reverse: str
+    """
+    __slots__ = ('field', 'reverse')
+
+    def __init__(self, field, reverse):
+        self.field = field
+        self.reverse = reverse
+
+    def __get__(self, owner, owner_type=None):
+        if owner is None:
+            return self
+        return LinkSet(owner, self.field, self.reverse)
+
+    def __set__(self, owner, items):
+        LinkSet(owner, self.field, self.reverse).replace(items)
@@ -0,0 +1,267 @@
+import re
+from collections import namedtuple
+
+"""
+Validation of email addresses and numeric IDs for the school management system.
+
+The email pattern is compiled once, when the module is imported. Single values are checked with
+`is_email` and `to_positive_integer`, or with `validate_email` and `validate_numbers`, which raise
+`ValidationError`. Imports check whole columns with `validate_column` or `validate_columns`, which
+make one pass over each column and collect every problem in a `ValidationReport` instead of
+stopping at the first one.
+"""
+
+EMAIL_PATTERN = re.compile(r"[^@]+@[^@]+\.[^@]+")
+"""
+The pattern the start of an email address must match, something like `user@example.com`.
+"""
+
+INVALID_EMAIL = "invalid email"
+INVALID_NUMBER = "parameter must be non negative number"
+INVALID_TEXT = "must be a non-empty string"
+INVALID_INTEGER = "must be an integer"
+
+Issue = namedtuple('Issue', ['row', 'column', 'value', 'message'])
+"""
+A problem found in a batch: the index of the row, the name of the column, the value, and why it is invalid.
+"""
+
+
+def describe(issue):
+    """
+    Describe a problem in one line, for example `Row 3, students.email: invalid email ('bob')`.
+
+    :param issue: The problem.
+    :type issue: Issue
+    :rtype: str
+    """
+    return f"Row {issue.row + 1}, {issue.column}: {issue.message} ({issue.value!r})"
+
+
+class ValidationError(Exception):
+    """
+    Raised when a single value is invalid.
+    """
+
+
+def is_email(value):
+    """
+    Check whether a value is a valid email address.
+
+    :param value: The value to check.
+    :return: True if the value is a string that looks like `user@example.com`.
+    :rtype: bool
+    """
+    return isinstance(value, str) and EMAIL_PATTERN.match(value) is not None
+
+
+def to_positive_integer(value):
+    """
+    Convert a value to a positive integer, if it is one.
+
+    :param value: The value to convert, such as an int or a string of digits.
+    :return: The value as an int, or None if it is not a positive integer.
+    :rtype: int or None
+    """
+    if type(value) is int:
+        return value if value > 0 else None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def validate_email(email):
+    """
+    Validate an email address.
+
+    :param email: The email address to validate.
+    :type email: str
+    :raises ValidationError: If the email is not in a valid format or is empty.
+    """
+    if not is_email(email):
+        raise ValidationError(INVALID_EMAIL)
+
+
+def validate_numbers(num):
+    """
+    Validate a numeric value to ensure it is a positive integer.
+
+    :param num: The number to validate.
+    :type num: int or str
+    :raises ValidationError: If the input is not a positive integer.
+    :return: The validated number.
+    :rtype: int
+    """
+    number = to_positive_integer(num)
+    if number is None:
+        raise ValidationError(INVALID_NUMBER)
+    return number
+
+
+class ValidationReport:
+    """
+    The problems found while validating a batch of values.
+
+    A report is valid if no problem has been added to it.
+    """
+    def __init__(self):
+        self.issues = []
+        self.checked = 0
+
+    def add(self, row, column, value, message):
+        """
+        Record a problem.
+
+        :param row: The index of the row the value is in.
+        :type row: int
+        :param column: The name of the column the value is in.
+        :type column: str
+        :param value: The invalid value.
+        :param message: Why the value is invalid.
+        :type message: str
+        """
+        self.issues.append(Issue(row, column, value, message))
+
+    @property
+    def valid(self):
+        """
+        Whether no problems were found.
+        """
+        return not self.issues
+
+    def summary(self, limit=10):
+        """
+        Describe the problems found, listing at most `limit` of them.
+
+        :param limit: The largest number of problems to list.
+        :type limit: int
+        :return: A message suitable for showing to the user.
+        :rtype: str
+        """
+        if self.valid:
+            return f"All {self.checked} values are valid."
+        lines = [f"{len(self.issues)} invalid values found:"]
+        lines.extend(describe(issue) for issue in self.issues[:limit])
+        if len(self.issues) > limit:
+            lines.append(f"... and {len(self.issues) - limit} more.")
+        return "\n".join(lines)
+
+    def __len__(self):
+        return len(self.issues)
+
+    def __iter__(self):
+        return iter(self.issues)
+
+
+def check_emails(values, column, report):
+    """
+    Add a problem to a report for each value of a column that is not a valid email address.
+
+    :return: The number of values checked.
+    :rtype: int
+    """
+    match = EMAIL_PATTERN.match
+    count = 0
+    for row, value in enumerate(values):
+        if not (isinstance(value, str) and match(value)):
+            report.add(row, column, value, INVALID_EMAIL)
+        count += 1
+    return count
+
+
+def check_positive_integers(values, column, report):
+    """
+    Add a problem to a report for each value of a column that is not a positive integer.
+
+    :return: The number of values checked.
+    :rtype: int
+    """
+    count = 0
+    for row, value in enumerate(values):
+        if not (type(value) is int and value > 0) and to_positive_integer(value) is None:
+            report.add(row, column, value, INVALID_NUMBER)
+        count += 1
+    return count
+
+
+def check_texts(values, column, report):
+    """
+    Add a problem to a report for each value of a column that is not a non-empty string.
+
+    :return: The number of values checked.
+    :rtype: int
+    """
+    count = 0
+    for row, value in enumerate(values):
+        if not (isinstance(value, str) and value):
+            report.add(row, column, value, INVALID_TEXT)
+        count += 1
+    return count
+
+
+def check_integers(values, column, report):
+    """
+    Add a problem to a report for each value of a column that is not an int.
+
+    :return: The number of values checked.
+    :rtype: int
+    """
+    count = 0
+    for row, value in enumerate(values):
+        if not isinstance(value, int):
+            report.add(row, column, value, INVALID_INTEGER)
+        count += 1
+    return count
+
+
+CHECKS = {
+    'email': check_emails,
+    'positive_integer': check_positive_integers,
+    'text': check_texts,
+    'integer': check_integers,
+}
+"""
+The kinds of column `validate_column` can check, and the function that checks each one.
+"""
+
+
+def validate_column(values, kind, column, report=None):
+    """
+    Check every value of a column in one pass.
+
+    :param values: The values of the column, in row order.
+    :type values: iterable
+    :param kind: The kind of value expected, one of the keys of `CHECKS`.
+    :type kind: str
+    :param column: The name of the column, used in the report.
+    :type column: str
+    :param report: The report to add problems to, or None to start a new one.
+    :type report: ValidationReport or None
+    :return: The report.
+    :rtype: ValidationReport
+    :raises KeyError: If `kind` is not a known kind of column.
+    """
+    if report is None:
+        report = ValidationReport()
+    report.checked += CHECKS[kind](values, column, report)
+    return report
+
+
+def validate_columns(columns, report=None):
+    """
+    Check several columns, one pass each, collecting every problem in one report.
+
+    :param columns: The columns to check, as a dict mapping each column's name to its kind and values.
+    :type columns: dict[str, tuple[str, iterable]]
+    :param report: The report to add problems to, or None to start a new one.
+    :type report: ValidationReport or None
+    :return: The report.
+    :rtype: ValidationReport
+    """
+    if report is None:
+        report = ValidationReport()
+    for column, (kind, values) in columns.items():
+        validate_column(values, kind, column, report)
+    return report
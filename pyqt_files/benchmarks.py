@@ -0,0 +1,184 @@
+import argparse
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from databases import DatabaseManager
+from snapshot import Snapshot, SNAPSHOT_TABLES, write_snapshot
+
+"""
+Benchmarks for the database layer of the school management system.
+
+Each benchmark builds its own throw-away database in a temporary directory, so running this
+module never touches `school_management.db`. Run it from the `pyqt_files` folder, for example::
+
+    python benchmarks.py profile --rows 5000
+"""
+
+
+def timed(function, *args):
+    """
+    Call a function and measure how long it takes.
+
+    :param function: The function to call.
+    :type function: callable
+    :return: The elapsed time in seconds.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def benchmark_profile(rows):
+    """
+    Compare insert and read throughput with SQLite's defaults and with the default connection profile.
+
+    Inserts are done one `add_student` call at a time, each with its own commit, as the GUI does.
+    Reads load the full student roster ten times.
+
+    :param rows: The number of students to insert.
+    :type rows: int
+    """
+    for label, profile in (("sqlite defaults", {}), ("connection profile", None)):
+        with tempfile.TemporaryDirectory() as directory:
+            db = DatabaseManager(os.path.join(directory, 'benchmark.db'), profile=profile)
+
+            def insert():
+                for i in range(1, rows + 1):
+                    db.add_student(f"Student {i}", 20, f"student{i}@school.edu", i)
+
+            def read():
+                for _ in range(10):
+                    db.get_student_roster()
+
+            insert_time = timed(insert)
+            read_time = timed(read)
+            db.close()
+        print(f"{label:>20}: {rows / insert_time:10.0f} inserts/s  {10 * rows / read_time:12.0f} rows read/s")
+
+
+def benchmark_search(rows):
+    """
+    Compare student search through the FTS5 index with the `LIKE` fallback.
+
+    :param rows: The number of students to insert before searching.
+    :type rows: int
+    """
+    queries = ["123456", "student77777", "nobody"]
+    with tempfile.TemporaryDirectory() as directory:
+        db = DatabaseManager(os.path.join(directory, 'benchmark.db'))
+        db.add_students_bulk(
+            (f"Student {i}", 20, f"student{i}@school.edu", i) for i in range(1, rows + 1)
+        )
+        for label, full_text_search in (("LIKE scan", False), ("FTS5 index", True)):
+            db.full_text_search = full_text_search
+
+            def search():
+                for query in queries:
+                    db.search_students(query)
+
+            elapsed = timed(search)
+            print(f"{label:>20}: {1000 * elapsed / len(queries):10.3f} ms/search")
+        db.close()
+
+
+def populate(db, rows):
+    """
+    Fill a database with generated students, instructors, courses, enrollments, and assignments.
+
+    One course is created per hundred students and one instructor per course, and every student
+    is enrolled in two courses.
+
+    :param db: The database to fill.
+    :type db: DatabaseManager
+    :param rows: The number of students to generate.
+    :type rows: int
+    """
+    courses = max(rows // 100, 2)
+    db.add_students_bulk((f"Student {i}", 20, f"student{i}@school.edu", i) for i in range(1, rows + 1))
+    db.add_instructors_bulk((f"Instructor {i}", 40, f"instructor{i}@school.edu", i) for i in range(1, courses + 1))
+    db.add_courses_bulk((f"Course {i}", i) for i in range(1, courses + 1))
+    db.enroll_bulk((i, 1 + (i + k) % courses) for i in range(1, rows + 1) for k in range(2))
+    db.assign_bulk((i, i) for i in range(1, courses + 1))
+
+
+def pickle_save(db, path):
+    """
+    Save a database the way the application did before snapshots: a pickled dict of lists of dicts.
+    """
+    data = {table: [dict(row) for row in db.connection.execute(f'SELECT * FROM {table}')] for table in SNAPSHOT_TABLES}
+    with open(path, 'wb') as f:
+        pickle.dump(data, f)
+
+
+def pickle_load(db, path):
+    """
+    Load a pickled save the way the application did before snapshots, one INSERT per row.
+    """
+    with open(path, 'rb') as f:
+        data = pickle.load(f)
+    with db.transaction():
+        for table in reversed(SNAPSHOT_TABLES):
+            db.cursor.execute(f'DELETE FROM {table}')
+        for table in SNAPSHOT_TABLES:
+            for row in data[table]:
+                placeholders = ', '.join('?' for _ in row)
+                db.cursor.execute(f'INSERT INTO {table} ({", ".join(row)}) VALUES ({placeholders})', tuple(row.values()))
+
+
+def snapshot_load(db, path):
+    """
+    Load a snapshot into a database with `DatabaseManager.import_snapshot`.
+    """
+    with Snapshot(path) as snapshot:
+        db.import_snapshot(snapshot)
+
+
+def benchmark_snapshot(rows):
+    """
+    Compare saving and loading data with pickle and with the snapshot format.
+
+    Both formats are saved from the same database, and each is loaded into its own empty database.
+
+    :param rows: The number of students to generate.
+    :type rows: int
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        source = DatabaseManager(os.path.join(directory, 'source.db'))
+        populate(source, rows)
+        for label, extension, save, load in (
+            ("pickle", 'pkl', pickle_save, pickle_load),
+            ("snapshot", 'snap', write_snapshot, snapshot_load),
+        ):
+            path = os.path.join(directory, f'data.{extension}')
+            target = DatabaseManager(os.path.join(directory, f'{extension}.db'))
+            save_time = timed(save, source, path)
+            load_time = timed(load, target, path)
+            target.close()
+            size = os.path.getsize(path)
+            print(f"{label:>20}: save {save_time:8.3f} s  load {load_time:8.3f} s  {size / 2 ** 20:8.1f} MiB")
+        source.close()
+
+
+BENCHMARKS = {
+    'profile': benchmark_profile,
+    'search': benchmark_search,
+    'snapshot': benchmark_snapshot,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run database benchmarks.")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--rows', type=int, default=5000, help="number of rows to generate")
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args.rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,53 +1,15 @@
-import re
+from common.links import LinkField
+from common.validation import validate_email, validate_numbers
 
 """
 School management system involving People, Students, Instructors, and Courses.
 
 This module provides functionality to:
-- Validate email addresses and numeric values.
+- Validate email addresses and numeric values, using `validate_email` and `validate_numbers` from `validation`.
 - Define a `Person` class with `Student` and `Instructor` subclasses.
 - Define a `Course` class where students can enroll and instructors can be assigned.
 """
 
-def validate_email(email:str):
-    """
-    Validate an email address.
-
-    This function uses a regular expression to check if the provided email
-    address has a valid format (something like `user@example.com`).
-
-    :param email: The email address to validate.
-    :type email: str
-    :raises Exception: If the email is not in a valid format or is empty.
-    :return: None
-    """
-    email_regex = r"[^@]+@[^@]+\.[^@]+"
-    if not re.match(email_regex, email) or len(email)==0:
-        raise Exception("invalid email")
-
-def validate_numbers(num:int):
-    """
-    Validate a numeric value to ensure it is non-negative and of type integer.
-
-    This function checks if the input is a valid integer and that it is greater
-    than zero. If the input is invalid or negative, it raises an exception.
-
-    :param num: The number to validate.
-    :type num: int
-    :raises Exception: If the input is not a non-negative integer.
-    :return: The validated number.
-    :rtype: int
-    """
-    try:
-        num=int(num)
-    except:
-        raise Exception("parameter must be non negative number")
-    
-    if num<=0:
-        raise Exception("parameter must be non negative number")
-    else:
-        return num
-
 class Person:
     """
     A class representing a Person.
@@ -62,8 +24,10 @@ class Person:
     :type age: int
     :param _email: The email address of the person.
     :type _email: str
-    :raises Exception: If the age or email is invalid.
+    :raises ValidationError: If the age or email is invalid.
     """
+    __slots__ = ('name', 'age', 'email')
+
     def __init__(self,name:str,age:int,_email:str):
         self.name=name
         age=validate_numbers(age)
@@ -108,24 +72,31 @@ class Student(Person):
     :type _email: str
     :param student_id: A unique identifier for the student.
     :type student_id: str
-    :raises Exception: If the age, email, or student ID is invalid.
+    :raises ValidationError: If the age, email, or student ID is invalid.
+    """
+    __slots__ = ('student_id', '_registered_courses')
+
+    registered_courses = LinkField('_registered_courses', 'enrolled_students')
     """
+    The courses the student is registered for, as a `LinkSet`.
+    """
+
     def __init__(self,name:str,age:int,_email:str,student_id:str):
         super().__init__(name, age, _email) 
         self.student_id=student_id
-        self.registered_courses=[]
+        self._registered_courses=None
         student_id=validate_numbers(student_id)
 
     def register_course(self, course):
         """
-        Register the student for a course.
+        Register the student for a course, which also adds the student to the course's enrolled students.
 
         :param course: The course object to register for.
         :type course: Course
         :raises AssertionError: If the provided object is not of type `Course`.
         """
         assert type(course) == Course, "Must input a course"
-        self.registered_courses.append(course)
+        self.registered_courses.add(course)
 
 class Instructor(Person):
     """
@@ -142,30 +113,33 @@ class Instructor(Person):
     :type _email: str
     :param instructor_id: A unique identifier for the instructor.
     :type instructor_id: str
-    :raises Exception: If the age, email, or instructor ID is invalid.
+    :raises ValidationError: If the age, email, or instructor ID is invalid.
+    """
+    __slots__ = ('instructor_id', '_assigned_courses')
+
+    assigned_courses = LinkField('_assigned_courses', 'instructor')
     """
+    The courses assigned to the instructor, as a `LinkSet`.
+    """
+
     def __init__(self,name:str,age:int,_email:str,instructor_id:str):
         super().__init__(name, age, _email)
         self.instructor_id = instructor_id
-        self.assigned_courses = [] 
+        self._assigned_courses = None
         instructor_id=validate_numbers(instructor_id)
 
     def assign_course(self, course):
         """
         Assign the instructor to a course.
 
-        This method assigns the instructor to a course.
+        This method assigns the instructor to a course, taking it from its previous instructor.
 
         :param course: The course object to assign.
         :type course: Course
         :raises AssertionError: If the provided object is not of type `Course`.
         """
         assert type(course) == Course, "Must input a course"
-        if course.instructor and course.instructor != self:
-            course.instructor.assigned_courses.remove(course)
-        course.instructor = self
-        if course not in self.assigned_courses:
-            self.assigned_courses.append(course)
+        self.assigned_courses.add(course)
 
 class Course:
     """
@@ -179,20 +153,47 @@ class Course:
     :type course_id: str
     :param course_name: The name of the course.
     :type course_name: str
-    :raises Exception: If the course ID is invalid (must be a non-negative integer).
+    :raises ValidationError: If the course ID is invalid (must be a positive integer).
+    """
+    __slots__ = ('course_id', 'course_name', '_instructor', '_enrolled_students')
+
+    enrolled_students = LinkField('_enrolled_students', 'registered_courses')
+    """
+    The students enrolled in the course, as a `LinkSet`.
     """
+
     def __init__(self,course_id:str,course_name:str):
         self.course_id = course_id
         self.course_name = course_name
-        self.instructor = None #initially dont have an instructor, we add it in the instructors assign course function
-        self.enrolled_students =[]  
+        self._instructor = None #initially dont have an instructor, we add it in the instructors assign course function
+        self._enrolled_students = None
         validate_numbers(course_id)
 
+    @property
+    def instructor(self):
+        """
+        The instructor assigned to the course, or None.
+
+        Setting it moves the course from the previous instructor's assigned courses to the new one's.
+        """
+        return self._instructor
+
+    @instructor.setter
+    def instructor(self, instructor):
+        previous = self._instructor
+        if previous is instructor:
+            return
+        self._instructor = instructor
+        if previous is not None:
+            previous.assigned_courses.unlink(self)
+        if instructor is not None:
+            instructor.assigned_courses.link(self)
+
     def add_student(self,student):
         """
         Add a student to the course.
 
-        This method adds a student to the course's enrolled students list and registers
+        This method adds a student to the course's enrolled students, which also registers
         the course with the student's registered courses.
 
         :param student: The student to add to the course.
@@ -201,8 +202,7 @@ class Course:
         :return: None
         """
         assert type(student) == Student, "Must input a student"
-        self.enrolled_students.append(student)
-        student.register_course(self) # we want to register the course for this student
+        self.enrolled_students.add(student)
 
     def serializing_function(self):
         """
@@ -1,4 +1,12 @@
+import os
+import re
 import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+from snapshot import SNAPSHOT_TABLES
+from common.connection import DEFAULT_CONNECTION_PROFILE, apply_profile
+from common.validation import ValidationReport, validate_column
 
 """
 Files for managing a SQLite database for a school management system.
@@ -9,6 +17,94 @@ This module provides a `DatabaseManager` class to handle operations like:
 - Searching records and backing up the database.
 """
 
+BACKUP_STEP_PAGES = 1024
+"""
+The number of database pages `DatabaseManager.backup_database` copies per step by default.
+"""
+
+
+class BackupCancelled(Exception):
+    """
+    Raised from a backup progress callback to stop `DatabaseManager.backup_database`.
+    """
+
+
+def full_text_index_statements(table, columns):
+    """
+    Build the statements that create an FTS5 shadow index over some columns of a table.
+
+    The index is an external-content FTS5 table named `<table>_fts` whose rowids are the row IDs of
+    `table`. Insert, update, and delete triggers keep it in sync, and a final `rebuild` indexes the
+    rows that already exist.
+
+    :param table: The name of the table to index.
+    :type table: str
+    :param columns: The names of the columns to index.
+    :type columns: list[str]
+    :return: The SQL statements to run, in order.
+    :rtype: list[str]
+    """
+    index = f'{table}_fts'
+    names = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    insert = f'INSERT INTO {index} (rowid, {names}) VALUES (new.id, {new_values});'
+    delete = f"INSERT INTO {index} ({index}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5({names}, content='{table}', content_rowid='id')",
+        f'CREATE TRIGGER IF NOT EXISTS {table}_fts_insert AFTER INSERT ON {table} BEGIN {insert} END',
+        f'CREATE TRIGGER IF NOT EXISTS {table}_fts_delete AFTER DELETE ON {table} BEGIN {delete} END',
+        f'CREATE TRIGGER IF NOT EXISTS {table}_fts_update AFTER UPDATE ON {table} BEGIN {delete} {insert} END',
+        f"INSERT INTO {index} ({index}) VALUES ('rebuild')",
+    ]
+
+
+def match_expression(search_query):
+    """
+    Turn free text typed by the user into an FTS5 prefix query.
+
+    Every word of the search query becomes a quoted prefix term, so `"ann sm"` matches rows
+    containing a token starting with `ann` and a token starting with `sm`.
+
+    :param search_query: The text typed by the user.
+    :type search_query: str
+    :return: The FTS5 match expression, or None if the query contains no words.
+    :rtype: str or None
+    """
+    tokens = re.findall(r'\w+', search_query)
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+SCHEMA_MIGRATIONS = [
+    [
+        'CREATE INDEX IF NOT EXISTS idx_courses_course_name ON courses (course_name, course_id)',
+        'CREATE INDEX IF NOT EXISTS idx_enrollments_course ON enrollments (course_id, student_id)',
+        'CREATE INDEX IF NOT EXISTS idx_students_name ON students (name)',
+    ],
+    full_text_index_statements('students', ['name', 'email', 'student_id'])
+    + full_text_index_statements('instructors', ['name', 'email', 'instructor_id'])
+    + full_text_index_statements('courses', ['course_name', 'course_id']),
+]
+"""
+The schema migrations applied by `DatabaseManager.migrate`, in order.
+
+Migration `n` (counting from 1) is the list of statements at index `n - 1`. The number of the last
+migration applied to a database file is stored in its `PRAGMA user_version`, so new migrations must
+only ever be appended to this list.
+"""
+
+IMPORT_CHECKS = {
+    'students': {'age': 'positive_integer', 'email': 'email', 'student_id': 'positive_integer'},
+    'instructors': {'age': 'positive_integer', 'email': 'email', 'instructor_id': 'positive_integer'},
+    'courses': {'course_id': 'positive_integer'},
+}
+"""
+The columns checked by `DatabaseManager.validate_snapshot` before an import, and the kind of value
+each must hold, as understood by `validation.validate_column`.
+"""
+
 
 class DatabaseManager:
     """
@@ -20,9 +116,13 @@ class DatabaseManager:
 
     :param db_name: The name of the SQLite database file. Default is 'school_management.db'.
     :type db_name: str
+    :param profile: PRAGMA settings applied when connecting. Default is `DEFAULT_CONNECTION_PROFILE`.
+    :type profile: dict or None
+    :param setup: Whether to create the tables and run the schema migrations. Default is True.
+    :type setup: bool
     """
 
-    def __init__(self, db_name='school_management.db'):
+    def __init__(self, db_name='school_management.db', profile=None, setup=True):
         """
         Initialize the database manager and create the connection.
 
@@ -30,12 +130,42 @@ class DatabaseManager:
 
         :param db_name: The name of the database file.
         :type db_name: str
+        :param profile: PRAGMA settings applied when connecting. Default is `DEFAULT_CONNECTION_PROFILE`.
+        :type profile: dict or None
+        :param setup: Whether to create the tables and run the schema migrations. Default is True.
+        :type setup: bool
         """
         self.db_name = db_name
+        self.profile = DEFAULT_CONNECTION_PROFILE if profile is None else profile
+        self.connect()
+        self.transaction_depth = 0
+        if setup:
+            self.create_tables()
+            self.migrate()
+        self.detect_full_text_search()
+
+    def open_reader(self):
+        """
+        Open a second database manager on the same database file.
+
+        SQLite connections cannot be shared between threads, so background workers use their own
+        manager. The schema is not touched, since this manager already set it up.
+
+        :return: A new database manager connected to the same file with the same profile.
+        :rtype: DatabaseManager
+        """
+        return DatabaseManager(self.db_name, self.profile, setup=False)
+
+    def connect(self):
+        """
+        Open the connection to the database file and apply the connection profile.
+
+        Each entry of `self.profile` is issued as a `PRAGMA name = value` statement.
+        """
         self.connection = sqlite3.connect(self.db_name)
-        self.connection.row_factory = sqlite3.Row  
+        self.connection.row_factory = sqlite3.Row
+        apply_profile(self.connection, self.profile)
         self.cursor = self.connection.cursor()
-        self.create_tables()
 
     def create_tables(self):
         """
@@ -94,6 +224,105 @@ class DatabaseManager:
 
         self.connection.commit()
 
+    def migrate(self):
+        """
+        Bring the database schema up to date.
+
+        This method reads the schema version from `PRAGMA user_version` and applies every migration in
+        `SCHEMA_MIGRATIONS` that is newer than it, so database files created by older versions of the
+        application are upgraded in place. The version is bumped after each migration, and migration
+        statements use `IF NOT EXISTS`, so an interrupted upgrade is simply resumed on the next start.
+
+        If a migration cannot be applied, for example because SQLite was built without FTS5, the
+        upgrade stops there and is retried on the next start.
+        """
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        for number, statements in enumerate(SCHEMA_MIGRATIONS[version:], start=version + 1):
+            try:
+                with self.transaction():
+                    for statement in statements:
+                        self.cursor.execute(statement)
+                    self.cursor.execute(f'PRAGMA user_version = {number}')
+            except sqlite3.OperationalError:
+                break
+
+    def detect_full_text_search(self):
+        """
+        Check whether the FTS5 search indexes exist and record it in `full_text_search`.
+        """
+        self.full_text_search = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'students_fts'"
+        ).fetchone() is not None
+
+    def search_filter(self, table, name_column, id_column, search_query):
+        """
+        Build the SQL fragments that restrict a query on a table to the rows matching a search query.
+
+        When the FTS5 indexes are available, the rows are matched by word prefix against the table's
+        `<table>_fts` index and ordered by their FTS5 `rank`, which is the `bm25` score. Otherwise, or if the query contains no words, this
+        falls back to a `LIKE` match on the name and ID columns ordered by row ID.
+
+        :param table: The table being searched.
+        :type table: str
+        :param name_column: The name column used by the `LIKE` fallback.
+        :type name_column: str
+        :param id_column: The ID column used by the `LIKE` fallback.
+        :type id_column: str
+        :param search_query: The search term, or None to match every row.
+        :type search_query: str or None
+        :return: A `(join, where, order_by, params)` tuple of SQL fragments and their parameters.
+        :rtype: tuple
+        """
+        if not search_query:
+            return '', '', f'{table}.id', ()
+        expression = match_expression(search_query)
+        if self.full_text_search and expression:
+            join = f'''
+                INNER JOIN (
+                    SELECT rowid, rank AS score FROM {table}_fts WHERE {table}_fts MATCH ? ORDER BY rank
+                ) AS hits ON hits.rowid = {table}.id
+            '''
+            return join, '', 'hits.score', (expression,)
+        where = f'WHERE {table}.{name_column} LIKE ? OR {table}.{id_column} LIKE ?'
+        return '', where, f'{table}.id', (f'%{search_query}%', f'%{search_query}%')
+
+    def commit(self):
+        """
+        Commit pending changes unless a `transaction` block is open.
+
+        Mutators call this instead of committing directly, so that several writes made inside
+        `transaction` are committed together when the outermost block exits.
+        """
+        if self.transaction_depth == 0:
+            self.connection.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into a single transaction.
+
+        Commits made by the mutators inside the block are deferred until the outermost block exits.
+        The transaction is committed if the block completes and rolled back if it raises. Blocks may
+        be nested; only the outermost one commits or rolls back.
+
+        Example::
+
+            with db.transaction():
+                student_db_id = db.add_student(name, age, email, student_id)
+                db.enroll_student_in_course(student_db_id, course_db_id)
+        """
+        self.transaction_depth += 1
+        try:
+            yield self
+        except Exception:
+            self.transaction_depth -= 1
+            if self.transaction_depth == 0:
+                self.connection.rollback()
+            raise
+        self.transaction_depth -= 1
+        if self.transaction_depth == 0:
+            self.connection.commit()
+
     def close(self):
         """
         Close the connection to the SQLite database.
@@ -123,9 +352,25 @@ class DatabaseManager:
         '''
         params = (name, age, email, student_id)
         self.cursor.execute(query, params)
-        self.connection.commit()
+        self.commit()
         return self.cursor.lastrowid
 
+    def add_students_bulk(self, students):
+        """
+        Add many students to the database in a single transaction.
+
+        :param students: An iterable of `(name, age, email, student_id)` tuples.
+        :type students: iterable[tuple]
+        :return: The number of students inserted.
+        :rtype: int
+        """
+        query = '''
+            INSERT INTO students (name, age, email, student_id) VALUES (?, ?, ?, ?)
+        '''
+        with self.transaction():
+            self.cursor.executemany(query, students)
+        return self.cursor.rowcount
+
     def get_all_students(self):
         """
         Retrieve all students from the database.
@@ -172,7 +417,7 @@ class DatabaseManager:
         '''
         params = (name, age, email, student_id, student_db_id)
         self.cursor.execute(query, params)
-        self.connection.commit()
+        self.commit()
 
     def delete_student(self, student_db_id):
         """
@@ -184,7 +429,7 @@ class DatabaseManager:
 
         query = 'DELETE FROM students WHERE id = ?'
         self.cursor.execute(query, (student_db_id,))
-        self.connection.commit()
+        self.commit()
 
     def add_instructor(self, name, age, email, instructor_id):
         """
@@ -207,9 +452,25 @@ class DatabaseManager:
         '''
         params = (name, age, email, instructor_id)
         self.cursor.execute(query, params)
-        self.connection.commit()
+        self.commit()
         return self.cursor.lastrowid
 
+    def add_instructors_bulk(self, instructors):
+        """
+        Add many instructors to the database in a single transaction.
+
+        :param instructors: An iterable of `(name, age, email, instructor_id)` tuples.
+        :type instructors: iterable[tuple]
+        :return: The number of instructors inserted.
+        :rtype: int
+        """
+        query = '''
+            INSERT INTO instructors (name, age, email, instructor_id) VALUES (?, ?, ?, ?)
+        '''
+        with self.transaction():
+            self.cursor.executemany(query, instructors)
+        return self.cursor.rowcount
+
     def get_all_instructors(self):
         """
         Retrieve all instructors from the database.
@@ -257,7 +518,7 @@ class DatabaseManager:
         '''
         params = (name, age, email, instructor_id, instructor_db_id)
         self.cursor.execute(query, params)
-        self.connection.commit()
+        self.commit()
 
     def delete_instructor(self, instructor_db_id):
         """
@@ -268,7 +529,7 @@ class DatabaseManager:
         """
         query = 'DELETE FROM instructors WHERE id = ?'
         self.cursor.execute(query, (instructor_db_id,))
-        self.connection.commit()
+        self.commit()
 
     def add_course(self, course_name, course_id):
         """
@@ -286,9 +547,25 @@ class DatabaseManager:
         '''
         params = (course_name, course_id)
         self.cursor.execute(query, params)
-        self.connection.commit()
+        self.commit()
         return self.cursor.lastrowid
 
+    def add_courses_bulk(self, courses):
+        """
+        Add many courses to the database in a single transaction.
+
+        :param courses: An iterable of `(course_name, course_id)` tuples.
+        :type courses: iterable[tuple]
+        :return: The number of courses inserted.
+        :rtype: int
+        """
+        query = '''
+            INSERT INTO courses (course_name, course_id) VALUES (?, ?)
+        '''
+        with self.transaction():
+            self.cursor.executemany(query, courses)
+        return self.cursor.rowcount
+
     def get_all_courses(self):
         """
         Retrieve all courses from the database.
@@ -343,7 +620,7 @@ class DatabaseManager:
         '''
         params = (course_name, course_id, course_db_id)
         self.cursor.execute(query, params)
-        self.connection.commit()
+        self.commit()
 
     def delete_course(self, course_db_id):
         """
@@ -354,7 +631,7 @@ class DatabaseManager:
         """
         query = 'DELETE FROM courses WHERE id = ?'
         self.cursor.execute(query, (course_db_id,))
-        self.connection.commit()
+        self.commit()
 
     def enroll_student_in_course(self, student_db_id, course_db_id):
         """
@@ -370,7 +647,22 @@ class DatabaseManager:
         '''
         params = (student_db_id, course_db_id)
         self.cursor.execute(query, params)
-        self.connection.commit()
+        self.commit()
+
+    def enroll_bulk(self, enrollments):
+        """
+        Enroll many students in courses in a single transaction.
+
+        Enrollments that already exist are ignored, as in `enroll_student_in_course`.
+
+        :param enrollments: An iterable of `(student_db_id, course_db_id)` tuples.
+        :type enrollments: iterable[tuple]
+        """
+        query = '''
+            INSERT OR IGNORE INTO enrollments (student_id, course_id) VALUES (?, ?)
+        '''
+        with self.transaction():
+            self.cursor.executemany(query, enrollments)
 
     def get_courses_of_student(self, student_db_id):
         """
@@ -400,7 +692,7 @@ class DatabaseManager:
         """
         query = 'DELETE FROM enrollments WHERE student_id = ? AND course_id = ?'
         self.cursor.execute(query, (student_db_id, course_db_id))
-        self.connection.commit()
+        self.commit()
 
 
     def assign_instructor_to_course(self, instructor_db_id, course_db_id):
@@ -417,7 +709,22 @@ class DatabaseManager:
         '''
         params = (instructor_db_id, course_db_id)
         self.cursor.execute(query, params)
-        self.connection.commit()
+        self.commit()
+
+    def assign_bulk(self, assignments):
+        """
+        Assign instructors to many courses in a single transaction.
+
+        A course that already has an instructor is reassigned, as in `assign_instructor_to_course`.
+
+        :param assignments: An iterable of `(instructor_db_id, course_db_id)` tuples.
+        :type assignments: iterable[tuple]
+        """
+        query = '''
+            INSERT OR REPLACE INTO assignments (instructor_id, course_id) VALUES (?, ?)
+        '''
+        with self.transaction():
+            self.cursor.executemany(query, assignments)
 
     def get_courses_of_instructor(self, instructor_db_id):
         """
@@ -445,26 +752,23 @@ class DatabaseManager:
         """
         query = 'DELETE FROM assignments WHERE course_id = ?'
         self.cursor.execute(query, (course_db_id,))
-        self.connection.commit()
+        self.commit()
 
 
     def search_students(self, search_query):
         """
         Search for students in the database by name or student ID.
 
-        This method performs a search on the `students` table, allowing partial matches
-        for the student's name or student ID using a SQL `LIKE` query.
+        This method matches word prefixes against the `students_fts` full-text index and ranks the
+        results by relevance. It falls back to partial `LIKE` matches when full-text search is unavailable.
 
         :param search_query: The search term to match against student names or IDs.
         :type search_query: str
         :return: A list of students matching the search query.
         :rtype: list[sqlite3.Row]
         """
-        query = '''
-            SELECT * FROM students
-            WHERE name LIKE ? OR student_id LIKE ?
-        '''
-        params = (f'%{search_query}%', f'%{search_query}%')
+        join, where, order_by, params = self.search_filter('students', 'name', 'student_id', search_query)
+        query = f'SELECT students.* FROM students {join} {where} ORDER BY {order_by}'
         self.cursor.execute(query, params)
         return self.cursor.fetchall()
 
@@ -472,19 +776,16 @@ class DatabaseManager:
         """
         Search for instructors in the database by name or instructor ID.
 
-        This method performs a search on the `instructors` table, allowing partial matches
-        for the instructor's name or instructor ID using a SQL `LIKE` query.
+        This method matches word prefixes against the `instructors_fts` full-text index and ranks the
+        results by relevance. It falls back to partial `LIKE` matches when full-text search is unavailable.
 
         :param search_query: The search term to match against instructor names or IDs.
         :type search_query: str
         :return: A list of instructors matching the search query.
         :rtype: list[sqlite3.Row]
         """
-        query = '''
-            SELECT * FROM instructors
-            WHERE name LIKE ? OR instructor_id LIKE ?
-        '''
-        params = (f'%{search_query}%', f'%{search_query}%')
+        join, where, order_by, params = self.search_filter('instructors', 'name', 'instructor_id', search_query)
+        query = f'SELECT instructors.* FROM instructors {join} {where} ORDER BY {order_by}'
         self.cursor.execute(query, params)
         return self.cursor.fetchall()
 
@@ -492,35 +793,320 @@ class DatabaseManager:
         """
         Search for courses in the database by course name or course ID.
 
-        This method performs a search on the `courses` table, allowing partial matches
-        for the course name or course ID using a SQL `LIKE` query.
+        This method matches word prefixes against the `courses_fts` full-text index and ranks the
+        results by relevance. It falls back to partial `LIKE` matches when full-text search is unavailable.
 
         :param search_query: The search term to match against course names or IDs.
         :type search_query: str
         :return: A list of courses matching the search query.
         :rtype: list[sqlite3.Row]
         """
-        query = '''
-            SELECT * FROM courses
-            WHERE course_name LIKE ? OR course_id LIKE ?
-        '''
-        params = (f'%{search_query}%', f'%{search_query}%')
+        join, where, order_by, params = self.search_filter('courses', 'course_name', 'course_id', search_query)
+        query = f'SELECT courses.* FROM courses {join} {where} ORDER BY {order_by}'
         self.cursor.execute(query, params)
         return self.cursor.fetchall()
 
-    def backup_database(self, backup_file_path):
+    def count_rows(self, table):
+        """
+        Count the rows in a table.
+
+        :param table: The name of the table.
+        :type table: str
+        :return: The number of rows in the table.
+        :rtype: int
+        """
+        return self.connection.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def validate_snapshot(self, snapshot):
+        """
+        Check the columns of a snapshot that the forms validate when a record is entered.
+
+        Each column listed in `IMPORT_CHECKS` is read straight from the snapshot and checked in one
+        pass, and every problem is collected rather than stopping at the first.
+
+        :param snapshot: The snapshot to check.
+        :type snapshot: snapshot.Snapshot
+        :return: The problems found.
+        :rtype: validation.ValidationReport
+        """
+        report = ValidationReport()
+        for table, checks in IMPORT_CHECKS.items():
+            for column in snapshot.tables.get(table, {}).get('columns', []):
+                if column['name'] not in checks:
+                    continue
+                values = snapshot.column(table, column)
+                try:
+                    validate_column(values, checks[column['name']], f"{table}.{column['name']}", report)
+                finally:
+                    values.release()
+        return report
+
+    def import_snapshot(self, snapshot):
+        """
+        Replace the contents of the database with the rows of a snapshot.
+
+        The rows are streamed from the snapshot with `executemany` into empty staging tables that
+        have the same columns and constraints as the live tables, but none of their secondary
+        indexes or full-text triggers. Once everything is loaded, the live tables are dropped,
+        the staging tables are renamed into their place, and the indexes and full-text indexes
+        are rebuilt in one pass each. Foreign keys are then checked once: enrollments and
+        assignments that refer to a missing student, instructor, or course are removed, as the
+        schema's cascading deletes would have done.
+
+        Everything runs in one transaction, so the database either has all of the snapshot or is
+        left unchanged. Nothing is imported unless `validate_snapshot` finds no problems.
+
+        :param snapshot: The snapshot to import.
+        :type snapshot: snapshot.Snapshot
+        :return: The number of enrollments and assignments removed because they referred to missing rows.
+        :rtype: int
+        :raises ValueError: If the snapshot has invalid values or a column the database does not.
+        """
+        report = self.validate_snapshot(snapshot)
+        if not report.valid:
+            raise ValueError(report.summary())
+        with self.transaction():
+            if not self.connection.in_transaction:
+                self.cursor.execute('BEGIN')
+            for table in SNAPSHOT_TABLES:
+                self.create_staging_table(table)
+                columns = snapshot.column_names(table)
+                if not columns:
+                    continue
+                unknown = set(columns) - set(self.column_names(table))
+                if unknown:
+                    raise ValueError(f"Unknown columns in {table}: {', '.join(sorted(unknown))}")
+                placeholders = ', '.join('?' for _ in columns)
+                self.cursor.executemany(
+                    f'INSERT INTO staging_{table} ({", ".join(columns)}) VALUES ({placeholders})',
+                    snapshot.rows(table)
+                )
+
+            for table in reversed(SNAPSHOT_TABLES):
+                self.cursor.execute(f'DROP TABLE {table}')
+            for table in SNAPSHOT_TABLES:
+                self.cursor.execute(f'ALTER TABLE staging_{table} RENAME TO {table}')
+            version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+            for statements in SCHEMA_MIGRATIONS[:version]:
+                for statement in statements:
+                    self.cursor.execute(statement)
+
+            orphans = {}
+            for table, rowid, _, _ in self.connection.execute('PRAGMA foreign_key_check').fetchall():
+                orphans.setdefault(table, set()).add(rowid)
+            for table, rowids in orphans.items():
+                self.cursor.executemany(f'DELETE FROM {table} WHERE rowid = ?', ((rowid,) for rowid in rowids))
+        return sum(len(rowids) for rowids in orphans.values())
+
+    def create_staging_table(self, table):
+        """
+        Create an empty `staging_<table>` table with the same definition as a live table.
+
+        The staging table has the live table's columns and constraints, but not its separate
+        indexes or triggers. Any staging table left over from an earlier import is replaced.
+
+        :param table: The name of the live table.
+        :type table: str
+        """
+        definition = self.connection.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()[0]
+        self.cursor.execute(f'DROP TABLE IF EXISTS staging_{table}')
+        self.cursor.execute(re.sub(rf'^CREATE TABLE\s+"?{table}"?', f'CREATE TABLE staging_{table}', definition))
+
+    def column_names(self, table):
+        """
+        Get the names of the columns of a table.
+
+        :param table: The name of the table.
+        :type table: str
+        :return: The column names, in table order.
+        :rtype: list[str]
+        """
+        return [row['name'] for row in self.connection.execute(f'PRAGMA table_info({table})')]
+
+    def open_student_roster(self, search_query=None):
+        """
+        Open a cursor over all students together with the names of their courses.
+
+        The course names are aggregated with `GROUP_CONCAT` into a `courses` column, so the
+        caller does not need to look up the courses of each student separately. The query runs
+        on its own cursor, so rows can be fetched lazily with `fetchmany`. If a search query is
+        given, only the students it matches are returned, as in `search_students`.
+
+        :param search_query: Optional search term to match against student names or IDs.
+        :type search_query: str or None
+        :return: A dedicated cursor over the students, each with an extra `courses` column.
+        :rtype: sqlite3.Cursor
+        """
+        query = '''
+            SELECT students.*, GROUP_CONCAT(courses.course_name, ', ') AS courses
+            FROM students
+            LEFT JOIN enrollments ON enrollments.student_id = students.id
+            LEFT JOIN courses ON courses.id = enrollments.course_id
+        '''
+        join, where, order_by, params = self.search_filter('students', 'name', 'student_id', search_query)
+        query += f'{join} {where} GROUP BY students.id ORDER BY {order_by}'
+        return self.connection.cursor().execute(query, params)
+
+    def open_instructor_roster(self, search_query=None):
+        """
+        Open a cursor over all instructors together with the names of their courses.
+
+        The course names are aggregated with `GROUP_CONCAT` into a `courses` column. If a search
+        query is given, only the instructors it matches are returned, as in `search_instructors`.
+
+        :param search_query: Optional search term to match against instructor names or IDs.
+        :type search_query: str or None
+        :return: A dedicated cursor over the instructors, each with an extra `courses` column.
+        :rtype: sqlite3.Cursor
+        """
+        query = '''
+            SELECT instructors.*, GROUP_CONCAT(courses.course_name, ', ') AS courses
+            FROM instructors
+            LEFT JOIN assignments ON assignments.instructor_id = instructors.id
+            LEFT JOIN courses ON courses.id = assignments.course_id
+        '''
+        join, where, order_by, params = self.search_filter('instructors', 'name', 'instructor_id', search_query)
+        query += f'{join} {where} GROUP BY instructors.id ORDER BY {order_by}'
+        return self.connection.cursor().execute(query, params)
+
+    def open_course_roster(self, search_query=None):
+        """
+        Open a cursor over all courses together with their instructor and enrolled students.
+
+        Each row carries an `instructor_name` column (None if no instructor is assigned) and a
+        `students` column with the names of the enrolled students aggregated by `GROUP_CONCAT`.
+        If a search query is given, only the courses it matches are returned, as in `search_courses`.
+
+        :param search_query: Optional search term to match against course names or IDs.
+        :type search_query: str or None
+        :return: A dedicated cursor over the courses, each with extra `instructor_name` and `students` columns.
+        :rtype: sqlite3.Cursor
+        """
+        query = '''
+            SELECT courses.*, instructors.name AS instructor_name, enrolled.students
+            FROM courses
+            LEFT JOIN assignments ON assignments.course_id = courses.id
+            LEFT JOIN instructors ON instructors.id = assignments.instructor_id
+            LEFT JOIN (
+                SELECT enrollments.course_id, GROUP_CONCAT(students.name, ', ') AS students
+                FROM enrollments
+                INNER JOIN students ON students.id = enrollments.student_id
+                GROUP BY enrollments.course_id
+            ) AS enrolled ON enrolled.course_id = courses.id
+        '''
+        join, where, order_by, params = self.search_filter('courses', 'course_name', 'course_id', search_query)
+        query += f'{join} {where} ORDER BY {order_by}'
+        return self.connection.cursor().execute(query, params)
+
+    def get_student_roster(self, search_query=None):
+        """
+        Retrieve all students with their related names aggregated, as returned by `open_student_roster`.
+
+        :param search_query: Optional search term to filter the students.
+        :type search_query: str or None
+        :return: A list of student roster rows.
+        :rtype: list[sqlite3.Row]
         """
-        Create a backup of the database file.
+        return self.open_student_roster(search_query).fetchall()
 
-        This method closes the current database connection, copies the database file to the specified
-        backup location using `shutil.copy`, and then reopens the connection.
+    def get_instructor_roster(self, search_query=None):
+        """
+        Retrieve all instructors with their related names aggregated, as returned by `open_instructor_roster`.
+
+        :param search_query: Optional search term to filter the instructors.
+        :type search_query: str or None
+        :return: A list of instructor roster rows.
+        :rtype: list[sqlite3.Row]
+        """
+        return self.open_instructor_roster(search_query).fetchall()
+
+    def get_course_roster(self, search_query=None):
+        """
+        Retrieve all courses with their related names aggregated, as returned by `open_course_roster`.
+
+        :param search_query: Optional search term to filter the courses.
+        :type search_query: str or None
+        :return: A list of course roster rows.
+        :rtype: list[sqlite3.Row]
+        """
+        return self.open_course_roster(search_query).fetchall()
+
+    def backup_database(self, backup_file_path, pages=BACKUP_STEP_PAGES, progress=None):
+        """
+        Copy the database to a file with SQLite's online backup API.
+
+        The copy is made `pages` pages at a time inside a read transaction, so it is a consistent
+        snapshot and other connections can keep reading and writing while it runs. Call this on a
+        manager from `open_reader` to run a backup off the GUI thread.
 
         :param backup_file_path: The file path where the database backup should be saved.
         :type backup_file_path: str
+        :param pages: The number of pages copied per step.
+        :type pages: int
+        :param progress: Called as `progress(copied, total)` with page counts after each step.
+            Returning False cancels the backup and removes the partly written file.
+        :type progress: callable or None
+        :return: True if the backup completed, False if it was cancelled.
+        :rtype: bool
         """
-        import shutil
-        self.connection.close()
-        shutil.copy(self.db_name, backup_file_path)
-        self.connection = sqlite3.connect(self.db_name)
-        self.connection.row_factory = sqlite3.Row
-        self.cursor = self.connection.cursor()
+        def on_step(status, remaining, total):
+            if progress is not None and progress(total - remaining, total) is False:
+                raise BackupCancelled()
+
+        began = not self.connection.in_transaction
+        if began:
+            self.connection.execute('BEGIN')
+            self.connection.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+        target = sqlite3.connect(backup_file_path)
+        try:
+            self.connection.backup(target, pages=pages, progress=on_step)
+        except BackupCancelled:
+            target.close()
+            os.remove(backup_file_path)
+            return False
+        finally:
+            target.close()
+            if began:
+                self.connection.rollback()
+        return True
+
+    def restore_database(self, backup_file_path, pages=BACKUP_STEP_PAGES, progress=None):
+        """
+        Replace the contents of the database with a backup, in place.
+
+        The backup is opened read-only and checked with `PRAGMA quick_check` before anything is
+        changed. Its pages are then copied into this manager's own connection with SQLite's online
+        backup API, so the connection stays open and nothing needs to reconnect. If the copy fails
+        part way, the database is left as it was. The restored schema is then migrated to the
+        current version.
+
+        Close any cursors opened on this manager, such as roster cursors, before restoring.
+
+        :param backup_file_path: The path of the backup file to restore.
+        :type backup_file_path: str
+        :param pages: The number of pages copied per step.
+        :type pages: int
+        :param progress: Called as `progress(copied, total)` with page counts after each step.
+        :type progress: callable or None
+        :raises sqlite3.DatabaseError: If the backup is damaged or is not a school management database.
+        """
+        def on_step(status, remaining, total):
+            if progress is not None:
+                progress(total - remaining, total)
+
+        source = sqlite3.connect(f'{Path(backup_file_path).resolve().as_uri()}?mode=ro', uri=True)
+        try:
+            problems = [row[0] for row in source.execute('PRAGMA quick_check')]
+            if problems != ['ok']:
+                raise sqlite3.DatabaseError(f"The backup failed its integrity check: {problems[0]}")
+            tables = {row[0] for row in source.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            if not {'students', 'instructors', 'courses', 'enrollments', 'assignments'} <= tables:
+                raise sqlite3.DatabaseError("The backup is not a school management database.")
+            self.connection.commit()
+            source.backup(self.connection, pages=pages, progress=on_step)
+        finally:
+            source.close()
+        self.migrate()
+        self.detect_full_text_search()
@@ -0,0 +1,234 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant, QThreadPool, pyqtSignal
+
+from workers import SearchWorker
+
+"""
+Table models for displaying school management data in Qt item views.
+
+This module provides lazily-populated `QAbstractTableModel` subclasses for students, instructors,
+and courses. Each model reads its rows from a `DatabaseManager` roster cursor in batches, so a
+`QTableView` only pulls rows from the database as the user scrolls towards them. Searches run on a
+background `SearchWorker` and their results are streamed into the model as they arrive.
+"""
+
+
+class RosterTableModel(QAbstractTableModel):
+    """
+    A read-only table model backed by a `DatabaseManager` roster cursor.
+
+    Rows are fetched in batches of `batch_size` through `canFetchMore`/`fetchMore`, which the view
+    calls whenever it needs to show rows that have not been loaded yet. Subclasses define the
+    `columns` to display, the `DatabaseManager` method that opens the roster cursor, and the
+    `table` the rows come from.
+
+    Each `load` or `search` starts a new generation; rows that arrive from an older search are dropped.
+
+    :param db_manager: The database manager the rows are read from.
+    :type db_manager: DatabaseManager
+    :param parent: The parent Qt object.
+    :type parent: QObject
+    """
+    batch_size = 256
+    columns = []
+    roster_method = None
+    table = None
+    search_finished = pyqtSignal()
+    search_failed = pyqtSignal(str)
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.rows = []
+        self.cursor = None
+        self.generation = 0
+        self.search_worker = None
+
+    def reset(self):
+        """
+        Empty the model, cancelling any search in progress and closing the current cursor.
+        """
+        self.generation += 1
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+            self.search_worker = None
+        self.beginResetModel()
+        if self.cursor is not None:
+            self.cursor.close()
+            self.cursor = None
+        self.rows = []
+        self.endResetModel()
+
+    def load(self, search_query=None):
+        """
+        Reset the model and start reading rows from a fresh roster cursor.
+
+        :param search_query: Optional search term passed on to the roster query.
+        :type search_query: str or None
+        """
+        self.reset()
+        self.cursor = getattr(self.db_manager, self.roster_method)(search_query)
+
+    def search(self, search_query):
+        """
+        Reset the model and run a search in the background, appending results as they arrive.
+
+        A search still in flight is cancelled first. An empty query lists every row, as `load` does.
+
+        :param search_query: The search term passed on to the roster query.
+        :type search_query: str
+        """
+        if not search_query:
+            self.load()
+            return
+        self.reset()
+        worker = SearchWorker(self.db_manager, self.roster_method, search_query, self.generation, self.batch_size)
+        worker.signals.rows.connect(self.append_rows)
+        worker.signals.finished.connect(self.on_search_finished)
+        worker.signals.failed.connect(self.on_search_failed)
+        self.search_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def append_rows(self, generation, batch):
+        """
+        Append a batch of rows streamed by a search worker, unless it belongs to a stale search.
+
+        :param generation: The generation of the search that produced the rows.
+        :type generation: int
+        :param batch: The rows to append.
+        :type batch: list[sqlite3.Row]
+        """
+        if generation != self.generation or not batch:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self.rows.extend(batch)
+        self.endInsertRows()
+
+    def on_search_finished(self, generation):
+        if generation == self.generation:
+            self.search_worker = None
+            self.search_finished.emit()
+
+    def on_search_failed(self, generation, message):
+        if generation == self.generation:
+            self.search_worker = None
+            self.search_failed.emit(message)
+
+    def row_id(self, row):
+        """
+        Get the database row ID of the record shown at the given row.
+
+        :param row: The row number in the model.
+        :type row: int
+        :return: The database row ID of the record.
+        :rtype: int
+        """
+        return self.rows[row]['id']
+
+    @classmethod
+    def headers(cls):
+        """
+        Get the column titles of the model.
+
+        :return: The column titles, in display order.
+        :rtype: list[str]
+        """
+        return [header for header, _, _ in cls.columns]
+
+    @classmethod
+    def csv_rows(cls, cursor):
+        """
+        Convert roster rows into the values shown in the model's columns, one row at a time.
+
+        :param cursor: The roster cursor to read from.
+        :type cursor: sqlite3.Cursor
+        :return: A generator of rows, each a list of column values.
+        :rtype: generator
+        """
+        for row in cursor:
+            yield [placeholder if row[key] is None else row[key] for _, key, placeholder in cls.columns]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        row = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            _, key, placeholder = self.columns[index.column()]
+            value = row[key]
+            return placeholder if value is None else str(value)
+        if role == Qt.UserRole:
+            return row['id']
+        return QVariant()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return QVariant()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self.cursor is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.cursor is None:
+            return
+        batch = self.cursor.fetchmany(self.batch_size)
+        if len(batch) < self.batch_size:
+            self.cursor.close()
+            self.cursor = None
+        self.append_rows(self.generation, batch)
+
+
+class StudentTableModel(RosterTableModel):
+    """
+    A table model listing students with their registered courses.
+    """
+    columns = [
+        ("Name", 'name', ''),
+        ("Age", 'age', ''),
+        ("Email", 'email', ''),
+        ("Student ID", 'student_id', ''),
+        ("Courses", 'courses', ''),
+    ]
+    roster_method = 'open_student_roster'
+    table = 'students'
+
+
+class InstructorTableModel(RosterTableModel):
+    """
+    A table model listing instructors with their assigned courses.
+    """
+    columns = [
+        ("Name", 'name', ''),
+        ("Age", 'age', ''),
+        ("Email", 'email', ''),
+        ("Instructor ID", 'instructor_id', ''),
+        ("Courses", 'courses', ''),
+    ]
+    roster_method = 'open_instructor_roster'
+    table = 'instructors'
+
+
+class CourseTableModel(RosterTableModel):
+    """
+    A table model listing courses with their instructor and enrolled students.
+    """
+    columns = [
+        ("Course Name", 'course_name', ''),
+        ("Course ID", 'course_id', ''),
+        ("Instructor", 'instructor_name', 'None'),
+        ("Students Enrolled", 'students', ''),
+    ]
+    roster_method = 'open_course_roster'
+    table = 'courses'
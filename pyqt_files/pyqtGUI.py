@@ -1,19 +1,25 @@
+import os
 import sys
-import csv
 import re
-import pickle
-import shutil
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from classes import Person, Student, Instructor, Course, validate_email, validate_numbers
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QTableView, QAbstractItemView,
     QMessageBox, QFileDialog, QComboBox, QHeaderView,
-    QAction, QStatusBar, QFormLayout
+    QAction, QStatusBar, QFormLayout, QProgressDialog, QProgressBar
 )
-from PyQt5.QtCore import Qt, QRegularExpression
+from PyQt5.QtCore import Qt, QRegularExpression, QTimer, QThreadPool, QEventLoop
 from PyQt5.QtGui import QIntValidator, QRegularExpressionValidator, QIcon
 from databases import DatabaseManager
+from models import StudentTableModel, InstructorTableModel, CourseTableModel
+from workers import ExportWorker, BackupWorker
+from snapshot import Snapshot, write_snapshot
+
+SEARCH_DEBOUNCE_MS = 300
 
 class SchoolManagementSystemApp(QMainWindow):
     """
@@ -43,10 +49,21 @@ class SchoolManagementSystemApp(QMainWindow):
 
         This method creates the menu bar and the main tabs (students, instructors, courses).
         Each tab is connected to a corresponding class that manages the specific entity (StudentTab, InstructorTab, CourseTab).
+        Only the tab that is shown loads its data; the others load theirs when they are first shown.
         """
         self.create_menu_bar()
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        self.backup_progress = QProgressBar()
+        self.backup_progress.setMaximumWidth(200)
+        self.backup_progress.hide()
+        self.status_bar.addPermanentWidget(self.backup_progress)
+        self.cancel_backup_button = QPushButton("Cancel Backup")
+        self.cancel_backup_button.clicked.connect(self.cancel_backup)
+        self.cancel_backup_button.hide()
+        self.status_bar.addPermanentWidget(self.cancel_backup_button)
+        self.backup_worker = None
+        self.export_worker = None
         self.tabs = QTabWidget()
         self.student_tab = StudentTab(self)
         self.instructor_tab = InstructorTab(self)
@@ -54,7 +71,42 @@ class SchoolManagementSystemApp(QMainWindow):
         self.tabs.addTab(self.student_tab, "Students")
         self.tabs.addTab(self.instructor_tab, "Instructors")
         self.tabs.addTab(self.course_tab, "Courses")
+        self.data_tabs = (self.student_tab, self.instructor_tab, self.course_tab)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         self.setCentralWidget(self.tabs)
+        self.refresh_current_tab()
+
+    def on_tab_changed(self, index):
+        """
+        Refresh the tab that has just been shown, if its data changed while it was hidden.
+
+        :param index: The index of the tab shown.
+        :type index: int
+        """
+        self.refresh_current_tab()
+
+    def refresh_current_tab(self):
+        """
+        Refresh the tab that is shown, if it is dirty.
+        """
+        tab = self.tabs.currentWidget()
+        if tab is not None:
+            tab.refresh_if_dirty()
+
+    def data_changed(self, source=None):
+        """
+        Mark every tab except `source` dirty, then refresh the tab that is shown if it is one of them.
+
+        Hidden tabs are not refreshed until they are shown, so a change costs one refresh however many
+        tabs show the data it affects.
+
+        :param source: The tab that made the change and has already refreshed itself, if any.
+        :type source: DataTab or None
+        """
+        for tab in self.data_tabs:
+            if tab is not source:
+                tab.dirty = True
+        self.refresh_current_tab()
 
     def create_menu_bar(self):
         """
@@ -99,77 +151,139 @@ class SchoolManagementSystemApp(QMainWindow):
         Backup the SQLite database to a file selected by the user.
 
         Opens a file dialog to allow the user to choose the backup location. The database is copied to the
-        selected location. Displays a message indicating success or failure.
+        selected location in the background, with its progress shown in the status bar, so the application
+        stays usable during the backup. Displays a message indicating success or failure.
         """
+        if self.backup_worker is not None:
+            QMessageBox.warning(self, "Backup", "A backup is already in progress.")
+            return
         backup_file_path, _ = QFileDialog.getSaveFileName(self, "Backup Database", "", "SQLite Database Files (*.db)")
         if backup_file_path:
-            try:
-                self.db_manager.backup_database(backup_file_path)
-                self.status_bar.showMessage(f"Database backed up to {backup_file_path}", 5000)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to backup database: {str(e)}")
+            if os.path.abspath(backup_file_path) == os.path.abspath(self.db_manager.db_name):
+                QMessageBox.critical(self, "Error", "Failed to backup database: the backup cannot replace the database itself.")
+                return
+            worker = BackupWorker(self.db_manager, backup_file_path)
+            worker.signals.progress.connect(self.on_backup_progress)
+            worker.signals.finished.connect(
+                lambda completed: self.on_backup_finished(completed, backup_file_path)
+            )
+            worker.signals.failed.connect(self.on_backup_failed)
+            self.backup_worker = worker
+            self.backup_progress.setRange(0, 0)
+            self.backup_progress.show()
+            self.cancel_backup_button.show()
+            self.status_bar.showMessage("Backing up database...")
+            QThreadPool.globalInstance().start(worker)
+
+    def cancel_backup(self):
+        """
+        Cancel the backup in progress, if any.
+        """
+        if self.backup_worker is not None:
+            self.backup_worker.cancel()
+
+    def on_backup_progress(self, copied, total):
+        self.backup_progress.setRange(0, total)
+        self.backup_progress.setValue(copied)
+
+    def on_backup_finished(self, completed, backup_file_path):
+        self.end_backup()
+        if completed:
+            self.status_bar.showMessage(f"Database backed up to {backup_file_path}", 5000)
+        else:
+            self.status_bar.showMessage("Backup cancelled.", 5000)
+
+    def on_backup_failed(self, message):
+        self.end_backup()
+        self.status_bar.clearMessage()
+        QMessageBox.critical(self, "Error", f"Failed to backup database: {message}")
+
+    def end_backup(self):
+        """
+        Hide the backup progress widgets once a backup has stopped.
+        """
+        self.backup_worker = None
+        self.backup_progress.hide()
+        self.cancel_backup_button.hide()
 
     def restore_database(self):
         """
         Restore the SQLite database from a backup file selected by the user.
 
-        Opens a file dialog for the user to select a backup file. The current database is overwritten with
-        the selected file. After restoring, the student, instructor, and course tables are updated. Displays
-        a message indicating success or failure.
+        Opens a file dialog for the user to select a backup file. The backup is checked and then copied into the
+        open database connection page by page, with its progress shown in the status bar. The tables are emptied
+        during the restore and reloaded afterwards, fetching rows only as they are viewed. Displays a message
+        indicating success or failure.
         """
+        if self.backup_worker is not None:
+            QMessageBox.warning(self, "Restore", "Wait for the backup in progress to finish before restoring.")
+            return
         backup_file_path, _ = QFileDialog.getOpenFileName(self, "Restore Database", "", "SQLite Database Files (*.db)")
         if backup_file_path:
+            confirm = QMessageBox.question(self, "Confirm Restore", "Restoring will overwrite the current database")
+            if confirm != QMessageBox.Yes:
+                return
+            for tab in self.data_tabs:
+                tab.model.reset()
+            self.backup_progress.setRange(0, 0)
+            self.backup_progress.show()
+            self.status_bar.showMessage("Restoring database...")
+
+            def progress(copied, total):
+                self.backup_progress.setRange(0, total)
+                self.backup_progress.setValue(copied)
+                QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+
             try:
-                confirm = QMessageBox.question(self, "Confirm Restore", "Restoring will overwrite the current database")
-                if confirm == QMessageBox.Yes:
-                    self.db_manager.close()
-                    shutil.copy(backup_file_path, self.db_manager.db_name)
-                    self.db_manager = DatabaseManager()
-                    self.student_tab.update_table()
-                    self.instructor_tab.update_table()
-                    self.course_tab.update_table()
-                    self.status_bar.showMessage(f"Database restored from {backup_file_path}", 5000)
+                self.db_manager.restore_database(backup_file_path, progress=progress)
+                self.status_bar.showMessage(f"Database restored from {backup_file_path}", 5000)
             except Exception as e:
+                self.status_bar.clearMessage()
                 QMessageBox.critical(self, "Error", f"Failed to restore database: {str(e)}")
+            finally:
+                self.backup_progress.hide()
+                self.data_changed()
 
     def save_data(self):
         """
-        Save the current data (students, instructors, courses) to a pickle file.
+        Save the current data (students, instructors, courses, enrollments, and assignments) to a snapshot file.
 
-        Opens a file dialog for the user to select a location. The data is serialized and saved using
-        the pickle module. Displays a message indicating success or failure.
+        Opens a file dialog for the user to select a location. The tables are streamed into a compact binary
+        snapshot column by column. Displays a message indicating success or failure.
         """
-        filename, _ = QFileDialog.getSaveFileName(self, "Save Data", "", "Pickle Files (*.pkl)")
+        filename, _ = QFileDialog.getSaveFileName(self, "Save Data", "", "Snapshot Files (*.snap)")
         if filename:
             try:
-                data = self.export_data()
-                with open(filename, 'wb') as f:
-                    pickle.dump(data, f)
+                write_snapshot(self.db_manager, filename)
                 QMessageBox.information(self, "Success", "Data saved successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save data: {str(e)}")
 
     def load_data(self):
         """
-        Load data from a pickle file and overwrite the current data.
+        Load data from a snapshot file and overwrite the current data.
 
-        Opens a file dialog for the user to select a pickle file. The current data is overwritten by
-        deserializing the data from the selected file. The tables for students, instructors, and courses are updated.
+        Opens a file dialog for the user to select a snapshot file. The current data is overwritten by the rows
+        read from the selected file. The tables for students, instructors, and courses are updated.
         Displays a message indicating success or failure.
         """
-        filename, _ = QFileDialog.getOpenFileName(self, "Load Data", "", "Pickle Files (*.pkl)")
+        filename, _ = QFileDialog.getOpenFileName(self, "Load Data", "", "Snapshot Files (*.snap)")
         if filename:
             try:
                 confirm = QMessageBox.question(self, "Confirm Load", "Loading data will overwrite existing data")
                 if confirm != QMessageBox.Yes:
                     return
-                with open(filename, 'rb') as f:
-                    data = pickle.load(f)
-                self.import_data(data)
-                self.student_tab.update_table()
-                self.instructor_tab.update_table()
-                self.course_tab.update_table()
-                QMessageBox.information(self, "Success", "Data loaded successfully.")
+                for tab in self.data_tabs:
+                    tab.model.reset()
+                try:
+                    with Snapshot(filename) as snapshot:
+                        removed = self.import_data(snapshot)
+                finally:
+                    self.data_changed()
+                message = "Data loaded successfully."
+                if removed:
+                    message += f"\n{removed} enrollments or assignments referring to missing records were skipped."
+                QMessageBox.information(self, "Success", message)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load data: {str(e)}")
 
@@ -178,55 +292,53 @@ class SchoolManagementSystemApp(QMainWindow):
         Export all students, instructors, and courses data to CSV files.
 
         Opens a file dialog for the user to select a directory. CSV files are generated for students, instructors,
-        and courses, including their associated courses or students where applicable. Displays a message indicating
-        success or failure.
+        and courses, including their associated courses or students where applicable. The export runs in the
+        background with a progress dialog that lets the user cancel it.
         """
         directory = QFileDialog.getExistingDirectory(self, "Select Directory to Save CSV Files")
         if directory:
-            try:
-                student_filename = f"{directory}/students.csv"
-                students = self.db_manager.get_all_students()
-                with open(student_filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(["Name", "Age", "Email", "Student ID", "Courses"])
-                    for student in students:
-                        courses = self.db_manager.get_courses_of_student(student['id'])
-                        course_names = ', '.join([course['course_name'] for course in courses])
-                        writer.writerow([student['name'], student['age'], student['email'], student['student_id'], course_names])
-
-                instructor_filename = f"{directory}/instructors.csv"
-                instructors = self.db_manager.get_all_instructors()
-                with open(instructor_filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(["Name", "Age", "Email", "Instructor ID", "Courses"])
-                    for instructor in instructors:
-                        courses = self.db_manager.get_courses_of_instructor(instructor['id'])
-                        course_names = ', '.join([course['course_name'] for course in courses])
-                        writer.writerow([instructor['name'], instructor['age'], instructor['email'], instructor['instructor_id'], course_names])
-
-                course_filename = f"{directory}/courses.csv"
-                courses = self.db_manager.get_all_courses()
-                with open(course_filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(["Course Name", "Course ID", "Instructor", "Students Enrolled"])
-                    for course in courses:
-                        instructor = self.db_manager.cursor.execute('''
-                            SELECT instructors.name FROM instructors
-                            INNER JOIN assignments ON instructors.id = assignments.instructor_id
-                            WHERE assignments.course_id = ?
-                        ''', (course['id'],)).fetchone()
-                        instructor_name = instructor['name'] if instructor else 'None'
-                        students = self.db_manager.cursor.execute('''
-                            SELECT students.name FROM students
-                            INNER JOIN enrollments ON students.id = enrollments.student_id
-                            WHERE enrollments.course_id = ?
-                        ''', (course['id'],)).fetchall()
-                        student_names = ', '.join([student['name'] for student in students])
-                        writer.writerow([course['course_name'], course['course_id'], instructor_name, student_names])
-
-                QMessageBox.information(self, "Success", f"Data exported to CSV files in {directory}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export data: {str(e)}")
+            self.start_export([
+                (f"{directory}/students.csv", StudentTableModel),
+                (f"{directory}/instructors.csv", InstructorTableModel),
+                (f"{directory}/courses.csv", CourseTableModel),
+            ], f"Data exported to CSV files in {directory}")
+
+    def start_export(self, exports, success_message):
+        """
+        Stream rosters into CSV files on a background worker, showing a cancellable progress dialog.
+
+        :param exports: Pairs of a CSV file name and the table model whose columns are written to it.
+        :type exports: list[tuple[str, type]]
+        :param success_message: The message shown once every file has been written.
+        :type success_message: str
+        """
+        worker = ExportWorker(self.db_manager, exports)
+        dialog = QProgressDialog("Exporting to CSV...", "Cancel", 0, 0, self)
+        dialog.setWindowTitle("Export")
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(0)
+        dialog.canceled.connect(worker.cancel)
+
+        def on_progress(written, total):
+            dialog.setMaximum(total)
+            dialog.setValue(written)
+
+        def on_finished(completed):
+            dialog.reset()
+            if completed:
+                QMessageBox.information(self, "Success", success_message)
+            else:
+                self.status_bar.showMessage("Export cancelled.", 5000)
+
+        def on_failed(message):
+            dialog.reset()
+            QMessageBox.critical(self, "Error", f"Failed to export data: {message}")
+
+        worker.signals.progress.connect(on_progress)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(on_failed)
+        self.export_worker = worker
+        QThreadPool.globalInstance().start(worker)
 
     def show_about(self):
         QMessageBox.information(self, "About", "School Management System\nVersion 1.0")
@@ -235,89 +347,54 @@ class SchoolManagementSystemApp(QMainWindow):
         """
         Handle the window close event.
 
-        This method ensures that the database connection is properly closed when the application window is closed.
+        This method cancels any backup or export still running in the background, waits for it to stop,
+        and then ensures that the database connection is properly closed.
         
         :param event: The close event triggered when the user closes the application.
         :type event: QCloseEvent
         """
+        for worker in (self.backup_worker, self.export_worker):
+            if worker is not None:
+                worker.cancel()
+        QThreadPool.globalInstance().waitForDone()
         self.db_manager.close()
         event.accept()
 
-    def export_data(self):
+    def import_data(self, snapshot):
         """
-        Export all data (students, instructors, courses, enrollments, and assignments) from the database.
+        Import data into the database.
 
-        This method fetches all the records from the students, instructors, courses, enrollments, and assignments tables 
-        and returns them in a dictionary format.
+        This method takes a snapshot containing students, instructors, courses, enrollments, and assignments
+        and replaces the contents of the corresponding tables with its rows, using `DatabaseManager.import_snapshot`.
+        The rows are bulk loaded into staging tables and swapped in at once, so a failed import changes nothing.
 
-        :return: A dictionary containing the data for students, instructors, courses, enrollments, and assignments.
-        :rtype: dict
+        :param snapshot: The snapshot to import.
+        :type snapshot: Snapshot
+        :return: The number of enrollments and assignments skipped because they referred to missing records.
+        :rtype: int
+        :raises Exception: If an error occurs during the import process.
         """
-        students = self.db_manager.get_all_students()
-        instructors = self.db_manager.get_all_instructors()
-        courses = self.db_manager.get_all_courses()
-        enrollments = self.db_manager.cursor.execute('SELECT * FROM enrollments').fetchall()
-        assignments = self.db_manager.cursor.execute('SELECT * FROM assignments').fetchall()
+        return self.db_manager.import_snapshot(snapshot)
 
-        data = {
-            'students': [dict(student) for student in students],
-            'instructors': [dict(instructor) for instructor in instructors],
-            'courses': [dict(course) for course in courses],
-            'enrollments': [dict(enrollment) for enrollment in enrollments],
-            'assignments': [dict(assignment) for assignment in assignments]
-        }
-        return data
-
-    def import_data(self, data):
-        """
-        Import data into the database.
+class DataTab(QWidget):
+    """
+    A tab showing a table of records, which is only refreshed while it is shown.
 
-        This method takes in a dictionary containing the exported data (students, instructors, courses, enrollments, and assignments) 
-        and inserts it into the corresponding tables in the database. All existing records are deleted before the new data is inserted.
+    A tab starts dirty, so it loads its data the first time it is shown. Changes made while it is hidden
+    only mark it dirty again, through `SchoolManagementSystemApp.data_changed`, and it reloads once when it
+    is next shown. Subclasses implement `update_table`.
+    """
+    dirty = True
 
-        :param data: The data to import, containing students, instructors, courses, enrollments, and assignments.
-        :type data: dict
-        :raises Exception: If an error occurs during the import process.
+    def refresh_if_dirty(self):
         """
-        self.db_manager.connection.execute('BEGIN TRANSACTION')
-        try:
-            self.db_manager.cursor.execute('DELETE FROM enrollments')
-            self.db_manager.cursor.execute('DELETE FROM assignments')
-            self.db_manager.cursor.execute('DELETE FROM students')
-            self.db_manager.cursor.execute('DELETE FROM instructors')
-            self.db_manager.cursor.execute('DELETE FROM courses')
-
-            for course in data['courses']:
-                self.db_manager.cursor.execute('''
-                    INSERT INTO courses (id, course_name, course_id) VALUES (?, ?, ?)
-                ''', (course['id'], course['course_name'], course['course_id']))
-
-            for student in data['students']:
-                self.db_manager.cursor.execute('''
-                    INSERT INTO students (id, name, age, email, student_id) VALUES (?, ?, ?, ?, ?)
-                ''', (student['id'], student['name'], student['age'], student['email'], student['student_id']))
-
-            for instructor in data['instructors']:
-                self.db_manager.cursor.execute('''
-                    INSERT INTO instructors (id, name, age, email, instructor_id) VALUES (?, ?, ?, ?, ?)
-                ''', (instructor['id'], instructor['name'], instructor['age'], instructor['email'], instructor['instructor_id']))
-
-            for enrollment in data['enrollments']:
-                self.db_manager.cursor.execute('''
-                    INSERT INTO enrollments (student_id, course_id) VALUES (?, ?)
-                ''', (enrollment['student_id'], enrollment['course_id']))
-
-            for assignment in data['assignments']:
-                self.db_manager.cursor.execute('''
-                    INSERT INTO assignments (instructor_id, course_id) VALUES (?, ?)
-                ''', (assignment['instructor_id'], assignment['course_id']))
-
-            self.db_manager.connection.commit()
-        except Exception as e:
-            self.db_manager.connection.rollback()
-            raise e
+        Reload the table if the data changed since it was last loaded.
+        """
+        if self.dirty:
+            self.dirty = False
+            self.update_table()
 
-class StudentTab(QWidget):
+class StudentTab(DataTab):
     """
     A tab in the School Management System for managing students.
 
@@ -364,7 +441,6 @@ class StudentTab(QWidget):
         self.id_input.setValidator(QIntValidator(1, 999999))
 
         self.course_combo = QComboBox()
-        self.update_course_combo()
 
         form_layout.addRow(QLabel("Name:"), self.name_input)
         form_layout.addRow(QLabel("Age:"), self.age_input)
@@ -394,6 +470,11 @@ class StudentTab(QWidget):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by Name or ID")
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.search_student)
+        self.search_input.textChanged.connect(lambda text: self.search_timer.start())
         search_button = QPushButton("Search")
         search_button.clicked.connect(self.search_student)
         clear_search_button = QPushButton("Clear Search")
@@ -406,17 +487,16 @@ class StudentTab(QWidget):
 
         self.layout.addLayout(search_layout)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Name", "Age", "Email", "Student ID", "Courses"])
+        self.model = StudentTableModel(self.db_manager, self)
+        self.model.search_failed.connect(lambda message: self.app.status_bar.showMessage(f"Search failed: {message}", 5000))
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.cellClicked.connect(self.on_table_select)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.clicked.connect(self.on_table_select)
 
         self.layout.addWidget(self.table)
 
-        self.update_table()
-
     def update_course_combo(self):
         """
         Update the course combo box with the list of available courses.
@@ -447,16 +527,18 @@ class StudentTab(QWidget):
             validate_email(email)
             student_id = validate_numbers(student_id)
 
-            student_db_id = self.db_manager.add_student(name, age, email, student_id)
+            with self.db_manager.transaction():
+                student_db_id = self.db_manager.add_student(name, age, email, student_id)
 
-            if course_name:
-                course = self.db_manager.get_course_by_name(course_name)
-                if course:
-                    self.db_manager.enroll_student_in_course(student_db_id, course['id'])
+                if course_name:
+                    course = self.db_manager.get_course_by_name(course_name)
+                    if course:
+                        self.db_manager.enroll_student_in_course(student_db_id, course['id'])
 
             self.app.status_bar.showMessage("Student added successfully.", 5000)
             self.clear_inputs()
             self.update_table()
+            self.app.data_changed(self)
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
@@ -480,16 +562,18 @@ class StudentTab(QWidget):
             validate_email(email)
             student_id = validate_numbers(student_id)
 
-            self.db_manager.update_student(self.selected_student_db_id, name, age, email, student_id)
+            with self.db_manager.transaction():
+                self.db_manager.update_student(self.selected_student_db_id, name, age, email, student_id)
 
-            if course_name:
-                course = self.db_manager.get_course_by_name(course_name)
-                if course:
-                    self.db_manager.enroll_student_in_course(self.selected_student_db_id, course['id'])
+                if course_name:
+                    course = self.db_manager.get_course_by_name(course_name)
+                    if course:
+                        self.db_manager.enroll_student_in_course(self.selected_student_db_id, course['id'])
 
             self.app.status_bar.showMessage("Student updated successfully.", 5000)
             self.clear_inputs()
             self.update_table()
+            self.app.data_changed(self)
             del self.selected_student_db_id
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -510,24 +594,22 @@ class StudentTab(QWidget):
                 self.app.status_bar.showMessage("Student deleted successfully.", 5000)
                 self.clear_inputs()
                 self.update_table()
+                self.app.data_changed(self)
                 del self.selected_student_db_id
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
 
-    def on_table_select(self, row, column):
+    def on_table_select(self, index):
         """
         Handle the event when a student is selected from the table.
 
         This method populates the input fields with the selected student's data, allowing the user to edit or delete
         the student's details.
 
-        :param row: The row number of the selected student in the table.
-        :type row: int
-        :param column: The column number of the selected cell in the table.
-        :type column: int
+        :param index: The model index of the clicked cell in the table.
+        :type index: QModelIndex
         """
-        item = self.table.item(row, 0)
-        self.selected_student_db_id = item.data(Qt.UserRole)
+        self.selected_student_db_id = self.model.row_id(index.row())
         student = self.db_manager.cursor.execute('SELECT * FROM students WHERE id = ?', (self.selected_student_db_id,)).fetchone()
         self.name_input.setText(student['name'])
         self.age_input.setText(str(student['age']))
@@ -551,69 +633,36 @@ class StudentTab(QWidget):
         """
         Update the student table with the latest data from the database.
 
-        This method clears the current table and fetches all students from the database, populating the table with their details.
-        """
-        self.table.setRowCount(0)
-        students = self.db_manager.get_all_students()
-        for student in students:
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            item = QTableWidgetItem(student['name'])
-            item.setData(Qt.UserRole, student['id'])
-            self.table.setItem(row_position, 0, item)
-            self.table.setItem(row_position, 1, QTableWidgetItem(str(student['age'])))
-            self.table.setItem(row_position, 2, QTableWidgetItem(student['email']))
-            self.table.setItem(row_position, 3, QTableWidgetItem(str(student['student_id'])))
-            courses = self.db_manager.get_courses_of_student(student['id'])
-            course_names = ', '.join([course['course_name'] for course in courses])
-            self.table.setItem(row_position, 4, QTableWidgetItem(course_names))
+        This method reloads the table model, which reads all students together with their course names
+        from a single query and fetches rows lazily as the table is scrolled.
+        """
+        self.model.load()
         self.update_course_combo()
 
     def search_student(self):
         """
         Search for students by name or student ID.
 
-        This method fetches the students matching the search query and updates the table with the results.
+        This method runs while the user types, once the search box has been idle for `SEARCH_DEBOUNCE_MS`.
+        The query runs on a background thread, and matching students are added to the table as they arrive.
+        A search still in progress is cancelled when a new one starts.
         """
+        self.search_timer.stop()
         query_text = self.search_input.text().lower()
-        self.table.setRowCount(0)
-        students = self.db_manager.search_students(query_text)
-        for student in students:
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            item = QTableWidgetItem(student['name'])
-            item.setData(Qt.UserRole, student['id'])
-            self.table.setItem(row_position, 0, item)
-            self.table.setItem(row_position, 1, QTableWidgetItem(str(student['age'])))
-            self.table.setItem(row_position, 2, QTableWidgetItem(student['email']))
-            self.table.setItem(row_position, 3, QTableWidgetItem(str(student['student_id'])))
-            courses = self.db_manager.get_courses_of_student(student['id'])
-            course_names = ', '.join([course['course_name'] for course in courses])
-            self.table.setItem(row_position, 4, QTableWidgetItem(course_names))
+        self.model.search(query_text)
 
     def export_to_csv(self):
         """
         Export the student data to a CSV file.
 
         This method allows the user to save all student data
-        to a CSV file. Displays a success or error message based on the outcome.
+        to a CSV file. The export runs in the background with a cancellable progress dialog.
         """
         filename, _ = QFileDialog.getSaveFileName(self, "Export Students to CSV", "", "CSV Files (*.csv)")
         if filename:
-            try:
-                students = self.db_manager.get_all_students()
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(["Name", "Age", "Email", "Student ID", "Courses"])
-                    for student in students:
-                        courses = self.db_manager.get_courses_of_student(student['id'])
-                        course_names = ', '.join([course['course_name'] for course in courses])
-                        writer.writerow([student['name'], student['age'], student['email'], student['student_id'], course_names])
-                QMessageBox.information(self, "Success", f"Students exported to {filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export students: {str(e)}")
+            self.app.start_export([(filename, StudentTableModel)], f"Students exported to {filename}")
 
-class InstructorTab(QWidget):
+class InstructorTab(DataTab):
     """
     A tab in the School Management System for managing instructors.
 
@@ -660,7 +709,6 @@ class InstructorTab(QWidget):
         self.id_input.setValidator(QIntValidator(1, 999999))
 
         self.course_combo = QComboBox()
-        self.update_course_combo()
 
         form_layout.addRow(QLabel("Name:"), self.name_input)
         form_layout.addRow(QLabel("Age:"), self.age_input)
@@ -690,6 +738,11 @@ class InstructorTab(QWidget):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by Name or ID")
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.search_instructor)
+        self.search_input.textChanged.connect(lambda text: self.search_timer.start())
         search_button = QPushButton("Search")
         search_button.clicked.connect(self.search_instructor)
         clear_search_button = QPushButton("Clear Search")
@@ -702,17 +755,16 @@ class InstructorTab(QWidget):
 
         self.layout.addLayout(search_layout)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Name", "Age", "Email", "Instructor ID", "Courses"])
+        self.model = InstructorTableModel(self.db_manager, self)
+        self.model.search_failed.connect(lambda message: self.app.status_bar.showMessage(f"Search failed: {message}", 5000))
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.cellClicked.connect(self.on_table_select)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.clicked.connect(self.on_table_select)
 
         self.layout.addWidget(self.table)
 
-        self.update_table()
-
     def update_course_combo(self):
         """
         Update the course combo box with the list of available courses.
@@ -743,16 +795,18 @@ class InstructorTab(QWidget):
             validate_email(email)
             instructor_id = validate_numbers(instructor_id)
 
-            instructor_db_id = self.db_manager.add_instructor(name, age, email, instructor_id)
+            with self.db_manager.transaction():
+                instructor_db_id = self.db_manager.add_instructor(name, age, email, instructor_id)
 
-            if course_name:
-                course = self.db_manager.get_course_by_name(course_name)
-                if course:
-                    self.db_manager.assign_instructor_to_course(instructor_db_id, course['id'])
+                if course_name:
+                    course = self.db_manager.get_course_by_name(course_name)
+                    if course:
+                        self.db_manager.assign_instructor_to_course(instructor_db_id, course['id'])
 
             self.app.status_bar.showMessage("Instructor added successfully.", 5000)
             self.clear_inputs()
             self.update_table()
+            self.app.data_changed(self)
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
@@ -776,16 +830,18 @@ class InstructorTab(QWidget):
             validate_email(email)
             instructor_id = validate_numbers(instructor_id)
 
-            self.db_manager.update_instructor(self.selected_instructor_db_id, name, age, email, instructor_id)
+            with self.db_manager.transaction():
+                self.db_manager.update_instructor(self.selected_instructor_db_id, name, age, email, instructor_id)
 
-            if course_name:
-                course = self.db_manager.get_course_by_name(course_name)
-                if course:
-                    self.db_manager.assign_instructor_to_course(self.selected_instructor_db_id, course['id'])
+                if course_name:
+                    course = self.db_manager.get_course_by_name(course_name)
+                    if course:
+                        self.db_manager.assign_instructor_to_course(self.selected_instructor_db_id, course['id'])
 
             self.app.status_bar.showMessage("Instructor updated successfully.", 5000)
             self.clear_inputs()
             self.update_table()
+            self.app.data_changed(self)
             del self.selected_instructor_db_id
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -806,24 +862,22 @@ class InstructorTab(QWidget):
                 self.app.status_bar.showMessage("Instructor deleted successfully.", 5000)
                 self.clear_inputs()
                 self.update_table()
+                self.app.data_changed(self)
                 del self.selected_instructor_db_id
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
 
-    def on_table_select(self, row, column):
+    def on_table_select(self, index):
         """
         Handle the event when an instructor is selected from the table.
 
         This method populates the input fields with the selected instructor's data, allowing the user to edit or delete
         the instructor's details.
 
-        :param row: The row number of the selected instructor in the table.
-        :type row: int
-        :param column: The column number of the selected cell in the table.
-        :type column: int
+        :param index: The model index of the clicked cell in the table.
+        :type index: QModelIndex
         """
-        item = self.table.item(row, 0)
-        self.selected_instructor_db_id = item.data(Qt.UserRole)
+        self.selected_instructor_db_id = self.model.row_id(index.row())
         instructor = self.db_manager.cursor.execute('SELECT * FROM instructors WHERE id = ?', (self.selected_instructor_db_id,)).fetchone()
         self.name_input.setText(instructor['name'])
         self.age_input.setText(str(instructor['age']))
@@ -847,70 +901,37 @@ class InstructorTab(QWidget):
         """
         Update the instructor table with the latest data from the database.
 
-        This method clears the current table and fetches all instructors from the database, populating the table with their details.
-        """
-        self.table.setRowCount(0)
-        instructors = self.db_manager.get_all_instructors()
-        for instructor in instructors:
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            item = QTableWidgetItem(instructor['name'])
-            item.setData(Qt.UserRole, instructor['id'])
-            self.table.setItem(row_position, 0, item)
-            self.table.setItem(row_position, 1, QTableWidgetItem(str(instructor['age'])))
-            self.table.setItem(row_position, 2, QTableWidgetItem(instructor['email']))
-            self.table.setItem(row_position, 3, QTableWidgetItem(str(instructor['instructor_id'])))
-            courses = self.db_manager.get_courses_of_instructor(instructor['id'])
-            course_names = ', '.join([course['course_name'] for course in courses])
-            self.table.setItem(row_position, 4, QTableWidgetItem(course_names))
+        This method reloads the table model, which reads all instructors together with their course names
+        from a single query and fetches rows lazily as the table is scrolled.
+        """
+        self.model.load()
         self.update_course_combo()
 
     def search_instructor(self):
         """
         Search for instructors by name or instructor ID.
 
-        This method fetches the instructors matching the search query and updates the table with the results.
+        This method runs while the user types, once the search box has been idle for `SEARCH_DEBOUNCE_MS`.
+        The query runs on a background thread, and matching instructors are added to the table as they arrive.
+        A search still in progress is cancelled when a new one starts.
         """
+        self.search_timer.stop()
         query_text = self.search_input.text().lower()
-        self.table.setRowCount(0)
-        instructors = self.db_manager.search_instructors(query_text)
-        for instructor in instructors:
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            item = QTableWidgetItem(instructor['name'])
-            item.setData(Qt.UserRole, instructor['id'])
-            self.table.setItem(row_position, 0, item)
-            self.table.setItem(row_position, 1, QTableWidgetItem(str(instructor['age'])))
-            self.table.setItem(row_position, 2, QTableWidgetItem(instructor['email']))
-            self.table.setItem(row_position, 3, QTableWidgetItem(str(instructor['instructor_id'])))
-            courses = self.db_manager.get_courses_of_instructor(instructor['id'])
-            course_names = ', '.join([course['course_name'] for course in courses])
-            self.table.setItem(row_position, 4, QTableWidgetItem(course_names))
+        self.model.search(query_text)
 
     def export_to_csv(self):
         """
         Export the instructor data to a CSV file.
 
         This method allows the user to save all instructor data
-        to a CSV file. Displays a success or error message based on the outcome.
+        to a CSV file. The export runs in the background with a cancellable progress dialog.
         """
         filename, _ = QFileDialog.getSaveFileName(self, "Export Instructors to CSV", "", "CSV Files (*.csv)")
         if filename:
-            try:
-                instructors = self.db_manager.get_all_instructors()
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(["Name", "Age", "Email", "Instructor ID", "Courses"])
-                    for instructor in instructors:
-                        courses = self.db_manager.get_courses_of_instructor(instructor['id'])
-                        course_names = ', '.join([course['course_name'] for course in courses])
-                        writer.writerow([instructor['name'], instructor['age'], instructor['email'], instructor['instructor_id'], course_names])
-                QMessageBox.information(self, "Success", f"Instructors exported to {filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export instructors: {str(e)}")
+            self.app.start_export([(filename, InstructorTableModel)], f"Instructors exported to {filename}")
 
 
-class CourseTab(QWidget):
+class CourseTab(DataTab):
     """
     A tab in the School Management System for managing courses.
 
@@ -975,6 +996,11 @@ class CourseTab(QWidget):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by Name or ID")
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.search_course)
+        self.search_input.textChanged.connect(lambda text: self.search_timer.start())
         search_button = QPushButton("Search")
         search_button.clicked.connect(self.search_course)
         clear_search_button = QPushButton("Clear Search")
@@ -987,17 +1013,16 @@ class CourseTab(QWidget):
 
         self.layout.addLayout(search_layout)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Course Name", "Course ID", "Instructor", "Students Enrolled"])
+        self.model = CourseTableModel(self.db_manager, self)
+        self.model.search_failed.connect(lambda message: self.app.status_bar.showMessage(f"Search failed: {message}", 5000))
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.cellClicked.connect(self.on_table_select)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.clicked.connect(self.on_table_select)
 
         self.layout.addWidget(self.table)
 
-        self.update_table()
-
     def add_course(self):
         """
         Add a new course to the database.
@@ -1013,8 +1038,7 @@ class CourseTab(QWidget):
             self.app.status_bar.showMessage("Course added successfully.", 5000)
             self.clear_inputs()
             self.update_table()
-            self.app.student_tab.update_course_combo()
-            self.app.instructor_tab.update_course_combo()
+            self.app.data_changed(self)
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
@@ -1036,8 +1060,7 @@ class CourseTab(QWidget):
             self.app.status_bar.showMessage("Course updated successfully.", 5000)
             self.clear_inputs()
             self.update_table()
-            self.app.student_tab.update_course_combo()
-            self.app.instructor_tab.update_course_combo()
+            self.app.data_changed(self)
             del self.selected_course_db_id
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -1058,26 +1081,22 @@ class CourseTab(QWidget):
                 self.app.status_bar.showMessage("Course deleted successfully.", 5000)
                 self.clear_inputs()
                 self.update_table()
-                self.app.student_tab.update_course_combo()
-                self.app.instructor_tab.update_course_combo()
+                self.app.data_changed(self)
                 del self.selected_course_db_id
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
 
-    def on_table_select(self, row, column):
+    def on_table_select(self, index):
         """
         Handle the event when a course is selected from the table.
 
         This method populates the input fields with the selected course's data, allowing the user to edit or delete
         the course's details.
 
-        :param row: The row number of the selected course in the table.
-        :type row: int
-        :param column: The column number of the selected cell in the table.
-        :type column: int
+        :param index: The model index of the clicked cell in the table.
+        :type index: QModelIndex
         """
-        item = self.table.item(row, 0)
-        self.selected_course_db_id = item.data(Qt.UserRole)
+        self.selected_course_db_id = self.model.row_id(index.row())
         course = self.db_manager.cursor.execute('SELECT * FROM courses WHERE id = ?', (self.selected_course_db_id,)).fetchone()
         self.course_name_input.setText(course['course_name'])
         self.course_id_input.setText(str(course['course_id']))
@@ -1095,94 +1114,33 @@ class CourseTab(QWidget):
         """
         Update the course table with the latest data from the database.
 
-        This method clears the current table and fetches all courses from the database, populating the table with their details.
+        This method reloads the table model, which reads all courses together with their instructor and
+        enrolled students from a single query and fetches rows lazily as the table is scrolled.
         """
-        self.table.setRowCount(0)
-        courses = self.db_manager.get_all_courses()
-        for course in courses:
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            item = QTableWidgetItem(course['course_name'])
-            item.setData(Qt.UserRole, course['id'])
-            self.table.setItem(row_position, 0, item)
-            self.table.setItem(row_position, 1, QTableWidgetItem(str(course['course_id'])))
-            instructor = self.db_manager.cursor.execute('''
-                SELECT instructors.name FROM instructors
-                INNER JOIN assignments ON instructors.id = assignments.instructor_id
-                WHERE assignments.course_id = ?
-            ''', (course['id'],)).fetchone()
-            instructor_name = instructor['name'] if instructor else 'None'
-            self.table.setItem(row_position, 2, QTableWidgetItem(instructor_name))
-            students = self.db_manager.cursor.execute('''
-                SELECT students.name FROM students
-                INNER JOIN enrollments ON students.id = enrollments.student_id
-                WHERE enrollments.course_id = ?
-            ''', (course['id'],)).fetchall()
-            student_names = ', '.join([student['name'] for student in students])
-            self.table.setItem(row_position, 3, QTableWidgetItem(student_names))
+        self.model.load()
 
     def search_course(self):
         """
         Search for courses by name or course ID.
 
-        This method fetches the courses matching the search query and updates the table with the results.
+        This method runs while the user types, once the search box has been idle for `SEARCH_DEBOUNCE_MS`.
+        The query runs on a background thread, and matching courses are added to the table as they arrive.
+        A search still in progress is cancelled when a new one starts.
         """
+        self.search_timer.stop()
         query_text = self.search_input.text().lower()
-        self.table.setRowCount(0)
-        courses = self.db_manager.search_courses(query_text)
-        for course in courses:
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            item = QTableWidgetItem(course['course_name'])
-            item.setData(Qt.UserRole, course['id'])
-            self.table.setItem(row_position, 0, item)
-            self.table.setItem(row_position, 1, QTableWidgetItem(str(course['course_id'])))
-            instructor = self.db_manager.cursor.execute('''
-                SELECT instructors.name FROM instructors
-                INNER JOIN assignments ON instructors.id = assignments.instructor_id
-                WHERE assignments.course_id = ?
-            ''', (course['id'],)).fetchone()
-            instructor_name = instructor['name'] if instructor else 'None'
-            self.table.setItem(row_position, 2, QTableWidgetItem(instructor_name))
-            students = self.db_manager.cursor.execute('''
-                SELECT students.name FROM students
-                INNER JOIN enrollments ON students.id = enrollments.student_id
-                WHERE enrollments.course_id = ?
-            ''', (course['id'],)).fetchall()
-            student_names = ', '.join([student['name'] for student in students])
-            self.table.setItem(row_position, 3, QTableWidgetItem(student_names))
+        self.model.search(query_text)
 
     def export_to_csv(self):
         """
         Export the course data to a CSV file.
 
         This method allows the user to save all course data
-        to a CSV file. Displays a success or error message based on the outcome.
+        to a CSV file. The export runs in the background with a cancellable progress dialog.
         """
         filename, _ = QFileDialog.getSaveFileName(self, "Export Courses to CSV", "", "CSV Files (*.csv)")
         if filename:
-            try:
-                courses = self.db_manager.get_all_courses()
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(["Course Name", "Course ID", "Instructor", "Students Enrolled"])
-                    for course in courses:
-                        instructor = self.db_manager.cursor.execute('''
-                            SELECT instructors.name FROM instructors
-                            INNER JOIN assignments ON instructors.id = assignments.instructor_id
-                            WHERE assignments.course_id = ?
-                        ''', (course['id'],)).fetchone()
-                        instructor_name = instructor['name'] if instructor else 'None'
-                        students = self.db_manager.cursor.execute('''
-                            SELECT students.name FROM students
-                            INNER JOIN enrollments ON students.id = enrollments.student_id
-                            WHERE enrollments.course_id = ?
-                        ''', (course['id'],)).fetchall()
-                        student_names = ', '.join([student['name'] for student in students])
-                        writer.writerow([course['course_name'], course['course_id'], instructor_name, student_names])
-                QMessageBox.information(self, "Success", f"Courses exported to {filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export courses: {str(e)}")
+            self.app.start_export([(filename, CourseTableModel)], f"Courses exported to {filename}")
 
 def main():
     app = QApplication(sys.argv)
@@ -0,0 +1,283 @@
+import json
+import mmap
+import struct
+from array import array
+
+"""
+A compact binary snapshot format for the school management database.
+
+A snapshot stores every table column by column. Integer columns are arrays of little-endian 64-bit
+integers, and text columns are a block of UTF-8 strings followed by an array of 64-bit end offsets
+into it. The file starts with a fixed header holding a magic string, the format version, and the
+position of a JSON directory at the end of the file that lists each table's row count and columns.
+
+`write_snapshot` streams the columns out of the database one chunk at a time. `Snapshot` maps a
+file into memory and reads values straight out of the mapping, so rows can be fed to `executemany`
+without first building the whole dataset as Python objects. Unlike pickle, reading a snapshot never
+runs code from the file.
+"""
+
+MAGIC = b'SMSSNAP\0'
+VERSION = 1
+HEADER = struct.Struct('<8sIQ')
+"""
+The snapshot header: the magic string, the format version, and the offset of the directory.
+"""
+
+SNAPSHOT_TABLES = ['courses', 'students', 'instructors', 'enrollments', 'assignments']
+"""
+The tables stored in a snapshot, in an order that can be inserted without breaking foreign keys.
+"""
+
+CHUNK_SIZE = 65536
+"""
+The number of values read from the database per chunk while writing a snapshot.
+"""
+
+
+def align(file):
+    """
+    Pad a file with zero bytes up to the next multiple of eight.
+
+    :param file: The file being written.
+    :type file: io.BufferedWriter
+    """
+    file.write(b'\0' * (-file.tell() % 8))
+
+
+def write_integer_column(file, cursor):
+    """
+    Write an integer column as an array of 64-bit integers.
+
+    :param file: The snapshot file being written.
+    :type file: io.BufferedWriter
+    :param cursor: A cursor over the column's values, one per row.
+    :type cursor: sqlite3.Cursor
+    :return: The column's entry for the snapshot directory.
+    :rtype: dict
+    """
+    align(file)
+    start = file.tell()
+    while True:
+        rows = cursor.fetchmany(CHUNK_SIZE)
+        if not rows:
+            break
+        array('q', [row[0] for row in rows]).tofile(file)
+    return {'type': 'integer', 'data': start}
+
+
+def write_text_column(file, cursor):
+    """
+    Write a text column as a block of UTF-8 strings followed by their end offsets.
+
+    :param file: The snapshot file being written.
+    :type file: io.BufferedWriter
+    :param cursor: A cursor over the column's values, one per row.
+    :type cursor: sqlite3.Cursor
+    :return: The column's entry for the snapshot directory.
+    :rtype: dict
+    """
+    start = file.tell()
+    offsets = array('Q')
+    position = 0
+    while True:
+        rows = cursor.fetchmany(CHUNK_SIZE)
+        if not rows:
+            break
+        encoded = [str(row[0]).encode('utf-8') for row in rows]
+        for value in encoded:
+            position += len(value)
+            offsets.append(position)
+        file.write(b''.join(encoded))
+    align(file)
+    offsets_start = file.tell()
+    offsets.tofile(file)
+    return {'type': 'text', 'data': start, 'offsets': offsets_start}
+
+
+def write_snapshot(db_manager, path):
+    """
+    Write every table of a database to a snapshot file.
+
+    The tables are read inside a single read transaction, so the snapshot is consistent even if
+    another connection writes to the database meanwhile. A column is stored as integers if every
+    value in it is an integer, and as text otherwise.
+
+    :param db_manager: The database manager whose database is saved.
+    :type db_manager: DatabaseManager
+    :param path: The path of the snapshot file to write.
+    :type path: str
+    """
+    connection = db_manager.connection
+    began = not connection.in_transaction
+    if began:
+        connection.execute('BEGIN')
+    try:
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, 0))
+            directory = []
+            for table in SNAPSHOT_TABLES:
+                columns = []
+                for name in db_manager.column_names(table):
+                    integer = connection.execute(
+                        f'SELECT NOT EXISTS (SELECT 1 FROM {table} WHERE typeof({name}) != ?)', ('integer',)
+                    ).fetchone()[0]
+                    cursor = connection.cursor()
+                    cursor.row_factory = None
+                    cursor.execute(f'SELECT {name} FROM {table} ORDER BY rowid')
+                    column = write_integer_column(file, cursor) if integer else write_text_column(file, cursor)
+                    column['name'] = name
+                    columns.append(column)
+                rows = connection.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                directory.append({'name': table, 'rows': rows, 'columns': columns})
+            directory_start = file.tell()
+            file.write(json.dumps(directory).encode('utf-8'))
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, VERSION, directory_start))
+    finally:
+        if began:
+            connection.rollback()
+
+
+class TextColumn:
+    """
+    A read-only sequence of the strings of a text column, decoded one at a time as they are read.
+
+    :param data: The block of UTF-8 strings.
+    :type data: memoryview
+    :param offsets: The end offset of each string in `data`.
+    :type offsets: memoryview
+    """
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        start = self.offsets[index - 1] if index > 0 else 0
+        return str(self.data[start:self.offsets[index]], 'utf-8')
+
+    def __iter__(self):
+        start = 0
+        data = self.data
+        for end in self.offsets:
+            yield str(data[start:end], 'utf-8')
+            start = end
+
+    def release(self):
+        """
+        Release the views into the snapshot file.
+        """
+        self.offsets.release()
+        self.data.release()
+
+
+class Snapshot:
+    """
+    A snapshot file mapped into memory.
+
+    Use it as a context manager, or call `close` when done. Columns are read directly from the
+    mapping; nothing is decoded until it is iterated over.
+
+    :param path: The path of the snapshot file to open.
+    :type path: str
+    :raises ValueError: If the file is not a snapshot or has an unsupported version.
+    """
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        if self.file.seek(0, 2) < HEADER.size:
+            self.file.close()
+            raise ValueError("The file is not a snapshot.")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, directory_start = HEADER.unpack_from(self.map)
+            if magic != MAGIC:
+                raise ValueError("The file is not a snapshot.")
+            if version != VERSION:
+                raise ValueError(f"Unsupported snapshot version {version}.")
+            self.tables = {table['name']: table for table in json.loads(self.map[directory_start:])}
+        except ValueError:
+            self.close()
+            raise
+
+    def row_count(self, table):
+        """
+        Get the number of rows of a table in the snapshot.
+
+        :param table: The name of the table.
+        :type table: str
+        :return: The number of rows, or 0 if the table is not in the snapshot.
+        :rtype: int
+        """
+        return self.tables[table]['rows'] if table in self.tables else 0
+
+    def column_names(self, table):
+        """
+        Get the names of the columns of a table in the snapshot.
+
+        :param table: The name of the table.
+        :type table: str
+        :return: The column names, or an empty list if the table is not in the snapshot.
+        :rtype: list[str]
+        """
+        if table not in self.tables:
+            return []
+        return [column['name'] for column in self.tables[table]['columns']]
+
+    def column(self, table, column):
+        """
+        Get a view of the values of one column.
+
+        Integer columns are returned as a memoryview of 64-bit integers and text columns as a
+        `TextColumn`. Call `release` on the result once done with it.
+
+        :param table: The name of the table.
+        :type table: str
+        :param column: The column's entry in the snapshot directory.
+        :type column: dict
+        :return: The column's values.
+        :rtype: memoryview or TextColumn
+        """
+        rows = self.tables[table]['rows']
+        view = memoryview(self.map)
+        try:
+            if column['type'] == 'integer':
+                return view[column['data']:column['data'] + 8 * rows].cast('q')
+            offsets = view[column['offsets']:column['offsets'] + 8 * rows].cast('Q')
+            end = offsets[rows - 1] if rows else 0
+            return TextColumn(view[column['data']:column['data'] + end], offsets)
+        finally:
+            view.release()
+
+    def rows(self, table):
+        """
+        Iterate over the rows of a table as tuples, in the order of `column_names`.
+
+        :param table: The name of the table.
+        :type table: str
+        :return: A generator of rows, suitable for `executemany`.
+        :rtype: generator
+        """
+        if table not in self.tables:
+            return
+        columns = [self.column(table, column) for column in self.tables[table]['columns']]
+        try:
+            yield from zip(*columns)
+        finally:
+            for column in columns:
+                column.release()
+
+    def close(self):
+        """
+        Unmap the snapshot and close the file.
+        """
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,197 @@
+import sqlite3
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from common.csv_export import CsvExport
+
+"""
+Background workers for the school management system.
+
+This module provides `QRunnable` workers that run long database operations on a `QThreadPool`
+so the GUI thread stays responsive. Workers report back to the GUI through the Qt signals of a
+`WorkerSignals` object, and can be cancelled while they run.
+"""
+
+
+class WorkerSignals(QObject):
+    """
+    The signals emitted by a background worker.
+
+    Every signal carries the worker's `generation` number, so a receiver can ignore results from
+    a worker that has been superseded by a newer one.
+    """
+    rows = pyqtSignal(int, list)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(int, str)
+
+
+class SearchWorker(QRunnable):
+    """
+    A worker that runs a roster search on its own connection and streams the results back in batches.
+
+    :param db_manager: The database manager whose database is searched.
+    :type db_manager: DatabaseManager
+    :param roster_method: The name of the `DatabaseManager` method that opens the roster cursor.
+    :type roster_method: str
+    :param search_query: The search term passed on to the roster query.
+    :type search_query: str
+    :param generation: A number identifying this search, echoed in every signal.
+    :type generation: int
+    :param batch_size: The number of rows emitted per `rows` signal.
+    :type batch_size: int
+    """
+    def __init__(self, db_manager, roster_method, search_query, generation, batch_size=256):
+        super().__init__()
+        self.db_manager = db_manager
+        self.roster_method = roster_method
+        self.search_query = search_query
+        self.generation = generation
+        self.batch_size = batch_size
+        self.signals = WorkerSignals()
+        self.reader = None
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Ask the worker to stop.
+
+        No more rows are emitted after this call, and a query that is still running is interrupted.
+        """
+        self.cancelled = True
+        if self.reader is not None:
+            try:
+                self.reader.connection.interrupt()
+            except sqlite3.ProgrammingError:
+                pass
+
+    def run(self):
+        """
+        Run the search and emit the matching rows in batches of `batch_size`.
+        """
+        if self.cancelled:
+            return
+        self.reader = self.db_manager.open_reader()
+        try:
+            cursor = getattr(self.reader, self.roster_method)(self.search_query)
+            while not self.cancelled:
+                batch = cursor.fetchmany(self.batch_size)
+                if not batch:
+                    break
+                self.signals.rows.emit(self.generation, batch)
+            if not self.cancelled:
+                self.signals.finished.emit(self.generation)
+        except sqlite3.Error as e:
+            if not self.cancelled:
+                self.signals.failed.emit(self.generation, str(e))
+        finally:
+            self.reader.close()
+
+
+class ProgressSignals(QObject):
+    """
+    The signals emitted by a worker that reports its progress, such as an export or a backup.
+
+    `progress` carries the amount of work done so far and the total amount of work, and
+    `finished` carries True if the work completed or False if it was cancelled.
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(bool)
+    failed = pyqtSignal(str)
+
+
+class ExportWorker(QRunnable):
+    """
+    A worker that streams rosters into CSV files on its own connection.
+
+    Each roster is read from a single joined cursor and written with `CsvExport`, so memory use
+    does not grow with the size of the tables.
+
+    :param db_manager: The database manager whose database is exported.
+    :type db_manager: DatabaseManager
+    :param exports: Pairs of a CSV file name and the `RosterTableModel` subclass whose columns
+        and roster are written to it.
+    :type exports: list[tuple[str, type]]
+    """
+    def __init__(self, db_manager, exports):
+        super().__init__()
+        self.db_manager = db_manager
+        self.exports = exports
+        self.signals = ProgressSignals()
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Ask the worker to stop after the current chunk. The partly written file is removed.
+        """
+        self.cancelled = True
+
+    def run(self):
+        """
+        Write every export in turn, emitting `progress` after each chunk.
+        """
+        reader = self.db_manager.open_reader()
+        try:
+            total = sum(reader.count_rows(model.table) for _, model in self.exports)
+            done = 0
+            for filename, model in self.exports:
+                cursor = getattr(reader, model.roster_method)()
+                export = CsvExport(filename, model.headers(), model.csv_rows(cursor))
+
+                def progress(written, _):
+                    self.signals.progress.emit(done + written, total)
+                    return not self.cancelled
+
+                completed = export.run(progress)
+                cursor.close()
+                if not completed:
+                    self.signals.finished.emit(False)
+                    return
+                done += export.written
+            self.signals.finished.emit(True)
+        except (sqlite3.Error, OSError) as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            reader.close()
+
+
+class BackupWorker(QRunnable):
+    """
+    A worker that backs up the database with SQLite's online backup API on its own connection.
+
+    The backup is a consistent snapshot, and the GUI's connection can keep reading and writing
+    while it runs. `progress` is emitted with page counts after each step.
+
+    :param db_manager: The database manager whose database is backed up.
+    :type db_manager: DatabaseManager
+    :param backup_file_path: The file path where the backup is saved.
+    :type backup_file_path: str
+    """
+    def __init__(self, db_manager, backup_file_path):
+        super().__init__()
+        self.db_manager = db_manager
+        self.backup_file_path = backup_file_path
+        self.signals = ProgressSignals()
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Ask the worker to stop after the current step. The partly written backup is removed.
+        """
+        self.cancelled = True
+
+    def run(self):
+        """
+        Copy the database to the backup file, emitting `progress` after each step.
+        """
+        def progress(copied, total):
+            self.signals.progress.emit(copied, total)
+            return not self.cancelled
+
+        reader = self.db_manager.open_reader()
+        try:
+            completed = reader.backup_database(self.backup_file_path, progress=progress)
+            self.signals.finished.emit(completed)
+        except (sqlite3.Error, OSError) as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            reader.close()
@@ -0,0 +1,270 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database_setup import Database
+from classes import Student, Course
+from json_loader import load_school_data, build_student, build_instructor, build_course
+from loader import load_school
+
+"""
+Benchmarks for the in-memory layer of the school management system.
+
+Each benchmark builds its own throw-away database in a temporary directory, so running this
+module never touches the application's data. Run it from the `tkinter_files` folder, for example::
+
+    python benchmarks.py loader --rows 50000
+"""
+
+
+def timed(function, *args):
+    """
+    Call a function and measure how long it takes.
+
+    :param function: The function to call.
+    :type function: callable
+    :return: The elapsed time in seconds.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def populate(db, students):
+    """
+    Fill a database with generated students, instructors, courses, and enrollments.
+
+    One course is created per ten students and one instructor per five courses, and every student
+    is enrolled in four courses.
+
+    :param db: The database to fill.
+    :type db: Database
+    :param students: The number of students to generate.
+    :type students: int
+    :return: The number of enrollments generated.
+    :rtype: int
+    """
+    courses = max(students // 10, 4)
+    instructors = max(courses // 5, 1)
+    connection = db.connection
+    with connection:
+        connection.executemany(
+            'INSERT INTO Instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)',
+            ((f"I{i}", f"Instructor {i}", 40, f"instructor{i}@school.edu") for i in range(instructors))
+        )
+        connection.executemany(
+            'INSERT INTO Courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)',
+            ((f"C{i}", f"Course {i}", f"I{i % instructors}") for i in range(courses))
+        )
+        connection.executemany(
+            'INSERT INTO Students (student_id, name, age, email) VALUES (?, ?, ?, ?)',
+            ((f"S{i}", f"Student {i}", 20, f"student{i}@school.edu") for i in range(students))
+        )
+        connection.executemany(
+            'INSERT INTO Enrollments (student_id, course_id) VALUES (?, ?)',
+            ((f"S{i}", f"C{(i + k) % courses}") for i in range(students) for k in range(4))
+        )
+    return 4 * students
+
+
+def benchmark_loader(rows):
+    """
+    Time the startup loader on databases of doubling size.
+
+    If loading is linear, the time per enrollment stays roughly constant from one size to the next.
+
+    :param rows: The number of students in the smallest database.
+    :type rows: int
+    """
+    for students in (rows, 2 * rows, 4 * rows, 8 * rows):
+        with tempfile.TemporaryDirectory() as directory:
+            db = Database(os.path.join(directory, 'benchmark.db'))
+            enrollments = populate(db, students)
+            elapsed = timed(load_school, db.connection)
+            db.connection.close()
+        print(f"{students:>10} students {enrollments:>10} enrollments: "
+              f"{elapsed:8.3f} s  {1e6 * elapsed / enrollments:8.2f} us/enrollment")
+
+
+def write_json(path, students):
+    """
+    Write a JSON data file in the format of "Save Data as JSON", shaped like `populate`'s data.
+
+    :param path: The path of the file to write.
+    :type path: str
+    :param students: The number of students to generate.
+    :type students: int
+    """
+    courses = max(students // 10, 4)
+    instructors = max(courses // 5, 1)
+    enrolled = [[] for _ in range(courses)]
+    for i in range(students):
+        for k in range(4):
+            enrolled[(i + k) % courses].append(f"S{i}")
+    data = {
+        'students': [
+            {'name': f"Student {i}", 'age': 20, 'email': f"student{i}@school.edu", 'student_id': f"S{i}",
+             'registered_courses': [f"C{(i + k) % courses}" for k in range(4)]}
+            for i in range(students)
+        ],
+        'instructors': [
+            {'name': f"Instructor {i}", 'age': 40, 'email': f"instructor{i}@school.edu", 'instructor_id': f"I{i}",
+             'assigned_courses': [f"C{c}" for c in range(i, courses, instructors)]}
+            for i in range(instructors)
+        ],
+        'courses': [
+            {'course_id': f"C{c}", 'course_name': f"Course {c}", 'instructor_id': f"I{c % instructors}",
+             'enrolled_students': enrolled[c]}
+            for c in range(courses)
+        ],
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=4)
+
+
+def json_load(path):
+    """
+    Load a JSON data file the way it was loaded before streaming: parse the whole document, then
+    build the objects while the parsed document is still held.
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    courses = {c['course_id']: build_course(c) for c in data['courses']}
+    students = {s['student_id']: build_student(s) for s in data['students']}
+    instructors = {i['instructor_id']: build_instructor(i) for i in data['instructors']}
+    for course_data in data['courses']:
+        courses[course_data['course_id']].set_enrolled_students(students[s] for s in course_data['enrolled_students'])
+    for instructor_data in data['instructors']:
+        instructors[instructor_data['instructor_id']].set_assigned_courses(courses[c] for c in instructor_data['assigned_courses'])
+    return data, students, instructors, courses
+
+
+def json_stream(path):
+    """
+    Load a JSON data file with the streaming loader.
+    """
+    with open(path, 'r') as f:
+        return load_school_data(f)
+
+
+def benchmark_json(rows):
+    """
+    Compare the time and peak memory of loading a JSON data file by parsing it whole with
+    `json.load` against streaming it through `load_school_data`.
+
+    :param rows: The number of students in the file.
+    :type rows: int
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'benchmark.json')
+        write_json(path, rows)
+        print(f"{rows} students, {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        for name, function in (('whole document', json_load), ('streaming', json_stream)):
+            elapsed = timed(function, path)
+            tracemalloc.start()
+            function(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name:>16}: {elapsed:8.3f} s  peak {peak / 2 ** 20:8.1f} MiB")
+
+
+class DictStudent:
+    """
+    A student stored in an instance dict with a plain list of courses, as `Student` was before it
+    had `__slots__` and link sets.
+    """
+    def __init__(self, name, age, _email, student_id, registered_courses):
+        self.name = name
+        self.age = age
+        self._email = _email
+        self.student_id = student_id
+        self.registered_courses = registered_courses
+
+
+class DictCourse:
+    """
+    A course stored in an instance dict with a plain list of students, as `Course` was before it
+    had `__slots__` and link sets.
+    """
+    def __init__(self, course_id, course_name, instructor, enrolled_students):
+        self.course_id = course_id
+        self.course_name = course_name
+        self.instructor = instructor
+        self.enrolled_students = enrolled_students
+
+
+def roster_memory(student_class, course_class, students, share_lists):
+    """
+    Measure the memory taken by linked students, shaped like `populate`'s data.
+
+    The strings and courses are created before measuring starts, so only the students, their
+    course lists, and the growth of the courses' student lists are counted. Plain lists are linked
+    on both sides by hand, as the tabs used to do.
+
+    :param student_class: The class of the students to build.
+    :type student_class: type
+    :param course_class: The class of the courses to build.
+    :type course_class: type
+    :param students: The number of students to build.
+    :type students: int
+    :param share_lists: Give every student the same empty course list, to measure the objects alone.
+    :type share_lists: bool
+    :return: The number of bytes allocated per student.
+    :rtype: float
+    """
+    courses = [course_class(f"C{c}", f"Course {c}", None, []) for c in range(max(students // 10, 4))]
+    names = [(f"Student {i}", f"student{i}@school.edu", f"S{i}") for i in range(students)]
+    shared = []
+    tracemalloc.start()
+    roster = []
+    for i, (name, email, student_id) in enumerate(names):
+        registered = shared if share_lists else [courses[(i + k) % len(courses)] for k in range(4)]
+        student = student_class(name, 20, email, student_id, registered)
+        if student_class is DictStudent:
+            for course in registered:
+                course.enrolled_students.append(student)
+        roster.append(student)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del roster
+    return used / students
+
+
+def benchmark_memory(rows):
+    """
+    Compare the memory taken by the domain classes with dict-backed, list-linked copies of them.
+
+    :param rows: The number of students to build.
+    :type rows: int
+    """
+    for label, student_class, course_class in (('instance dict', DictStudent, DictCourse),
+                                               ('classes', Student, Course)):
+        alone = roster_memory(student_class, course_class, rows, True)
+        linked = roster_memory(student_class, course_class, rows, False)
+        print(f"{label:>13}: {alone:6.1f} bytes/student alone  {linked:6.1f} bytes/student with 4 courses")
+
+
+BENCHMARKS = {
+    'json': benchmark_json,
+    'memory': benchmark_memory,
+    'loader': benchmark_loader,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run in-memory layer benchmarks.")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--rows', type=int, default=25000, help="number of students in the smallest run")
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args.rows)
+
+
+if __name__ == '__main__':
+    main()
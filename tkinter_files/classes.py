@@ -1,6 +1,7 @@
 from contextlib import closing
 
 from database_setup import Database
+from common.links import LinkField
 
 db = Database()
 
@@ -16,6 +17,8 @@ class Person:
     :type _email: str
     """
 
+    __slots__ = ('name', 'age', '_email')
+
     def __init__(self, name: str, age: int, _email: str) -> None:
         self.name = name
         self.age = age
@@ -110,12 +113,20 @@ class Student(Person):
     :type _email: str
     :param student_id: The unique student ID.
     :type student_id: str
-    :param registered_courses: A list of registered courses for the student.
-    :type registered_courses: list
+    :param registered_courses: The courses the student is registered for. The student is added to each course's enrolled students.
+    :type registered_courses: iterable
+    """
+    __slots__ = ('student_id', '_registered_courses')
+
+    registered_courses = LinkField('_registered_courses', 'enrolled_students')
     """
+    The courses the student is registered for, as a `LinkSet`.
+    """
+
     def __init__(self, name: str, age: int, _email: str, student_id: str, registered_courses: list) -> None:
         super().__init__(name, age, _email)
         self.student_id = student_id
+        self._registered_courses = None
         self.registered_courses = registered_courses
 
     def get_student_id(self):
@@ -138,30 +149,30 @@ class Student(Person):
 
     def get_registered_courses(self):
         """
-        Get the list of registered courses.
+        Get the registered courses.
 
-        :returns: A list of registered courses.
-        :rtype: list
+        :returns: The registered courses.
+        :rtype: LinkSet
         """
         return self.registered_courses
 
     def set_registered_courses(self, registered_courses):
         """
-        Set the registered courses for the student.
+        Set the registered courses for the student, updating the enrolled students of the courses left and joined.
 
-        :param registered_courses: A list of new registered courses.
-        :type registered_courses: list
+        :param registered_courses: The new registered courses.
+        :type registered_courses: iterable
         """
-        self.registered_courses = registered_courses
+        self.registered_courses.replace(registered_courses)
 
     def register_course(self, course):
         """
-        Register a new course for the student.
+        Register a new course for the student, which also enrolls the student in the course.
 
         :param course: The course to be added.
         :type course: Course
         """
-        self.registered_courses.append(course)
+        self.registered_courses.add(course)
 
     def serialize(self):
         """
@@ -247,12 +258,20 @@ class Instructor(Person):
     :type _email: str
     :param instructor_id: The unique ID of the instructor.
     :type instructor_id: str
-    :param assigned_courses: A list of courses assigned to the instructor.
-    :type assigned_courses: list
+    :param assigned_courses: The courses assigned to the instructor. The instructor becomes each course's instructor.
+    :type assigned_courses: iterable
     """
+    __slots__ = ('instructor_id', '_assigned_courses')
+
+    assigned_courses = LinkField('_assigned_courses', 'instructor')
+    """
+    The courses assigned to the instructor, as a `LinkSet`.
+    """
+
     def __init__(self, name: str, age: int, _email: str, instructor_id: str, assigned_courses: list) -> None:
         super().__init__(name, age, _email)
         self.instructor_id = instructor_id
+        self._assigned_courses = None
         self.assigned_courses = assigned_courses
 
     def get_instructor_id(self):
@@ -275,30 +294,30 @@ class Instructor(Person):
 
     def get_assigned_courses(self):
         """
-        Get the list of assigned courses.
+        Get the assigned courses.
 
-        :returns: A list of courses assigned to the instructor.
-        :rtype: list
+        :returns: The courses assigned to the instructor.
+        :rtype: LinkSet
         """
         return self.assigned_courses
 
     def set_assigned_courses(self, assigned_courses):
         """
-        Set the assigned courses for the instructor.
+        Set the assigned courses for the instructor, updating the instructor of the courses dropped and taken on.
 
-        :param assigned_courses: A new list of assigned courses.
-        :type assigned_courses: list
+        :param assigned_courses: The new assigned courses.
+        :type assigned_courses: iterable
         """
-        self.assigned_courses = assigned_courses
+        self.assigned_courses.replace(assigned_courses)
 
     def assign_course(self, course):
         """
-        Assign a course to the instructor and save it to the database.
+        Assign a course to the instructor and save it to the database. The course is taken from its previous instructor, if any.
 
         :param course: The course to assign.
         :type course: Course
         """
-        self.assigned_courses.append(course)
+        self.assigned_courses.add(course)
         with closing(db.connection.cursor()) as cursor:
             cursor.execute('''
                 INSERT OR REPLACE INTO Assignments (instructor_id, course_id)
@@ -388,17 +407,46 @@ class Course:
     :type course_id: str
     :param course_name: The name of the course.
     :type course_name: str
-    :param instructor: The instructor teaching the course.
+    :param instructor: The instructor teaching the course. The course is added to the instructor's assigned courses.
     :type instructor: Instructor
-    :param enrolled_students: A list of students enrolled in the course.
-    :type enrolled_students: list
+    :param enrolled_students: The students enrolled in the course. The course is added to each student's registered courses.
+    :type enrolled_students: iterable
     """
+    __slots__ = ('course_id', 'course_name', '_instructor', '_enrolled_students')
+
+    enrolled_students = LinkField('_enrolled_students', 'registered_courses')
+    """
+    The students enrolled in the course, as a `LinkSet`.
+    """
+
     def __init__(self, course_id: str, course_name: str, instructor: Instructor, enrolled_students: list):
         self.course_id = course_id
         self.course_name = course_name
+        self._instructor = None
+        self._enrolled_students = None
         self.instructor = instructor
         self.enrolled_students = enrolled_students
 
+    @property
+    def instructor(self):
+        """
+        The instructor teaching the course, or None.
+
+        Setting it moves the course from the previous instructor's assigned courses to the new one's.
+        """
+        return self._instructor
+
+    @instructor.setter
+    def instructor(self, instructor):
+        previous = self._instructor
+        if previous is instructor:
+            return
+        self._instructor = instructor
+        if previous is not None:
+            previous.assigned_courses.unlink(self)
+        if instructor is not None:
+            instructor.assigned_courses.link(self)
+
     def get_course_id(self):
         """
         Get the course ID.
@@ -446,39 +494,39 @@ class Course:
 
     def set_instructor(self, instructor):
         """
-        Set the instructor for the course.
+        Set the instructor for the course, moving it to the new instructor's assigned courses.
 
-        :param instructor: The new instructor for the course.
+        :param instructor: The new instructor for the course, or None.
         :type instructor: Instructor
         """
         self.instructor = instructor
 
     def get_enrolled_students(self):
         """
-        Get the list of enrolled students.
+        Get the enrolled students.
 
-        :returns: A list of students enrolled in the course.
-        :rtype: list
+        :returns: The students enrolled in the course.
+        :rtype: LinkSet
         """
         return self.enrolled_students
 
     def set_enrolled_students(self, enrolled_students):
         """
-        Set the list of enrolled students.
+        Set the enrolled students, updating the registered courses of the students removed and added.
 
-        :param enrolled_students: A new list of students to enroll.
-        :type enrolled_students: list
+        :param enrolled_students: The new students to enroll.
+        :type enrolled_students: iterable
         """
-        self.enrolled_students = enrolled_students
+        self.enrolled_students.replace(enrolled_students)
 
     def add_student(self, student):
         """
-        Add a student to the course and update the database.
+        Add a student to the course and update the database. The course is also added to the student's registered courses.
 
         :param student: The student to enroll in the course.
         :type student: Student
         """
-        self.enrolled_students.append(student)
+        self.enrolled_students.add(student)
         with closing(db.connection.cursor()) as cursor:
             cursor.execute('''
                 INSERT OR IGNORE INTO Enrollments (student_id, course_id)
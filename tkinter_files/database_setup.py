@@ -1,16 +1,37 @@
 import sqlite3
 from contextlib import closing
 
+from common.connection import DEFAULT_CONNECTION_PROFILE, apply_profile
+
 class Database:
     """
     A class representing the database for a school management system.
 
+    The database file is opened the first time `connection` is used, so creating a `Database`,
+    for example by importing a module that holds one, does not create or change any file.
+
     :param db_name: The name of the SQLite database file (default is 'schoolmanagementsystem.db').
     :type db_name: str
+    :param profile: The PRAGMA settings applied when connecting (default is `DEFAULT_CONNECTION_PROFILE`).
+    :type profile: dict or None
     """
-    def __init__(self, db_name='schoolmanagementsystem.db'):
-        self.connection = sqlite3.connect(db_name)
-        self.create_tables()
+    def __init__(self, db_name='schoolmanagementsystem.db', profile=None):
+        self.db_name = db_name
+        self.profile = DEFAULT_CONNECTION_PROFILE if profile is None else profile
+        self._connection = None
+
+    @property
+    def connection(self):
+        """
+        The connection to the database, opened, configured, and given its tables on first use.
+
+        :rtype: sqlite3.Connection
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_name)
+            apply_profile(self._connection, self.profile)
+            self.create_tables()
+        return self._connection
 
     def create_tables(self):
         """
@@ -80,9 +101,11 @@ class Database:
 
     def close(self):
         """
-        Close the database connection.
+        Close the database connection, if it has been opened. It is opened again on next use.
         """
-        self.connection.close()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
  
     def clear_all_tables(self):
         """
@@ -112,4 +135,61 @@ class Database:
 
             return 1
         except Exception as e:
-            return 0    
+            return 0
+
+    def replace_all(self, students, instructors, courses):
+        """
+        Replace the contents of every table with the given students, instructors, and courses.
+
+        The tables are cleared and refilled with one `executemany` per table inside a single
+        transaction, so if anything fails the database is left exactly as it was. Enrollments are
+        taken from each student's registered courses and assignments from each instructor's
+        assigned courses.
+
+        :param students: The students to store.
+        :type students: iterable[Student]
+        :param instructors: The instructors to store.
+        :type instructors: iterable[Instructor]
+        :param courses: The courses to store.
+        :type courses: iterable[Course]
+        :raises sqlite3.Error: If the data cannot be stored, after rolling back.
+        """
+        students = list(students)
+        instructors = list(instructors)
+        with self.connection:
+            with closing(self.connection.cursor()) as cursor:
+                cursor.execute('BEGIN')
+                cursor.execute('DELETE FROM Enrollments')
+                cursor.execute('DELETE FROM Assignments')
+                cursor.execute('DELETE FROM Courses')
+                cursor.execute('DELETE FROM Instructors')
+                cursor.execute('DELETE FROM Students')
+
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO Students (student_id, name, age, email)
+                    VALUES (?, ?, ?, ?)
+                ''', ((student.student_id, student.name, student.age, student._email) for student in students))
+
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO Instructors (instructor_id, name, age, email)
+                    VALUES (?, ?, ?, ?)
+                ''', ((instructor.instructor_id, instructor.name, instructor.age, instructor._email)
+                      for instructor in instructors))
+
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO Courses (course_id, course_name, instructor_id)
+                    VALUES (?, ?, ?)
+                ''', ((course.course_id, course.course_name, course.instructor.instructor_id if course.instructor else None)
+                      for course in courses))
+
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO Enrollments (student_id, course_id)
+                    VALUES (?, ?)
+                ''', ((student.student_id, course.course_id)
+                      for student in students for course in student.registered_courses))
+
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO Assignments (instructor_id, course_id)
+                    VALUES (?, ?)
+                ''', ((instructor.instructor_id, course.course_id)
+                      for instructor in instructors for course in instructor.assigned_courses))
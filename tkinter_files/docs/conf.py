@@ -8,6 +8,7 @@
 import os
 import sys
 sys.path.insert(0, os.path.abspath('..'))
+sys.path.insert(0, os.path.abspath('../..'))
 
 project = 'School Management System Tkinter'
 copyright = '2024, Sharafeddine Sharafeddine'
@@ -0,0 +1,193 @@
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+"""
+A publish/subscribe change bus for the school management system.
+
+The tabs do not call each other when the data changes. Instead, the tab that makes a change
+publishes an event describing it on a `ChangeBus`, such as `EntityAdded` for a new student or
+`LinkRemoved` for a dropped enrollment, and every view that shows the affected data subscribes to
+the events it cares about and applies just that change. A view that is not on screen does not
+apply changes at all: it marks itself dirty and refreshes in full when its tab is next shown.
+Views start dirty, so each one is only drawn for the first time when it is first shown.
+"""
+
+STUDENT = 'student'
+INSTRUCTOR = 'instructor'
+COURSE = 'course'
+"""
+The kinds of entity events.
+"""
+
+ENROLLMENT = 'enrollment'
+ASSIGNMENT = 'assignment'
+"""
+The kinds of link events. An enrollment links a student to a course, and an assignment links an
+instructor to a course.
+"""
+
+EntityAdded = namedtuple('EntityAdded', ['kind', 'entity'])
+"""
+A student, instructor, or course was added.
+"""
+
+EntityUpdated = namedtuple('EntityUpdated', ['kind', 'entity'])
+"""
+The details of a student, instructor, or course were changed.
+"""
+
+EntityRemoved = namedtuple('EntityRemoved', ['kind', 'entity'])
+"""
+A student, instructor, or course was removed, after every link to it was removed.
+"""
+
+LinkAdded = namedtuple('LinkAdded', ['kind', 'source', 'target'])
+"""
+A student was enrolled in a course, or an instructor assigned to one. The source is the student
+or instructor and the target is the course.
+"""
+
+LinkRemoved = namedtuple('LinkRemoved', ['kind', 'source', 'target'])
+"""
+An enrollment or assignment was removed. The source is the student or instructor and the target
+is the course.
+"""
+
+DataReplaced = namedtuple('DataReplaced', [])
+"""
+All the data was replaced, for example by loading a data file.
+"""
+
+
+class ChangeBus:
+    """
+    Delivers each published event to the handlers subscribed to its type and kind.
+    """
+    def __init__(self):
+        self.handlers = {}
+
+    def subscribe(self, event_type, handler, kind=None):
+        """
+        Call a handler for every event of a type.
+
+        :param event_type: The type of event, e.g. `EntityAdded`.
+        :type event_type: type
+        :param handler: The function called with each event.
+        :type handler: callable
+        :param kind: The kind of event, e.g. `STUDENT`, or None for events of every kind.
+        :type kind: str or None
+        """
+        self.handlers.setdefault((event_type, kind), []).append(handler)
+
+    def unsubscribe(self, event_type, handler, kind=None):
+        """
+        Stop calling a handler.
+
+        :raises ValueError: If the handler is not subscribed to this type and kind of event.
+        """
+        self.handlers.get((event_type, kind), []).remove(handler)
+
+    def publish(self, event):
+        """
+        Call the handlers subscribed to an event, in the order they subscribed.
+
+        :param event: The event.
+        :type event: tuple
+        """
+        event_type = type(event)
+        kind = getattr(event, 'kind', None)
+        handlers = list(self.handlers.get((event_type, kind), ()))
+        if kind is not None:
+            handlers.extend(self.handlers.get((event_type, None), ()))
+        for handler in handlers:
+            handler(event)
+
+
+class TabView(ABC):
+    """
+    A view on a notebook tab that is kept up to date by change events.
+
+    Subclasses call `attach`, subscribe with `listen`, and must implement `refresh`, which redraws
+    the whole view. A view starts dirty. While the tab is hidden, events only mark the view dirty,
+    and a dirty view refreshes once, when its tab is shown or when an event arrives while it is
+    shown.
+    """
+    def attach(self, bus, notebook, frame):
+        """
+        Connect the view to a change bus and the notebook tab it is shown on.
+
+        :param bus: The change bus to listen to.
+        :type bus: ChangeBus
+        :param notebook: The notebook the view's tab belongs to.
+        :type notebook: ttk.Notebook
+        :param frame: The view's tab.
+        :type frame: ttk.Frame
+        """
+        self.bus = bus
+        self.notebook = notebook
+        self.tab_frame = frame
+        self.dirty = True
+        self.refresh_pending = False
+        notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed, add='+')
+
+    def visible(self):
+        """
+        Check whether the view's tab is the one shown.
+
+        :rtype: bool
+        """
+        return str(self.notebook.select()) == str(self.tab_frame)
+
+    def listen(self, event_type, handler, kind=None):
+        """
+        Apply events of a type to the view while its tab is shown, or mark it dirty otherwise.
+
+        An event that arrives while a dirty view is shown refreshes the whole view instead.
+
+        :param event_type: The type of event, e.g. `EntityAdded`.
+        :type event_type: type
+        :param handler: The function that applies an event to the view.
+        :type handler: callable
+        :param kind: The kind of event, or None for events of every kind.
+        :type kind: str or None
+        """
+        def apply(event):
+            if not self.visible():
+                self.dirty = True
+            elif self.dirty:
+                self.run_refresh()
+            else:
+                handler(event)
+        self.bus.subscribe(event_type, apply, kind)
+
+    def refresh_soon(self, event=None):
+        """
+        Refresh the view once the current batch of events has been handled.
+
+        Several events published together, such as the links removed with a course, cause a
+        single refresh.
+        """
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            self.tab_frame.after_idle(self.run_refresh)
+
+    def run_refresh(self):
+        """
+        Refresh the view and clear the dirty flag.
+        """
+        self.refresh_pending = False
+        self.dirty = False
+        self.refresh()
+
+    def on_tab_changed(self, event):
+        """
+        Refresh the view if it has just been shown and is dirty.
+        """
+        if self.dirty and self.visible():
+            self.run_refresh()
+
+    @abstractmethod
+    def refresh(self):
+        """
+        Redraw the whole view from the data.
+        """
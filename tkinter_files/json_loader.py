@@ -0,0 +1,364 @@
+import json
+import re
+
+from classes import Student, Instructor, Course
+from common.validation import ValidationReport, validate_columns
+
+"""
+Incremental loading of school data from JSON files.
+
+The files written by "Save Data as JSON" hold a single object with `students`, `instructors`, and
+`courses` arrays. This module reads such a file a chunk at a time with `JsonRecordStream`, which
+decodes one array element at a time, so the whole document is never held in memory.
+`load_school_data` builds each record's object as soon as it is read, keeping only the objects,
+their ID indexes, the IDs each object refers to, and the fields listed in `RECORD_CHECKS`. Once
+every record has been read, those fields are checked a column at a time with `validate_columns`,
+which reports every invalid value rather than stopping at the first. If the file is valid, the
+IDs are resolved, since a record may refer to one that comes later in the file, and `reconcile`
+then links the objects, completing any relationship that is recorded on only one side.
+"""
+
+CHUNK_SIZE = 65536
+"""
+The number of characters read from the file at a time.
+"""
+
+REQUIRED_SECTIONS = ('students', 'instructors', 'courses')
+
+RECORD_CHECKS = {
+    'students': {'name': 'text', 'student_id': 'text', 'age': 'integer', 'email': 'email'},
+    'instructors': {'name': 'text', 'instructor_id': 'text', 'age': 'integer', 'email': 'email'},
+    'courses': {'course_id': 'text', 'course_name': 'text'},
+}
+"""
+The fields each kind of record must have, and the kind of value each one must hold, as understood
+by `validation.validate_column`. A missing field is reported as an invalid value.
+"""
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonRecordStream:
+    """
+    An incremental reader for a JSON object whose values are arrays of records.
+
+    Iterating over the stream yields `(key, record)` pairs, one for each element of each array in
+    the top-level object, in file order. Values that are not arrays are skipped. Malformed input
+    raises `json.JSONDecodeError`.
+
+    :param file: The text file to read.
+    :type file: io.TextIOBase
+    :param chunk_size: The number of characters read from the file at a time.
+    :type chunk_size: int
+    """
+    def __init__(self, file, chunk_size=CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+        self.keys = []
+
+    def fill(self):
+        """
+        Read the next chunk of the file into the buffer, dropping what has already been parsed.
+
+        :return: False if the end of the file has been reached.
+        :rtype: bool
+        """
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def peek(self):
+        """
+        Skip whitespace and return the next character without consuming it.
+
+        :return: The next character, or an empty string at the end of the file.
+        :rtype: str
+        """
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or not self.fill():
+                return self.buffer[self.position:self.position + 1]
+
+    def expect(self, characters):
+        """
+        Consume the next character, which must be one of `characters`.
+
+        :param characters: The characters allowed at this point.
+        :type characters: str
+        :return: The character consumed.
+        :rtype: str
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            expected = ' or '.join(repr(c) for c in characters)
+            raise json.JSONDecodeError(f"Expecting {expected}", self.buffer, self.position)
+        self.position += 1
+        return character
+
+    def value(self):
+        """
+        Decode the next complete JSON value, reading more of the file as needed.
+
+        :return: The decoded value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def __iter__(self):
+        self.expect('{')
+        if self.peek() == '}':
+            self.expect('}')
+        else:
+            yield from self.members()
+        if self.peek():
+            raise json.JSONDecodeError("Extra data", self.buffer, self.position)
+
+    def members(self):
+        """
+        Read the members of the top-level object, yielding the elements of its arrays.
+
+        :return: A generator of `(key, record)` pairs.
+        :rtype: generator
+        """
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self.buffer, self.position)
+            self.keys.append(key)
+            self.expect(':')
+            if self.peek() == '[':
+                self.expect('[')
+                if self.peek() == ']':
+                    self.expect(']')
+                else:
+                    while True:
+                        yield key, self.value()
+                        if self.expect(',]') == ']':
+                            break
+            else:
+                self.value()
+            if self.expect(',}') == '}':
+                return
+
+
+def build_course(data):
+    """
+    Create a course from its record, without an instructor or students.
+
+    :param data: The course record.
+    :type data: dict
+    :returns: The new course.
+    :rtype: Course
+    """
+    return Course(data.get('course_id'), data.get('course_name'), None, [])
+
+
+def build_instructor(data):
+    """
+    Create an instructor from its record, without any courses.
+
+    :param data: The instructor record.
+    :type data: dict
+    :returns: The new instructor.
+    :rtype: Instructor
+    """
+    return Instructor(data.get('name'), data.get('age'), data.get('email'), data.get('instructor_id'), [])
+
+
+def build_student(data):
+    """
+    Create a student from its record, without any courses.
+
+    :param data: The student record.
+    :type data: dict
+    :returns: The new student.
+    :rtype: Student
+    """
+    return Student(data.get('name'), data.get('age'), data.get('email'), data.get('student_id'), [])
+
+
+BUILDERS = {
+    'courses': build_course,
+    'instructors': build_instructor,
+    'students': build_student,
+}
+
+ID_FIELDS = {'courses': 'course_id', 'instructors': 'instructor_id', 'students': 'student_id'}
+
+REFERENCE_FIELDS = {'courses': 'enrolled_students', 'instructors': 'assigned_courses', 'students': 'registered_courses'}
+
+
+def reconcile(enrolled, registered, assigned):
+    """
+    Link the relationships read from a data file, noting each one recorded on only one side.
+
+    A link listed by either side is kept, since `LinkSet` adds the other side automatically. Each
+    check is a membership test on a set, or on a link set, which scans the shorter side of the
+    link, such as a student's few courses, so reconciling is close to linear in the number of
+    links. Where two instructors list the same course, the last one read keeps it.
+
+    :param enrolled: The students each course lists as enrolled.
+    :type enrolled: dict[Course, list[Student]]
+    :param registered: The courses each student lists as registered.
+    :type registered: dict[Student, list[Course]]
+    :param assigned: The courses each instructor lists as assigned. Each course's own instructor
+        must already be set.
+    :type assigned: dict[Instructor, list[Course]]
+    :returns: A description of each correction made.
+    :rtype: list[str]
+    """
+    corrections = []
+
+    listed = {student: set(courses) for student, courses in registered.items()}
+    for course, students in enrolled.items():
+        for student in students:
+            if course not in listed[student]:
+                corrections.append(f"Student '{student.name}' enrolled in course '{course.course_name}' but had not registered. Auto-corrected.")
+            course.enrolled_students.add(student)
+    del listed
+
+    for student, courses in registered.items():
+        for course in courses:
+            if course not in student.registered_courses:
+                corrections.append(f"Student '{student.name}' registered for course '{course.course_name}' but was not enrolled. Auto-corrected.")
+                student.registered_courses.add(course)
+
+    listed = {instructor: set(courses) for instructor, courses in assigned.items()}
+    for course in enrolled:
+        instructor = course.instructor
+        if instructor and course not in listed[instructor]:
+            corrections.append(f"Course '{course.course_name}' is assigned to instructor '{instructor.name}' but was not in the instructor's assigned courses. Auto-corrected.")
+    del listed
+
+    for instructor, courses in assigned.items():
+        for course in courses:
+            if course.instructor is not instructor:
+                corrections.append(f"Instructor '{instructor.name}' has course '{course.course_name}' in assigned courses but was not set as the course's instructor. Auto-corrected.")
+                instructor.assigned_courses.add(course)
+
+    return corrections
+
+
+def load_school_data(file, chunk_size=CHUNK_SIZE):
+    """
+    Read students, instructors, and courses from a JSON data file and link them together.
+
+    Each record is turned into an object as soon as it is read, and the IDs it refers to are kept
+    until the whole file has been read and they can be resolved. The fields listed in
+    `RECORD_CHECKS` are then validated a column at a time, and every invalid value is collected
+    in a report instead of raising on the first one. If the report lists any problem, the objects
+    are returned unlinked and should not be used. Otherwise, references to IDs that are not in the
+    file are dropped with a warning, and relationships recorded on only one side are completed on
+    the other side by `reconcile`.
+
+    :param file: The text file to read.
+    :type file: io.TextIOBase
+    :param chunk_size: The number of characters read from the file at a time.
+    :type chunk_size: int
+    :returns: The students, instructors, and courses, each as a dict keyed by ID, then the warnings
+        about missing references, the descriptions of the auto-corrections made, and the report
+        of invalid values.
+    :rtype: tuple[dict, dict, dict, list[str], list[str], ValidationReport]
+    :raises json.JSONDecodeError: If the file is not valid JSON.
+    :raises ValueError: If a section is missing.
+    """
+    report = ValidationReport()
+    columns = {section: {field: [] for field in checks} for section, checks in RECORD_CHECKS.items()}
+    objects = {'students': {}, 'instructors': {}, 'courses': {}}
+    references = {'students': {}, 'instructors': {}, 'courses': {}}
+    course_instructors = {}
+
+    stream = JsonRecordStream(file, chunk_size)
+    for section, data in stream:
+        if section not in BUILDERS:
+            continue
+        if not isinstance(data, dict):
+            data = {}
+        fields = columns[section]
+        row = len(fields[ID_FIELDS[section]])
+        for field, values in fields.items():
+            values.append(data.get(field))
+        linked = data.get(REFERENCE_FIELDS[section], [])
+        if not isinstance(linked, list):
+            report.add(row, f"{section}.{REFERENCE_FIELDS[section]}", linked, "must be a list")
+            linked = []
+        item_id = data.get(ID_FIELDS[section])
+        if not isinstance(item_id, str):
+            continue
+        objects[section][item_id] = BUILDERS[section](data)
+        references[section][item_id] = linked
+        if section == 'courses':
+            course_instructors[item_id] = data.get('instructor_id')
+
+    if not all(section in stream.keys for section in REQUIRED_SECTIONS):
+        raise ValueError("Data file is missing required sections.")
+
+    validate_columns({
+        f"{section}.{field}": (RECORD_CHECKS[section][field], values)
+        for section, fields in columns.items() for field, values in fields.items()
+    }, report)
+    del columns
+
+    students, instructors, courses = objects['students'], objects['instructors'], objects['courses']
+    if not report.valid:
+        return students, instructors, courses, [], [], report
+    warnings = []
+
+    enrolled = {}
+    for course in courses.values():
+        instructor_id = course_instructors[course.course_id]
+        if instructor_id:
+            if instructor_id in instructors:
+                course.instructor = instructors[instructor_id]
+            else:
+                warnings.append(f"Instructor ID '{instructor_id}' for course '{course.course_name}' not found.")
+        enrolled[course] = []
+        for s_id in references['courses'][course.course_id]:
+            if s_id in students:
+                enrolled[course].append(students[s_id])
+            else:
+                warnings.append(f"Student ID '{s_id}' enrolled in course '{course.course_name}' not found.")
+    del course_instructors, references['courses']
+
+    assigned = {}
+    for instructor in instructors.values():
+        assigned[instructor] = []
+        for c_id in references['instructors'][instructor.instructor_id]:
+            if c_id in courses:
+                assigned[instructor].append(courses[c_id])
+            else:
+                warnings.append(f"Course ID '{c_id}' assigned to instructor '{instructor.name}' not found.")
+    del references['instructors']
+
+    registered = {}
+    for student in students.values():
+        registered[student] = []
+        for c_id in references['students'][student.student_id]:
+            if c_id in courses:
+                registered[student].append(courses[c_id])
+            else:
+                warnings.append(f"Course ID '{c_id}' registered by student '{student.name}' not found.")
+    del references['students']
+
+    corrections = reconcile(enrolled, registered, assigned)
+
+    return students, instructors, courses, warnings, corrections, report
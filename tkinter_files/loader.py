@@ -0,0 +1,111 @@
+from contextlib import closing
+
+from classes import Student, Instructor, Course
+from registry import Registry
+
+"""
+Startup loading for the school management system.
+
+This module reads every student, instructor, course, and enrollment from the database and links
+them into in-memory objects. Entities are indexed by ID in `Registry` collections as they are read,
+so each course's instructor and each enrollment's student and course are resolved with a dictionary
+lookup, and loading takes time proportional to the number of rows.
+"""
+
+
+def load_students(connection):
+    """
+    Read every student from the database.
+
+    :param connection: The database connection to read from.
+    :type connection: sqlite3.Connection
+    :returns: The students, indexed by student ID.
+    :rtype: Registry
+    """
+    students = Registry('student_id')
+    with closing(connection.cursor()) as cursor:
+        cursor.execute('SELECT student_id, name, age, email FROM Students')
+        for student_id, name, age, email in cursor:
+            students.add(Student(name, age, email, student_id, []))
+    return students
+
+
+def load_instructors(connection):
+    """
+    Read every instructor from the database.
+
+    :param connection: The database connection to read from.
+    :type connection: sqlite3.Connection
+    :returns: The instructors, indexed by instructor ID.
+    :rtype: Registry
+    """
+    instructors = Registry('instructor_id')
+    with closing(connection.cursor()) as cursor:
+        cursor.execute('SELECT instructor_id, name, age, email FROM Instructors')
+        for instructor_id, name, age, email in cursor:
+            instructors.add(Instructor(name, age, email, instructor_id, []))
+    return instructors
+
+
+def load_courses(connection, instructors):
+    """
+    Read every course from the database and link it to its instructor.
+
+    :param connection: The database connection to read from.
+    :type connection: sqlite3.Connection
+    :param instructors: The instructors the courses may be taught by.
+    :type instructors: Registry
+    :returns: The courses, indexed by course ID.
+    :rtype: Registry
+    """
+    courses = Registry('course_id')
+    with closing(connection.cursor()) as cursor:
+        cursor.execute('SELECT course_id, course_name, instructor_id FROM Courses')
+        for course_id, course_name, instructor_id in cursor:
+            instructor = instructors.get(instructor_id)
+            courses.add(Course(course_id, course_name, instructor, []))
+    return courses
+
+
+def load_enrollments(connection, students, courses):
+    """
+    Read every enrollment from the database and link each student to the course.
+
+    Enrollments that refer to a missing student or course are skipped. Nothing is written back,
+    since the enrollments are already stored.
+
+    :param connection: The database connection to read from.
+    :type connection: sqlite3.Connection
+    :param students: The students that may be enrolled.
+    :type students: Registry
+    :param courses: The courses students may be enrolled in.
+    :type courses: Registry
+    :returns: The number of enrollments linked.
+    :rtype: int
+    """
+    linked = 0
+    with closing(connection.cursor()) as cursor:
+        cursor.execute('SELECT student_id, course_id FROM Enrollments')
+        for student_id, course_id in cursor:
+            student = students.get(student_id)
+            course = courses.get(course_id)
+            if student and course:
+                student.registered_courses.add(course)
+                linked += 1
+    return linked
+
+
+def load_school(connection):
+    """
+    Read the whole school from the database and link the objects together.
+
+    :param connection: The database connection to read from.
+    :type connection: sqlite3.Connection
+    :returns: The students, instructors, and courses, each indexed by ID.
+    :rtype: tuple[Registry, Registry, Registry]
+    """
+    students = load_students(connection)
+    instructors = load_instructors(connection)
+    courses = load_courses(connection, instructors)
+    load_enrollments(connection, students, courses)
+    return students, instructors, courses
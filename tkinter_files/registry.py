@@ -0,0 +1,92 @@
+"""
+Keyed in-memory collections for the school management system.
+
+This module provides the `Registry` class used by the tabs to hold their students, instructors,
+and courses. A registry keeps its items in insertion order like a list, but also indexes them by
+ID so lookups, duplicate checks, and removals take constant time.
+"""
+
+
+class Registry:
+    """
+    An insertion-ordered collection of entities indexed by one of their ID attributes.
+
+    Iterating over a registry yields the entities in the order they were added.
+
+    :param key: The name of the attribute that uniquely identifies an entity, e.g. 'student_id'.
+    :type key: str
+    :param items: Entities to add initially.
+    :type items: iterable
+    """
+    def __init__(self, key, items=()):
+        self.key = key
+        self.items = {}
+        self.replace(items)
+
+    def key_of(self, item):
+        """
+        Get the ID of an entity.
+
+        :param item: The entity.
+        :type item: object
+        :returns: The value of the entity's key attribute.
+        :rtype: str
+        """
+        return getattr(item, self.key)
+
+    def add(self, item):
+        """
+        Add an entity to the end of the registry.
+
+        :param item: The entity to add.
+        :type item: object
+        :raises KeyError: If an entity with the same ID is already registered.
+        """
+        item_id = self.key_of(item)
+        if item_id in self.items:
+            raise KeyError(item_id)
+        self.items[item_id] = item
+
+    def get(self, item_id, default=None):
+        """
+        Look up an entity by ID.
+
+        :param item_id: The ID to look up.
+        :type item_id: str
+        :param default: The value returned if no entity has this ID.
+        :returns: The entity with this ID, or `default`.
+        """
+        return self.items.get(item_id, default)
+
+    def remove(self, item):
+        """
+        Remove an entity from the registry.
+
+        :param item: The entity to remove.
+        :type item: object
+        :raises KeyError: If the entity is not registered.
+        """
+        del self.items[self.key_of(item)]
+
+    def replace(self, items):
+        """
+        Replace the contents of the registry.
+
+        :param items: The entities the registry should hold, in order.
+        :type items: iterable
+        """
+        self.items = {}
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item_id):
+        return item_id in self.items
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
@@ -0,0 +1,100 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from classes import Student, Instructor, Course
+
+"""
+Tests for the relationships between the domain classes.
+
+Run them from the `tkinter_files` folder with `python -m unittest` or `python -m pytest`. They do
+not use the database.
+"""
+
+
+class InstructorDeserializeTest(unittest.TestCase):
+    def test_deserialize_with_assigned_courses(self):
+        courses = {'C1': Course('C1', 'Algebra', None, []), 'C2': Course('C2', 'Biology', None, [])}
+        data = {'name': 'Ada', 'age': 40, 'email': 'ada@school.edu', 'instructor_id': 'I1',
+                'assigned_courses': ['C1', 'C2']}
+
+        instructor = Instructor.deserialize(data, courses)
+
+        self.assertEqual([course.course_id for course in instructor.assigned_courses], ['C1', 'C2'])
+        self.assertIs(courses['C1'].instructor, instructor)
+        self.assertIs(courses['C2'].instructor, instructor)
+        self.assertEqual(instructor.serialize(), data)
+
+    def test_course_moves_to_new_instructor(self):
+        course = Course('C1', 'Algebra', None, [])
+        first = Instructor('Ada', 40, 'ada@school.edu', 'I1', [course])
+        second = Instructor('Alan', 41, 'alan@school.edu', 'I2', [course])
+
+        self.assertIs(course.instructor, second)
+        self.assertNotIn(course, first.assigned_courses)
+        self.assertIn(course, second.assigned_courses)
+
+    def test_assign_course_taken_from_another_instructor(self):
+        course = Course('C1', 'Algebra', None, [])
+        first = Instructor('Ada', 40, 'ada@school.edu', 'I1', [course])
+        second = Instructor('Alan', 41, 'alan@school.edu', 'I2', [])
+
+        second.assigned_courses.add(course)
+
+        self.assertEqual(list(second.assigned_courses), [course])
+        self.assertEqual(list(first.assigned_courses), [])
+
+
+class StudentDeserializeTest(unittest.TestCase):
+    def test_deserialize_enrolls_in_courses(self):
+        courses = {'C1': Course('C1', 'Algebra', None, [])}
+        data = {'name': 'Sam', 'age': 20, 'email': 'sam@school.edu', 'student_id': 'S1',
+                'registered_courses': ['C1']}
+
+        student = Student.deserialize(data, courses)
+
+        self.assertIn(student, courses['C1'].enrolled_students)
+        self.assertEqual(student.serialize(), data)
+
+    def test_clear_unlinks_both_sides(self):
+        course = Course('C1', 'Algebra', None, [])
+        students = [Student(f'Sam {i}', 20, 'sam@school.edu', f'S{i}', [course]) for i in range(20)]
+
+        course.enrolled_students.clear()
+
+        self.assertEqual(len(course.enrolled_students), 0)
+        self.assertTrue(all(not student.registered_courses for student in students))
+
+
+class LargeLinkSetTest(unittest.TestCase):
+    def test_large_roster_keeps_order_and_unlinks_in_place(self):
+        course = Course('C1', 'Algebra', None, [])
+        students = [Student(f'Sam {i}', 20, 'sam@school.edu', f'S{i}', [course]) for i in range(100)]
+
+        self.assertIs(type(course._enrolled_students), dict)
+        for student in students[::3]:
+            course.enrolled_students.remove(student)
+
+        kept = [student for i, student in enumerate(students) if i % 3]
+        self.assertEqual(list(course.enrolled_students), kept)
+        for i, student in enumerate(students):
+            self.assertEqual(student in course.enrolled_students, bool(i % 3))
+            self.assertEqual(course in student.registered_courses, bool(i % 3))
+        with self.assertRaises(KeyError):
+            course.enrolled_students.remove(students[0])
+
+    def test_large_roster_is_emptied_by_removals(self):
+        course = Course('C1', 'Algebra', None, [])
+        students = [Student(f'Sam {i}', 20, 'sam@school.edu', f'S{i}', [course]) for i in range(20)]
+
+        for student in students:
+            course.enrolled_students.discard(student)
+
+        self.assertIsNone(course._enrolled_students)
+        self.assertFalse(course.enrolled_students)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from json_loader import load_school_data
+
+"""
+Tests for loading JSON data files.
+
+Run them from the `tkinter_files` folder with `python -m unittest` or `python -m pytest`.
+"""
+
+
+def data_file(students):
+    return io.StringIO(json.dumps({
+        'students': students,
+        'instructors': [{'name': 'Ada', 'age': 40, 'email': 'ada@school.edu', 'instructor_id': 'I1',
+                         'assigned_courses': ['C1']}],
+        'courses': [{'course_id': 'C1', 'course_name': 'Algebra', 'instructor_id': 'I1',
+                     'enrolled_students': ['S1']}],
+    }))
+
+
+class LoadSchoolDataTest(unittest.TestCase):
+    def test_valid_file_is_linked(self):
+        students, instructors, courses, warnings, corrections, report = load_school_data(data_file([
+            {'name': 'Sam', 'age': 20, 'email': 'sam@school.edu', 'student_id': 'S1', 'registered_courses': ['C1']},
+        ]))
+
+        self.assertTrue(report.valid)
+        self.assertEqual((warnings, corrections), ([], []))
+        self.assertIn(students['S1'], courses['C1'].enrolled_students)
+        self.assertIs(courses['C1'].instructor, instructors['I1'])
+
+    def test_every_invalid_value_is_reported(self):
+        *_, report = load_school_data(data_file([
+            {'name': 'Sam', 'age': 20, 'email': 'sam@school.edu', 'student_id': 'S1', 'registered_courses': []},
+            {'name': '', 'age': 'old', 'email': 'nope', 'student_id': 'S2', 'registered_courses': []},
+            {'name': 'Kim', 'age': 21, 'email': 'kim@school.edu'},
+        ]))
+
+        self.assertFalse(report.valid)
+        self.assertEqual(sorted((issue.row, issue.column) for issue in report), [
+            (1, 'students.age'), (1, 'students.email'), (1, 'students.name'), (2, 'students.student_id'),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
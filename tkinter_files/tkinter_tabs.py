@@ -1,25 +1,34 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
-import csv
 import os
 import re   
 
 from classes import Student, Instructor, Course, db
+from registry import Registry
+from treeview_rows import TreeviewRows, VirtualRows, RowCountLabel
+from common.csv_export import CsvExport
+from json_loader import load_school_data
+from common.validation import is_email, describe
+from events import TabView, EntityAdded, EntityUpdated, EntityRemoved, LinkAdded, LinkRemoved, DataReplaced, STUDENT, INSTRUCTOR, COURSE, ENROLLMENT, ASSIGNMENT
 
 from contextlib import closing
 
 import sqlite3
 
-class StudentTab:
+class StudentTab(TabView):
     """
     A class representing the 'Student' tab in a Tkinter notebook widget. This tab allows users to add, edit, search, and delete students, as well as view student details in a Treeview widget.
 
     :param notebook: The Tkinter notebook widget where the 'Student' tab will be added.
     :type notebook: ttk.Notebook
+    :param bus: The change bus the tab publishes its changes on and listens to.
+    :type bus: ChangeBus
+    :param virtual: Whether to keep only the visible students and a buffer around them in the Treeview, for very large lists (default is False).
+    :type virtual: bool
     """
-    def __init__(self, notebook):
-        self.students = []
+    def __init__(self, notebook, bus, virtual=False):
+        self.students = Registry('student_id')
         self.student_tab = ttk.Frame(notebook)
         notebook.add(self.student_tab, text="Add Student")
 
@@ -63,6 +72,17 @@ class StudentTab:
         self.student_treeview.heading("ID", text="Student ID")
         self.student_treeview.heading("Courses", text="Courses")
         self.student_treeview.grid(row=1, column=1, columnspan=6, rowspan=5, padx=10, pady=5, sticky='nsew')
+        self.student_scrollbar = ttk.Scrollbar(self.student_tab, orient="vertical")
+        self.student_scrollbar.grid(row=1, column=7, rowspan=5, pady=5, sticky='nsw')
+        self.student_count_label = tk.Label(self.student_tab, text="")
+        self.student_count_label.grid(row=6, column=6, columnspan=2, padx=10, sticky='e')
+        status = RowCountLabel(self.student_count_label, "students")
+        if virtual:
+            self.student_rows = VirtualRows(self.student_treeview, self.student_scrollbar, 'student_id', self.student_row_values, status)
+        else:
+            self.student_treeview.configure(yscrollcommand=self.student_scrollbar.set)
+            self.student_scrollbar.configure(command=self.student_treeview.yview)
+            self.student_rows = TreeviewRows(self.student_treeview, 'student_id', self.student_row_values, status)
 
         self.student_tab.grid_columnconfigure(2, weight=1)
         self.student_tab.grid_columnconfigure(3, weight=1)
@@ -74,7 +94,14 @@ class StudentTab:
         delete_button = tk.Button(self.student_tab, text="Delete Student", command=self.delete_student)
         delete_button.grid(row=0, column=7, padx=5, pady=5)
 
-        self.update_student_treeview()
+        self.attach(bus, notebook, self.student_tab)
+        self.listen(EntityAdded, self.on_student_added, STUDENT)
+        self.listen(EntityUpdated, self.on_student_updated, STUDENT)
+        self.listen(EntityRemoved, self.on_student_removed, STUDENT)
+        self.listen(LinkAdded, self.on_enrollment_changed, ENROLLMENT)
+        self.listen(LinkRemoved, self.on_enrollment_changed, ENROLLMENT)
+        self.listen(EntityUpdated, self.on_course_updated, COURSE)
+        self.listen(DataReplaced, self.refresh_soon)
 
     def add_student(self):
         """
@@ -101,22 +128,20 @@ class StudentTab:
             messagebox.showerror("Error", "Age must be an integer.")
             return
 
-        email_pattern = re.compile(r"[^@]+@[^@]+\.[^@]+")
-        if not email_pattern.match(email):
+        if not is_email(email):
             messagebox.showerror("Error", "Please enter a valid email address.")
             return
 
-        if any(s.student_id == student_id for s in self.students):
+        if student_id in self.students:
             messagebox.showerror("Error", f"A student with ID '{student_id}' already exists.")
             return
 
         student = Student(name, age, email, student_id, [])
-        self.students.append(student)
+        self.students.add(student)
         student.save_to_db()  
         messagebox.showinfo("Success", f"Student {name} added!")
-        self.update_student_treeview()
         self.clear_form()
-        self.enroll_students_tab.update_students()
+        self.bus.publish(EntityAdded(STUDENT, student))
 
     def clear_form(self):
         """
@@ -133,83 +158,90 @@ class StudentTab:
         
         If no query is provided, an error message is displayed.
         """
-        for row in self.student_treeview.get_children():
-            self.student_treeview.delete(row)
-
         query = self.search_entry.get().strip().lower()
         filter_by = self.filter_combobox.get()
 
         if query == "":
+            self.student_rows.clear()
             messagebox.showerror("Error", "Enter search query information.")
             return
 
+        matches = []
         for student in self.students:
             if filter_by == "Name" and query in student.get_name().lower():
-                self.student_treeview.insert("", "end", values=(student.name, student.age, student.get_email(), student.student_id))
+                matches.append(student)
             elif filter_by == "ID" and query in student.get_student_id().lower():
-                self.student_treeview.insert("", "end", values=(student.name, student.age, student.get_email(), student.student_id))
+                matches.append(student)
             elif filter_by == "Email" and query in student.get_email().lower():
-                self.student_treeview.insert("", "end", values=(student.name, student.age, student.get_email(), student.student_id))
+                matches.append(student)
             elif filter_by == "Age" and query == str(student.get_age()).lower():
-                self.student_treeview.insert("", "end", values=(student.name, student.age, student.get_email(), student.student_id))
+                matches.append(student)
+        self.student_rows.render(matches)
 
     def clear_student_search(self):
         """
         Clear the search field and repopulate the Treeview with all students.
         """
         self.search_entry.delete(0, tk.END)
-        for row in self.student_treeview.get_children():
-            self.student_treeview.delete(row)
+        self.student_rows.render(self.students)
 
-        for student in self.students:
-            self.student_treeview.insert("", "end", values=(student.name, student.age, student.get_email(), student.student_id))
+    def student_row_values(self, student):
+        """
+        Get the values shown in a student's row of the Treeview.
+
+        :param student: The student.
+        :type student: Student
+        :returns: The student's name, age, email, ID, and registered courses.
+        :rtype: tuple
+        """
+        courses = ", ".join(f"{course.course_name} (ID: {course.course_id})" for course in student.registered_courses)
+        return (student.name, student.age, student.get_email(), student.student_id, courses)
 
     def update_student_treeview(self):
         """
         Update the Treeview to display the current list of students with their assigned courses.
-        """
-        for row in self.student_treeview.get_children():
-            self.student_treeview.delete(row)
 
-        for student in self.students:
-            courses = ", ".join(f"{course.course_name} (ID: {course.course_id})" for course in student.registered_courses)
-            self.student_treeview.insert("", "end", values=(student.name, student.age, student.get_email(), student.student_id, courses))
-
-    def set_enroll_students_tab(self, value):
+        Only the rows of students that were added, changed, or removed since the last update are touched,
+        a chunk at a time so the window stays responsive while a large list is shown.
         """
-        Set the enroll students tab reference to allow communication between tabs.
+        self.student_rows.render(self.students)
 
-        :param value: The reference to the enroll students tab.
-        :type value: EnrollStudentsTab
+    def refresh(self):
         """
-        self.enroll_students_tab = value
-
-    def set_instructors_tab(self, instructors_tab):
+        Redraw the Treeview from the current list of students.
         """
-        Set the instructors tab reference to allow communication between tabs.
+        self.update_student_treeview()
 
-        :param instructors_tab: The reference to the instructors tab.
-        :type instructors_tab: InstructorTab
+    def on_student_added(self, event):
         """
-        self.instructors_tab = instructors_tab
+        Show the row of a student that was added.
+        """
+        self.student_rows.show(event.entity)
 
-    def set_courses_tab(self, courses_tab):
+    def on_student_updated(self, event):
         """
-        Set the courses tab reference to allow communication between tabs.
+        Update the row of a student whose details changed.
+        """
+        self.student_rows.refresh(event.entity)
 
-        :param courses_tab: The reference to the courses tab.
-        :type courses_tab: CourseTab
+    def on_student_removed(self, event):
         """
-        self.courses_tab = courses_tab
+        Delete the row of a student that was removed.
+        """
+        self.student_rows.remove(event.entity)
 
-    def set_assign_instructor_tab(self, value):
+    def on_enrollment_changed(self, event):
+        """
+        Update the row of a student who was enrolled in or dropped from a course.
         """
-        Set the assign instructor tab reference to allow communication between tabs.
+        self.student_rows.refresh(event.source)
 
-        :param value: The reference to the assign instructor tab.
-        :type value: AssignInstructorTab
+    def on_course_updated(self, event):
         """
-        self.assign_instructor_tab = value
+        Update the rows of the students enrolled in a course whose name changed.
+        """
+        for student in event.entity.enrolled_students:
+            self.student_rows.refresh(student)
 
     def delete_student(self):
         """
@@ -217,15 +249,17 @@ class StudentTab:
 
         If no student is selected, an error message is displayed. Removes the student from enrolled courses and the database.
         """
-        selected_item = self.student_treeview.selection()
+        selected_item = self.student_rows.selected()
         if selected_item:
-            student_id = self.student_treeview.item(selected_item)['values'][3] 
-            student = next((student for student in self.students if student.student_id == student_id), None)
+            student_id = selected_item[0]
+            student = self.students.get(student_id)
             if student:
-                p = [course.enrolled_students.remove(student) for course in student.registered_courses]
+                courses = list(student.registered_courses)
+                student.registered_courses.clear()
                 self.students.remove(student)
-                self.update_student_treeview()
-                self.enroll_students_tab.update_students()
+                for course in courses:
+                    self.bus.publish(LinkRemoved(ENROLLMENT, student, course))
+                self.bus.publish(EntityRemoved(STUDENT, student))
                 with closing(db.connection.cursor()) as cursor:
                     cursor.execute('DELETE FROM Students WHERE student_id = ?', (student.student_id,))
                     cursor.execute('DELETE FROM Enrollments WHERE student_id = ?', (student.student_id,))
@@ -243,10 +277,10 @@ class StudentTab:
 
         If no student is selected, an error message is displayed. Enables the 'Update Student' button to save changes.
         """
-        selected_item = self.student_treeview.selection()
+        selected_item = self.student_rows.selected()
         if selected_item:
-            student_id = self.student_treeview.item(selected_item)['values'][3]  
-            student = next((student for student in self.students if student.student_id == student_id), None)
+            student_id = selected_item[0]
+            student = self.students.get(student_id)
             if student:
                 self.student_name_entry.delete(0, tk.END)
                 self.student_name_entry.insert(0, student.name)
@@ -291,12 +325,11 @@ class StudentTab:
             messagebox.showerror("Error", "Age must be an integer.")
             return
 
-        email_pattern = re.compile(r"[^@]+@[^@]+\.[^@]+")
-        if not email_pattern.match(updated_email):
+        if not is_email(updated_email):
             messagebox.showerror("Error", "Please enter a valid email address.")
             return
 
-        student = next((student for student in self.students if student.student_id == student_id), None)
+        student = self.students.get(str(student_id))
         if student:
             student.name = updated_name
             student.age = updated_age
@@ -310,22 +343,25 @@ class StudentTab:
             self.student_id_entry.config(state='normal')
             self.student_id_entry.delete(0, tk.END)
 
-            self.update_student_treeview()
-            self.enroll_students_tab.update_students()
+            self.bus.publish(EntityUpdated(STUDENT, student))
             messagebox.showinfo("Success", "Student record updated successfully")
             self.update_button.destroy()
         else:
             messagebox.showerror("Error", "Student not found.")
 
-class InstructorTab:
+class InstructorTab(TabView):
     """
     A class representing the 'Instructor' tab in a Tkinter notebook widget. This tab allows users to add, edit, search, and delete instructors, as well as view instructor details in a Treeview widget.
 
     :param notebook: The Tkinter notebook widget where the 'Instructor' tab will be added.
     :type notebook: ttk.Notebook
+    :param bus: The change bus the tab publishes its changes on and listens to.
+    :type bus: ChangeBus
+    :param virtual: Whether to keep only the visible instructors and a buffer around them in the Treeview, for very large lists (default is False).
+    :type virtual: bool
     """
-    def __init__(self, notebook):
-        self.instructors = []
+    def __init__(self, notebook, bus, virtual=False):
+        self.instructors = Registry('instructor_id')
         self.instructor_tab = ttk.Frame(notebook)
         notebook.add(self.instructor_tab, text="Add Instructor")
 
@@ -370,6 +406,17 @@ class InstructorTab:
         self.instructor_treeview.heading("ID", text="Instructor ID")
         self.instructor_treeview.heading("Assigned Courses", text="Assigned Courses")
         self.instructor_treeview.grid(row=1, column=1, columnspan=6, rowspan=5, padx=10, pady=5, sticky='nsew')
+        self.instructor_scrollbar = ttk.Scrollbar(self.instructor_tab, orient="vertical")
+        self.instructor_scrollbar.grid(row=1, column=7, rowspan=5, pady=5, sticky='nsw')
+        self.instructor_count_label = tk.Label(self.instructor_tab, text="")
+        self.instructor_count_label.grid(row=6, column=6, columnspan=2, padx=10, sticky='e')
+        status = RowCountLabel(self.instructor_count_label, "instructors")
+        if virtual:
+            self.instructor_rows = VirtualRows(self.instructor_treeview, self.instructor_scrollbar, 'instructor_id', self.instructor_row_values, status)
+        else:
+            self.instructor_treeview.configure(yscrollcommand=self.instructor_scrollbar.set)
+            self.instructor_scrollbar.configure(command=self.instructor_treeview.yview)
+            self.instructor_rows = TreeviewRows(self.instructor_treeview, 'instructor_id', self.instructor_row_values, status)
 
         self.instructor_tab.grid_columnconfigure(2, weight=1)
         self.instructor_tab.grid_columnconfigure(3, weight=1)
@@ -381,7 +428,14 @@ class InstructorTab:
         delete_button = tk.Button(self.instructor_tab, text="Delete Instructor", command=self.delete_instructor)
         delete_button.grid(row=0, column=7, padx=5, pady=5)
 
-        self.update_instructor_treeview()
+        self.attach(bus, notebook, self.instructor_tab)
+        self.listen(EntityAdded, self.on_instructor_added, INSTRUCTOR)
+        self.listen(EntityUpdated, self.on_instructor_updated, INSTRUCTOR)
+        self.listen(EntityRemoved, self.on_instructor_removed, INSTRUCTOR)
+        self.listen(LinkAdded, self.on_assignment_changed, ASSIGNMENT)
+        self.listen(LinkRemoved, self.on_assignment_changed, ASSIGNMENT)
+        self.listen(EntityUpdated, self.on_course_updated, COURSE)
+        self.listen(DataReplaced, self.refresh_soon)
 
     def add_instructor(self):
         """
@@ -408,22 +462,20 @@ class InstructorTab:
             messagebox.showerror("Error", "Age must be an integer.")
             return
 
-        email_pattern = re.compile(r"[^@]+@[^@]+\.[^@]+")
-        if not email_pattern.match(email):
+        if not is_email(email):
             messagebox.showerror("Error", "Please enter a valid email address.")
             return
 
-        if any(inst.instructor_id == instructor_id for inst in self.instructors):
+        if instructor_id in self.instructors:
             messagebox.showerror("Error", f"An instructor with ID '{instructor_id}' already exists.")
             return
 
         instructor = Instructor(name, age, email, instructor_id, [])
-        self.instructors.append(instructor)
+        self.instructors.add(instructor)
         instructor.save_to_db()  
         messagebox.showinfo("Success", f"Instructor {name} added!")
-        self.update_instructor_treeview()
         self.clear_form()
-        self.assign_instructor_tab.update_instructors()
+        self.bus.publish(EntityAdded(INSTRUCTOR, instructor))
 
     def clear_form(self):
         """
@@ -440,65 +492,90 @@ class InstructorTab:
 
         If no query is provided, an error message is displayed.
         """
-        for row in self.instructor_treeview.get_children():
-            self.instructor_treeview.delete(row)
-
         query = self.search_entry.get().strip().lower()
         filter_by = self.filter_combobox.get()
 
         if query == "":
+            self.instructor_rows.clear()
             messagebox.showerror("Error", "Enter search query information.")
             return
 
+        matches = []
         for instructor in self.instructors:
             if filter_by == "Name" and query in instructor.get_name().lower():
-                self.insert_instructor_into_treeview(instructor)
+                matches.append(instructor)
             elif filter_by == "ID" and query in instructor.get_instructor_id().lower():
-                self.insert_instructor_into_treeview(instructor)
+                matches.append(instructor)
             elif filter_by == "Email" and query in instructor.get_email().lower():
-                self.insert_instructor_into_treeview(instructor)
+                matches.append(instructor)
             elif filter_by == "Age" and query == str(instructor.get_age()).lower():
-                self.insert_instructor_into_treeview(instructor)
+                matches.append(instructor)
+        self.instructor_rows.render(matches)
 
-    def insert_instructor_into_treeview(self, instructor):
+    def instructor_row_values(self, instructor):
         """
-        Insert an instructor's details into the Treeview widget.
+        Get the values shown in an instructor's row of the Treeview.
 
-        :param instructor: The instructor object to be inserted into the Treeview.
+        :param instructor: The instructor.
         :type instructor: Instructor
+        :returns: The instructor's name, age, email, ID, and assigned courses.
+        :rtype: tuple
         """
         courses = ", ".join(f"{course.course_name} (ID: {course.course_id})" for course in instructor.assigned_courses)
-        self.instructor_treeview.insert("", "end", values=(instructor.name, instructor.age, instructor.get_email(), instructor.instructor_id, courses))
+        return (instructor.name, instructor.age, instructor.get_email(), instructor.instructor_id, courses)
 
     def clear_instructor_search(self):
         """
         Clear the search field and repopulate the Treeview with all instructors.
         """
         self.search_entry.delete(0, tk.END)
-        for row in self.instructor_treeview.get_children():
-            self.instructor_treeview.delete(row)
-
-        for instructor in self.instructors:
-            self.insert_instructor_into_treeview(instructor)
+        self.instructor_rows.render(self.instructors)
 
     def update_instructor_treeview(self):
         """
         Update the Treeview to display the current list of instructors with their assigned courses.
+
+        Only the rows of instructors that were added, changed, or removed since the last update are touched,
+        a chunk at a time so the window stays responsive while a large list is shown.
         """
-        for row in self.instructor_treeview.get_children():
-            self.instructor_treeview.delete(row)
+        self.instructor_rows.render(self.instructors)
 
-        for instructor in self.instructors:
-            self.insert_instructor_into_treeview(instructor)
+    def refresh(self):
+        """
+        Redraw the Treeview from the current list of instructors.
+        """
+        self.update_instructor_treeview()
+
+    def on_instructor_added(self, event):
+        """
+        Show the row of an instructor that was added.
+        """
+        self.instructor_rows.show(event.entity)
 
-    def set_assign_instructor_tab(self, value):
+    def on_instructor_updated(self, event):
+        """
+        Update the row of an instructor whose details changed.
+        """
+        self.instructor_rows.refresh(event.entity)
+
+    def on_instructor_removed(self, event):
+        """
+        Delete the row of an instructor that was removed.
         """
-        Set the assign instructor tab reference to allow communication between tabs.
+        self.instructor_rows.remove(event.entity)
 
-        :param value: The reference to the assign instructor tab.
-        :type value: AssignInstructorTab
+    def on_assignment_changed(self, event):
+        """
+        Update the row of an instructor who was assigned to or removed from a course.
+        """
+        self.instructor_rows.refresh(event.source)
+
+    def on_course_updated(self, event):
+        """
+        Update the row of the instructor of a course whose name changed.
         """
-        self.assign_instructor_tab = value
+        if event.entity.instructor:
+            self.instructor_rows.refresh(event.entity.instructor)
 
     def delete_instructor(self):
         """
@@ -506,17 +583,17 @@ class InstructorTab:
 
         If no instructor is selected, an error message is displayed. Removes the instructor from the assigned courses and the database.
         """
-        selected_item = self.instructor_treeview.selection()
+        selected_item = self.instructor_rows.selected()
         if selected_item:
-            instructor_id = self.instructor_treeview.item(selected_item)['values'][3]  
-            instructor = next((instructor for instructor in self.instructors if instructor.instructor_id == instructor_id), None)
+            instructor_id = selected_item[0]
+            instructor = self.instructors.get(instructor_id)
             if instructor:
-                for course in instructor.assigned_courses:
-                    course.set_instructor(None)
+                courses = list(instructor.assigned_courses)
+                instructor.assigned_courses.clear()
                 self.instructors.remove(instructor)
-                self.update_instructor_treeview()
-                self.course_tab.update_course_treeview()
-                self.assign_instructor_tab.update_instructors()
+                for course in courses:
+                    self.bus.publish(LinkRemoved(ASSIGNMENT, instructor, course))
+                self.bus.publish(EntityRemoved(INSTRUCTOR, instructor))
                 with closing(db.connection.cursor()) as cursor:
                     cursor.execute('DELETE FROM Instructors WHERE instructor_id = ?', (instructor.instructor_id,))
                     cursor.execute('DELETE FROM Assignments WHERE instructor_id = ?', (instructor.instructor_id,))
@@ -533,10 +610,10 @@ class InstructorTab:
 
         If no instructor is selected, an error message is displayed. Enables the 'Update Instructor' button to save changes.
         """
-        selected_item = self.instructor_treeview.selection()
+        selected_item = self.instructor_rows.selected()
         if selected_item:
-            instructor_id = self.instructor_treeview.item(selected_item)['values'][3]  
-            instructor = next((instructor for instructor in self.instructors if instructor.instructor_id == instructor_id), None)
+            instructor_id = selected_item[0]
+            instructor = self.instructors.get(instructor_id)
             if instructor:
                 
                 self.instructor_name_entry.delete(0, tk.END)
@@ -583,12 +660,11 @@ class InstructorTab:
             messagebox.showerror("Error", "Age must be an integer.")
             return
 
-        email_pattern = re.compile(r"[^@]+@[^@]+\.[^@]+")
-        if not email_pattern.match(updated_email):
+        if not is_email(updated_email):
             messagebox.showerror("Error", "Please enter a valid email address.")
             return
 
-        instructor = next((inst for inst in self.instructors if inst.instructor_id == instructor_id), None)
+        instructor = self.instructors.get(str(instructor_id))
         if instructor:
             instructor.name = updated_name
             instructor.age = updated_age
@@ -602,32 +678,25 @@ class InstructorTab:
             self.instructor_id_entry.config(state='normal')
             self.instructor_id_entry.delete(0, tk.END)
 
-            self.update_instructor_treeview()
-            self.assign_instructor_tab.update_instructors()
-            self.course_tab.update_course_treeview()
+            self.bus.publish(EntityUpdated(INSTRUCTOR, instructor))
             messagebox.showinfo("Success", "Instructor record updated successfully")
             self.update_button.destroy()
         else:
             messagebox.showerror("Error", "Instructor not found.")
 
-    def set_course_tab(self, course_tab):
-        """
-        Set the course tab reference to allow communication between tabs.
-
-        :param course_tab: The reference to the course tab.
-        :type course_tab: CourseTab
-        """
-        self.course_tab = course_tab
-
-class CourseTab:
+class CourseTab(TabView):
     """
     A class representing the 'Course' tab in a Tkinter notebook widget. This tab allows users to add, edit, search, and delete courses, as well as view course details in a Treeview widget.
 
     :param notebook: The Tkinter notebook widget where the 'Course' tab will be added.
     :type notebook: ttk.Notebook
+    :param bus: The change bus the tab publishes its changes on and listens to.
+    :type bus: ChangeBus
+    :param virtual: Whether to keep only the visible courses and a buffer around them in the Treeview, for very large lists (default is False).
+    :type virtual: bool
     """
-    def __init__(self, notebook):
-        self.courses = []
+    def __init__(self, notebook, bus, virtual=False):
+        self.courses = Registry('course_id')
         self.course_tab = ttk.Frame(notebook)
         notebook.add(self.course_tab, text="Add Course")
 
@@ -661,6 +730,17 @@ class CourseTab:
         self.course_treeview.heading("Course ID", text="Course ID")
         self.course_treeview.heading("Instructor", text="Instructor")
         self.course_treeview.grid(row=1, column=1, columnspan=6, rowspan=5, padx=10, pady=5, sticky='nsew')
+        self.course_scrollbar = ttk.Scrollbar(self.course_tab, orient="vertical")
+        self.course_scrollbar.grid(row=1, column=7, rowspan=5, pady=5, sticky='nsw')
+        self.course_count_label = tk.Label(self.course_tab, text="")
+        self.course_count_label.grid(row=6, column=6, columnspan=2, padx=10, sticky='e')
+        status = RowCountLabel(self.course_count_label, "courses")
+        if virtual:
+            self.course_rows = VirtualRows(self.course_treeview, self.course_scrollbar, 'course_id', self.course_row_values, status)
+        else:
+            self.course_treeview.configure(yscrollcommand=self.course_scrollbar.set)
+            self.course_scrollbar.configure(command=self.course_treeview.yview)
+            self.course_rows = TreeviewRows(self.course_treeview, 'course_id', self.course_row_values, status)
 
         self.course_tab.grid_columnconfigure(2, weight=1)
         self.course_tab.grid_columnconfigure(3, weight=1)
@@ -672,7 +752,14 @@ class CourseTab:
         delete_button = tk.Button(self.course_tab, text="Delete Course", command=self.delete_course)
         delete_button.grid(row=0, column=7, padx=5, pady=5)
 
-        self.update_course_treeview()
+        self.attach(bus, notebook, self.course_tab)
+        self.listen(EntityAdded, self.on_course_added, COURSE)
+        self.listen(EntityUpdated, self.on_course_updated, COURSE)
+        self.listen(EntityRemoved, self.on_course_removed, COURSE)
+        self.listen(LinkAdded, self.on_assignment_changed, ASSIGNMENT)
+        self.listen(LinkRemoved, self.on_assignment_changed, ASSIGNMENT)
+        self.listen(EntityUpdated, self.on_instructor_updated, INSTRUCTOR)
+        self.listen(DataReplaced, self.refresh_soon)
 
     def add_course(self):
         """
@@ -688,7 +775,7 @@ class CourseTab:
             messagebox.showerror("Error", "Please fill in all the course details.")
             return
 
-        if any(course.course_id == course_id for course in self.courses):
+        if course_id in self.courses:
             messagebox.showerror("Error", f"A course with ID '{course_id}' already exists.")
             return
 
@@ -701,13 +788,11 @@ class CourseTab:
             return
 
         course = Course(course_id, course_name, None, [])
-        self.courses.append(course)
+        self.courses.add(course)
         course.save_to_db()  
         messagebox.showinfo("Success", f"Course '{course_name}' added!")
-        self.update_course_treeview()
         self.clear_form()
-        self.assign_instructor_tab.update_courses()
-        self.enroll_students_tab.update_courses()
+        self.bus.publish(EntityAdded(COURSE, course))
 
     def clear_form(self):
         """
@@ -722,70 +807,86 @@ class CourseTab:
 
         If no query is provided, an error message is displayed.
         """
-        for row in self.course_treeview.get_children():
-            self.course_treeview.delete(row)
-
         query = self.search_entry.get().strip().lower()
         filter_by = self.filter_combobox.get()
 
         if query == "":
+            self.course_rows.clear()
             messagebox.showerror("Error", "Enter search query information.")
             return
 
+        matches = []
         for course in self.courses:
             if filter_by == "Course Name" and query in course.get_course_name().lower():
-                self.insert_course_into_treeview(course)
+                matches.append(course)
             elif filter_by == "Course ID" and query in course.get_course_id().lower():
-                self.insert_course_into_treeview(course)
+                matches.append(course)
+        self.course_rows.render(matches)
 
     def clear_course_search(self):
         """
         Clear the search field and repopulate the Treeview with all courses.
         """
         self.search_entry.delete(0, tk.END)
-        for row in self.course_treeview.get_children():
-            self.course_treeview.delete(row)
-
-        for course in self.courses:
-            self.insert_course_into_treeview(course)
+        self.course_rows.render(self.courses)
 
     def update_course_treeview(self):
         """
         Update the Treeview to display the current list of courses with their assigned instructors.
+
+        Only the rows of courses that were added, changed, or removed since the last update are touched,
+        a chunk at a time so the window stays responsive while a large list is shown.
         """
-        for row in self.course_treeview.get_children():
-            self.course_treeview.delete(row)
+        self.course_rows.render(self.courses)
 
-        for course in self.courses:
-            self.insert_course_into_treeview(course)
+    def refresh(self):
+        """
+        Redraw the Treeview from the current list of courses.
+        """
+        self.update_course_treeview()
 
-    def insert_course_into_treeview(self, course):
+    def on_course_added(self, event):
+        """
+        Show the row of a course that was added.
         """
-        Insert a course's details into the Treeview widget.
+        self.course_rows.show(event.entity)
 
-        :param course: The course object to be inserted into the Treeview.
-        :type course: Course
+    def on_course_updated(self, event):
         """
-        instructor_name = course.get_instructor().get_name() if course.get_instructor() else ""
-        self.course_treeview.insert("", "end", values=(course.get_course_name(), course.get_course_id(), instructor_name))
+        Update the row of a course whose name changed.
+        """
+        self.course_rows.refresh(event.entity)
 
-    def set_assign_instructor_tab(self, value):
+    def on_course_removed(self, event):
+        """
+        Delete the row of a course that was removed.
         """
-        Set the assign instructor tab reference to allow communication between tabs.
+        self.course_rows.remove(event.entity)
 
-        :param value: The reference to the assign instructor tab.
-        :type value: AssignInstructorTab
+    def on_assignment_changed(self, event):
         """
-        self.assign_instructor_tab = value
+        Update the row of a course that was assigned an instructor or lost one.
+        """
+        self.course_rows.refresh(event.target)
 
-    def set_enroll_students_tab(self, value):
+    def on_instructor_updated(self, event):
+        """
+        Update the rows of the courses of an instructor whose name changed.
         """
-        Set the enroll students tab reference to allow communication between tabs.
+        for course in event.entity.assigned_courses:
+            self.course_rows.refresh(course)
 
-        :param value: The reference to the enroll students tab.
-        :type value: EnrollStudentsTab
+    def course_row_values(self, course):
         """
-        self.enroll_students_tab = value
+        Get the values shown in a course's row of the Treeview.
+
+        :param course: The course.
+        :type course: Course
+        :returns: The course's name, ID, and instructor's name.
+        :rtype: tuple
+        """
+        instructor_name = course.get_instructor().get_name() if course.get_instructor() else ""
+        return (course.get_course_name(), course.get_course_id(), instructor_name)
 
     def delete_course(self):
         """
@@ -793,23 +894,21 @@ class CourseTab:
 
         If no course is selected, an error message is displayed. Removes the course from enrolled students and the database.
         """
-        selected_item = self.course_treeview.selection()
+        selected_item = self.course_rows.selected()
         if selected_item:
-            course_id = self.course_treeview.item(selected_item)['values'][1] 
-            course = next((course for course in self.courses if course.course_id == course_id), None)
+            course_id = selected_item[0]
+            course = self.courses.get(course_id)
             if course:
-                for student in course.enrolled_students:
-                    if course in student.registered_courses:
-                        student.registered_courses.remove(course)
-                
-                if course.instructor and course in course.instructor.assigned_courses:
-                    course.instructor.assigned_courses.remove(course)
+                students = list(course.enrolled_students)
+                instructor = course.instructor
+                course.enrolled_students.clear()
+                course.set_instructor(None)
                 self.courses.remove(course)
-                self.update_course_treeview()
-                self.enroll_students_tab.update_courses()
-                self.assign_instructor_tab.update_courses()
-                self.students_tab.update_student_treeview()
-                self.instructors_tab.update_instructor_treeview()
+                for student in students:
+                    self.bus.publish(LinkRemoved(ENROLLMENT, student, course))
+                if instructor:
+                    self.bus.publish(LinkRemoved(ASSIGNMENT, instructor, course))
+                self.bus.publish(EntityRemoved(COURSE, course))
                 with closing(db.connection.cursor()) as cursor:
                     cursor.execute('DELETE FROM Courses WHERE course_id = ?', (course.course_id,))
                     cursor.execute('DELETE FROM Enrollments WHERE course_id = ?', (course.course_id,))
@@ -828,10 +927,10 @@ class CourseTab:
 
         If no course is selected, an error message is displayed. Enables the 'Update Course' button to save changes.
         """
-        selected_item = self.course_treeview.selection()
+        selected_item = self.course_rows.selected()
         if selected_item:
-            course_id = self.course_treeview.item(selected_item)['values'][1]  
-            course = next((course for course in self.courses if course.course_id == course_id), None)
+            course_id = selected_item[0]
+            course = self.courses.get(course_id)
             if course:
                 
                 self.course_name_entry.delete(0, tk.END)
@@ -865,7 +964,7 @@ class CourseTab:
             messagebox.showerror("Error", "Course Name should contain only letters, numbers, and spaces.")
             return
 
-        course = next((course for course in self.courses if course.course_id == course_id), None)
+        course = self.courses.get(str(course_id))
         if course:
             course.course_name = updated_name
 
@@ -875,46 +974,26 @@ class CourseTab:
             self.course_id_entry.config(state='normal')
             self.course_id_entry.delete(0, tk.END)
 
-            self.update_course_treeview()
-            self.enroll_students_tab.update_courses()
-            self.assign_instructor_tab.update_courses()
-            self.students_tab.update_student_treeview()
-            self.instructors_tab.update_instructor_treeview()
+            self.bus.publish(EntityUpdated(COURSE, course))
             messagebox.showinfo("Success", "Course record updated successfully")
             self.update_button.destroy()
         else:
             messagebox.showerror("Error", "Course not found.")
 
-    def set_students_tab(self, value):
-        """
-        Set the students tab reference to allow communication between tabs.
-
-        :param value: The reference to the students tab.
-        :type value: StudentTab
-        """
-        self.students_tab = value
-
-    def set_instructors_tab(self, value):
-        """
-        Set the instructors tab reference to allow communication between tabs.
-
-        :param value: The reference to the instructors tab.
-        :type value: InstructorTab
-        """
-        self.instructors_tab = value
-
-class AssignInstructorTab:
+class AssignInstructorTab(TabView):
     """
     A class for assigning instructors to courses in a Tkinter notebook widget. This tab allows users to select an instructor and a course, then assign the instructor to the course.
 
     :param notebook: The Tkinter notebook widget where the 'Assign Instructor' tab will be added.
     :type notebook: ttk.Notebook
+    :param bus: The change bus the tab publishes its changes on and listens to.
+    :type bus: ChangeBus
     :param instructors_tab: The reference to the instructors tab.
     :type instructors_tab: InstructorTab
     :param courses_tab: The reference to the courses tab.
     :type courses_tab: CourseTab
     """
-    def __init__(self, notebook, instructors_tab, courses_tab):
+    def __init__(self, notebook, bus, instructors_tab, courses_tab):
         self.frame = ttk.Frame(notebook)
         self.instructors_tab = instructors_tab
         self.courses_tab = courses_tab
@@ -937,6 +1016,18 @@ class AssignInstructorTab:
         self.instructor_list = []
         self.course_list = []
 
+        self.attach(bus, notebook, self.frame)
+        for event_type in (EntityAdded, EntityUpdated, EntityRemoved):
+            self.listen(event_type, self.refresh_soon, INSTRUCTOR)
+            self.listen(event_type, self.refresh_soon, COURSE)
+        self.listen(LinkAdded, self.refresh_soon, ASSIGNMENT)
+        self.listen(LinkRemoved, self.refresh_soon, ASSIGNMENT)
+        self.listen(DataReplaced, self.refresh_soon)
+
+    def refresh(self):
+        """
+        Repopulate the dropdown menus.
+        """
         self.populate_dropdowns()
 
     def populate_dropdowns(self):
@@ -945,14 +1036,12 @@ class AssignInstructorTab:
 
         Sets the values for both the instructor dropdown and the course dropdown. Disables the assign button if no instructors or courses are available.
         """
-        self.instructor_list = self.instructors_tab.instructors
+        self.instructor_list = list(self.instructors_tab.instructors)
         all_courses = self.courses_tab.courses
-        print(all_courses)
         instructor_display = [f"{inst.name} (ID: {inst.instructor_id})" for inst in self.instructor_list]
 
         self.course_list = [course for course in all_courses if course.instructor is None]
         course_display = [f"{course.course_name} (ID: {course.course_id})" for course in self.course_list]
-        print(course_display)
         self.instructor_menu['values'] = instructor_display
         self.course_menu['values'] = course_display
 
@@ -997,47 +1086,29 @@ class AssignInstructorTab:
             self.populate_dropdowns() 
             return
 
-        selected_course.set_instructor(selected_instructor)
         selected_instructor.assign_course(selected_course)
 
-        self.instructors_tab.update_instructor_treeview()
-        self.courses_tab.update_course_treeview()
-
         self.instructor_var.set('')
         self.course_var.set('')
 
-        self.populate_dropdowns()
+        self.bus.publish(LinkAdded(ASSIGNMENT, selected_instructor, selected_course))
 
         messagebox.showinfo("Success", f"Instructor '{selected_instructor.name}' assigned to course '{selected_course.course_name}' successfully!")
 
-    def update_instructors(self):
-        """
-        Update the instructor dropdown when there are changes in the list of available instructors.
-
-        Calls `populate_dropdowns()` to refresh the list of instructors.
-        """
-        self.populate_dropdowns()
-
-    def update_courses(self):
-        """
-        Update the course dropdown when there are changes in the list of available courses.
-
-        Calls `populate_dropdowns()` to refresh the list of courses.
-        """
-        self.populate_dropdowns()
-
-class EnrollStudentsTab:
+class EnrollStudentsTab(TabView):
     """
     A class for enrolling students in courses in a Tkinter notebook widget. This tab allows users to select a student and a course, then enroll the student in the course.
 
     :param notebook: The Tkinter notebook widget where the 'Enroll Students' tab will be added.
     :type notebook: ttk.Notebook
+    :param bus: The change bus the tab publishes its changes on and listens to.
+    :type bus: ChangeBus
     :param students_tab: The reference to the students tab.
     :type students_tab: StudentTab
     :param courses_tab: The reference to the courses tab.
     :type courses_tab: CourseTab
     """
-    def __init__(self, notebook, students_tab, courses_tab):
+    def __init__(self, notebook, bus, students_tab, courses_tab):
         self.frame = ttk.Frame(notebook)
         self.students_tab = students_tab
         self.courses_tab = courses_tab
@@ -1060,6 +1131,18 @@ class EnrollStudentsTab:
         self.student_list = []
         self.course_list = []
 
+        self.attach(bus, notebook, self.frame)
+        for event_type in (EntityAdded, EntityUpdated, EntityRemoved):
+            self.listen(event_type, self.refresh_soon, STUDENT)
+            self.listen(event_type, self.refresh_soon, COURSE)
+        self.listen(LinkAdded, self.refresh_soon, ENROLLMENT)
+        self.listen(LinkRemoved, self.refresh_soon, ENROLLMENT)
+        self.listen(DataReplaced, self.refresh_soon)
+
+    def refresh(self):
+        """
+        Repopulate the dropdown menus.
+        """
         self.populate_dropdowns()
 
     def populate_dropdowns(self):
@@ -1068,7 +1151,7 @@ class EnrollStudentsTab:
 
         Displays students and courses that the selected student is not already enrolled in. Updates the dropdown menus for students and courses. Disables the enroll button if there are no students or courses available for selection.
         """
-        self.student_list = self.students_tab.students
+        self.student_list = list(self.students_tab.students)
         all_courses = self.courses_tab.courses
 
         student_display = [f"{student.name} (ID: {student.student_id})" for student in self.student_list]
@@ -1079,7 +1162,7 @@ class EnrollStudentsTab:
             selected_student = self.student_list[selected_student_index]
             self.course_list = [course for course in all_courses if course not in selected_student.registered_courses]
         else:
-            self.course_list = all_courses
+            self.course_list = list(all_courses)
 
         course_display = [f"{course.course_name} (ID: {course.course_id})" for course in self.course_list]
 
@@ -1132,31 +1215,159 @@ class EnrollStudentsTab:
             return
 
         selected_course.add_student(selected_student)
-        selected_student.register_course(selected_course)
-
-        self.students_tab.update_student_treeview()
-        self.courses_tab.update_course_treeview()
 
         self.course_var.set('')
-        self.populate_dropdowns()
+
+        self.bus.publish(LinkAdded(ENROLLMENT, selected_student, selected_course))
 
         messagebox.showinfo("Success", f"Student '{selected_student.name}' enrolled in course '{selected_course.course_name}' successfully!")
 
-    def update_students(self):
-        """
-        Update the student dropdown when there are changes in the list of available students.
+class ExportProgressDialog:
+    """
+    A modal window that runs CSV exports one chunk at a time and shows their progress.
+
+    Each chunk is written from a Tkinter `after` callback, so the window stays responsive and the user can cancel the export between chunks. The window closes itself when the exports finish, fail, or are cancelled, and then calls `on_complete(completed, error)`, where `completed` is True only if every file was written and `error` is the exception that stopped the export, if any.
+
+    :param parent: The widget the window belongs to.
+    :type parent: tk.Widget
+    :param exports: The exports to run, in order.
+    :type exports: list[CsvExport]
+    :param on_complete: The function called once the window has closed.
+    :type on_complete: callable
+    """
+    def __init__(self, parent, exports, on_complete):
+        self.exports = exports
+        self.on_complete = on_complete
+        self.total = sum(export.total for export in exports)
+        self.current = 0
+        self.done = 0
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Export")
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.status_label = tk.Label(self.window, text="Exporting to CSV...")
+        self.status_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
+        self.progress_bar = ttk.Progressbar(self.window, length=300, maximum=max(self.total, 1))
+        self.progress_bar.grid(row=1, column=0, padx=10, pady=5)
+        cancel_button = tk.Button(self.window, text="Cancel", command=self.cancel)
+        cancel_button.grid(row=2, column=0, padx=10, pady=5)
+
+        self.window.grab_set()
+        self.pending = self.window.after(1, self.step)
+
+    def step(self):
+        """
+        Write the next chunk of the current export and schedule the following one.
+        """
+        if self.current >= len(self.exports):
+            self.finish(True, None)
+            return
+        export = self.exports[self.current]
+        try:
+            more = export.step()
+        except Exception as e:
+            export.cancel()
+            self.finish(False, e)
+            return
+        written = self.done + export.written
+        self.progress_bar['value'] = written
+        self.status_label.config(text=f"Exported {written} of {self.total} rows...")
+        if not more:
+            self.done += export.written
+            self.current += 1
+        self.pending = self.window.after(1, self.step)
 
-        Calls `populate_dropdowns()` to refresh the list of students.
+    def cancel(self):
         """
-        self.populate_dropdowns()
+        Stop the export after the current chunk and remove the partly written file.
+        """
+        if self.current < len(self.exports):
+            self.exports[self.current].cancel()
+        self.finish(False, None)
 
-    def update_courses(self):
+    def finish(self, completed, error):
         """
-        Update the course dropdown when there are changes in the list of available courses.
+        Close the window and report the outcome.
 
-        Calls `populate_dropdowns()` to refresh the list of courses.
+        :param completed: Whether every export was written.
+        :type completed: bool
+        :param error: The exception that stopped the export, or None.
+        :type error: Exception or None
         """
-        self.populate_dropdowns()
+        self.current = len(self.exports)
+        self.window.after_cancel(self.pending)
+        self.window.grab_release()
+        self.window.destroy()
+        self.on_complete(completed, error)
+
+class LoadReportDialog:
+    """
+    A modal window that summarizes the problems found while loading a data file.
+
+    The window shows how many invalid values were found, how many references were dropped, and how many inconsistencies were auto-corrected, followed by the full list of messages, which can be saved to a text file.
+
+    :param parent: The widget the window belongs to.
+    :type parent: tk.Widget
+    :param warnings: The references to missing records that were dropped.
+    :type warnings: list[str]
+    :param corrections: The inconsistencies that were auto-corrected.
+    :type corrections: list[str]
+    :param report: The invalid values found in the file's records, if any.
+    :type report: ValidationReport or None
+    """
+    def __init__(self, parent, warnings, corrections, report=None):
+        invalid = [describe(issue) for issue in report] if report is not None else []
+        self.lines = invalid + warnings + corrections
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Load Report")
+
+        summary = []
+        if invalid:
+            summary.append(f"{len(invalid)} invalid value(s) found in the file's records. Nothing was loaded.")
+        if warnings:
+            summary.append(f"{len(warnings)} reference(s) to records missing from the file were dropped.")
+        if corrections:
+            summary.append(f"{len(corrections)} inconsistenc{'y was' if len(corrections) == 1 else 'ies were'} auto-corrected. Please review your data.")
+        tk.Label(self.window, text="\n".join(summary), justify="left").grid(row=0, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+
+        details = tk.Text(self.window, width=100, height=20, wrap="none")
+        scrollbar = ttk.Scrollbar(self.window, orient="vertical", command=details.yview)
+        details.configure(yscrollcommand=scrollbar.set)
+        details.insert("1.0", "\n".join(self.lines))
+        details.configure(state="disabled")
+        details.grid(row=1, column=0, padx=(10, 0), pady=5, sticky="nsew")
+        scrollbar.grid(row=1, column=1, padx=(0, 10), pady=5, sticky="ns")
+        self.window.rowconfigure(1, weight=1)
+        self.window.columnconfigure(0, weight=1)
+
+        buttons = tk.Frame(self.window)
+        buttons.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="e")
+        tk.Button(buttons, text="Save Log...", command=self.save_log).pack(side="left", padx=5)
+        tk.Button(buttons, text="Close", command=self.window.destroy).pack(side="left", padx=5)
+
+        self.window.grab_set()
+        self.window.wait_window()
+
+    def save_log(self):
+        """
+        Save every message in the report to a text file chosen by the user.
+        """
+        filename = filedialog.asksaveasfilename(
+            parent=self.window,
+            title="Save Load Report",
+            defaultextension=".txt",
+            filetypes=(("Text Files", "*.txt"), ("All Files", "*.*"))
+        )
+        if not filename:
+            return
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.writelines(line + "\n" for line in self.lines)
+        except OSError as e:
+            messagebox.showerror("Error", f"An error occurred while saving the report: {str(e)}", parent=self.window)
 
 class LoadAndStoreDataTab:
     """
@@ -1164,26 +1375,23 @@ class LoadAndStoreDataTab:
 
     :param notebook: The Tkinter notebook widget where the 'Manage Data' tab will be added.
     :type notebook: ttk.Notebook
+    :param bus: The change bus to publish loaded data on.
+    :type bus: ChangeBus
     :param student_tab: The reference to the students tab.
     :type student_tab: StudentTab
     :param instructor_tab: The reference to the instructors tab.
     :type instructor_tab: InstructorTab
     :param course_tab: The reference to the courses tab.
     :type course_tab: CourseTab
-    :param assign_instructor_tab: The reference to the assign instructor tab.
-    :type assign_instructor_tab: AssignInstructorTab
-    :param enroll_students_tab: The reference to the enroll students tab.
-    :type enroll_students_tab: EnrollStudentsTab
     """
-    def __init__(self, notebook, student_tab, instructor_tab, course_tab, assign_instructor_tab, enroll_students_tab):
+    def __init__(self, notebook, bus, student_tab, instructor_tab, course_tab):
         self.load_store_tab = ttk.Frame(notebook)
         notebook.add(self.load_store_tab, text="Manage Data")
         
         self.student_tab = student_tab
         self.instructors_tab = instructor_tab
         self.courses_tab = course_tab
-        self.assign_instructor_tab = assign_instructor_tab
-        self.enroll_students_tab = enroll_students_tab
+        self.bus = bus
 
         form_frame = tk.Frame(self.load_store_tab)
         form_frame.grid(row=1, column=0, rowspan=6, padx=10, pady=10, sticky="n")
@@ -1229,7 +1437,7 @@ class LoadAndStoreDataTab:
         """
         Save all data (students, instructors, and courses) to CSV files.
 
-        Prompts the user to select a directory and saves the data in separate CSV files (students.csv, instructors.csv, courses.csv). Displays a success or error message based on the result.
+        Prompts the user to select a directory and saves the data in separate CSV files (students.csv, instructors.csv, courses.csv). The rows are written in chunks while a progress window lets the user cancel the export. Displays a success or error message based on the result.
         """
         directory = filedialog.askdirectory(
             title="Select Directory to Save CSV Files"
@@ -1237,41 +1445,46 @@ class LoadAndStoreDataTab:
         if not directory:
             return
 
-        try:
-            students_file = os.path.join(directory, 'students.csv')
-            with open(students_file, mode='w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(['Name', 'Age', 'Email', 'Student ID', 'Registered Courses'])
-                for student in self.student_tab.students:
-                    registered_courses = '; '.join([course.course_id for course in student.registered_courses])
-                    writer.writerow([student.name, student.age, student.get_email(), student.student_id, registered_courses])
-
-            instructors_file = os.path.join(directory, 'instructors.csv')
-            with open(instructors_file, mode='w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(['Name', 'Age', 'Email', 'Instructor ID', 'Assigned Courses'])
-                for instructor in self.instructors_tab.instructors:
-                    assigned_courses = '; '.join([course.course_id for course in instructor.assigned_courses])
-                    writer.writerow([instructor.name, instructor.age, instructor.get_email(), instructor.instructor_id, assigned_courses])
-
-            courses_file = os.path.join(directory, 'courses.csv')
-            with open(courses_file, mode='w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(['Course ID', 'Course Name', 'Instructor ID', 'Enrolled Students'])
-                for course in self.courses_tab.courses:
-                    instructor_id = course.instructor.instructor_id if course.instructor else ''
-                    enrolled_students = '; '.join([student.student_id for student in course.enrolled_students])
-                    writer.writerow([course.course_id, course.course_name, instructor_id, enrolled_students])
-
-            messagebox.showinfo("Success", f"Data saved as CSV files in '{directory}'.")
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while saving CSV data: {str(e)}")
+        students = self.student_tab.students
+        instructors = self.instructors_tab.instructors
+        courses = self.courses_tab.courses
+        exports = [
+            CsvExport(
+                os.path.join(directory, 'students.csv'),
+                ['Name', 'Age', 'Email', 'Student ID', 'Registered Courses'],
+                ([student.name, student.age, student.get_email(), student.student_id,
+                  '; '.join(course.course_id for course in student.registered_courses)] for student in students),
+                len(students)
+            ),
+            CsvExport(
+                os.path.join(directory, 'instructors.csv'),
+                ['Name', 'Age', 'Email', 'Instructor ID', 'Assigned Courses'],
+                ([instructor.name, instructor.age, instructor.get_email(), instructor.instructor_id,
+                  '; '.join(course.course_id for course in instructor.assigned_courses)] for instructor in instructors),
+                len(instructors)
+            ),
+            CsvExport(
+                os.path.join(directory, 'courses.csv'),
+                ['Course ID', 'Course Name', 'Instructor ID', 'Enrolled Students'],
+                ([course.course_id, course.course_name, course.instructor.instructor_id if course.instructor else '',
+                  '; '.join(student.student_id for student in course.enrolled_students)] for course in courses),
+                len(courses)
+            ),
+        ]
+
+        def on_complete(completed, error):
+            if error is not None:
+                messagebox.showerror("Error", f"An error occurred while saving CSV data: {str(error)}")
+            elif completed:
+                messagebox.showinfo("Success", f"Data saved as CSV files in '{directory}'.")
+
+        ExportProgressDialog(self.load_store_tab, exports, on_complete)
 
     def load_all_data(self):
         """
         Load data (students, instructors, and courses) from a JSON file.
 
-        Prompts the user to select a JSON file and loads the data into the application. The data is validated and any inconsistencies are auto-corrected. Displays success, warning, or error messages based on the result.
+        Prompts the user to select a JSON file and loads the data into the application. The records are validated in full and, if any value is invalid, every invalid value is listed in a report and nothing is loaded. Otherwise any inconsistencies are auto-corrected, and the problems found are listed together in a single report before the success or error message is displayed.
         """
         try:
             from tkinter import filedialog
@@ -1283,197 +1496,36 @@ class LoadAndStoreDataTab:
                 return
 
             with open(filename, 'r') as f:
-                data = json.load(f)
+                students, instructors, courses, warnings, corrections, report = load_school_data(f)
         except FileNotFoundError:
             messagebox.showerror("Error", f"No data file found at '{filename}'.")
             return
         except json.JSONDecodeError as e:
             messagebox.showerror("Error", f"Error decoding JSON: {str(e)}")
             return
+        except ValueError as ve:
+            messagebox.showerror("Error", str(ve))
+            return
         except Exception as e:
             messagebox.showerror("Error", f"An unexpected error occurred while reading the file: {str(e)}")
             return
 
+        if not report.valid:
+            LoadReportDialog(self.load_store_tab, warnings, corrections, report)
+            messagebox.showerror("Error", "The data file was not loaded because some of its records are invalid.")
+            return
+
         try:
-            if not all(key in data for key in ('students', 'instructors', 'courses')):
-                messagebox.showerror("Error", "Data file is missing required sections.")
-                return
+            if warnings or corrections:
+                LoadReportDialog(self.load_store_tab, warnings, corrections)
 
-            courses = {}
-            instructors = {}
-            students = {}
-
-            email_pattern = re.compile(r"[^@]+@[^@]+\.[^@]+")
-
-            for course_data in data['courses']:
-                try:
-                    if not isinstance(course_data['course_id'], str) or not course_data['course_id']:
-                        raise ValueError("Invalid course ID.")
-                    if not isinstance(course_data['course_name'], str) or not course_data['course_name']:
-                        raise ValueError("Invalid course name.")
-
-                    course = Course(course_data['course_id'], course_data['course_name'], None, [])
-                    courses[course.course_id] = course
-                except KeyError as e:
-                    messagebox.showerror("Error", f"Missing key in course data: {str(e)}")
-                    return
-                except ValueError as ve:
-                    messagebox.showerror("Error", f"Invalid data in course: {ve}")
-                    return
-
-            for instructor_data in data['instructors']:
-                try:
-                    if not isinstance(instructor_data['name'], str) or not instructor_data['name']:
-                        raise ValueError("Invalid instructor name.")
-                    if not isinstance(instructor_data['instructor_id'], str) or not instructor_data['instructor_id']:
-                        raise ValueError("Invalid instructor ID.")
-                    if not isinstance(instructor_data['age'], int):
-                        raise ValueError("Instructor age must be an integer.")
-                    if not email_pattern.match(instructor_data['email']):
-                        raise ValueError("Invalid instructor email address.")
-
-                    instructor = Instructor(
-                        instructor_data['name'],
-                        instructor_data['age'],
-                        instructor_data['email'],
-                        instructor_data['instructor_id'],
-                        []
-                    )
-                    instructors[instructor.instructor_id] = instructor
-                except KeyError as e:
-                    messagebox.showerror("Error", f"Missing key in instructor data: {str(e)}")
-                    return
-                except ValueError as ve:
-                    messagebox.showerror("Error", f"Invalid data in instructor: {ve}")
-                    return
-
-            for student_data in data['students']:
-                try:
-                    if not isinstance(student_data['name'], str) or not student_data['name']:
-                        raise ValueError("Invalid student name.")
-                    if not isinstance(student_data['student_id'], str) or not student_data['student_id']:
-                        raise ValueError("Invalid student ID.")
-                    if not isinstance(student_data['age'], int):
-                        raise ValueError("Student age must be an integer.")
-                    if not email_pattern.match(student_data['email']):
-                        raise ValueError("Invalid student email address.")
-
-                    student = Student(
-                        student_data['name'],
-                        student_data['age'],
-                        student_data['email'],
-                        student_data['student_id'],
-                        []
-                    )
-                    students[student.student_id] = student
-                except KeyError as e:
-                    messagebox.showerror("Error", f"Missing key in student data: {str(e)}")
-                    return
-                except ValueError as ve:
-                    messagebox.showerror("Error", f"Invalid data in student: {ve}")
-                    return
-
-            for course_data in data['courses']:
-                course = courses[course_data['course_id']]
-                instructor_id = course_data.get('instructor_id')
-                if instructor_id:
-                    if instructor_id in instructors:
-                        course.instructor = instructors[instructor_id]
-                    else:
-                        messagebox.showwarning("Warning", f"Instructor ID '{instructor_id}' for course '{course.course_name}' not found.")
-                enrolled_student_ids = course_data.get('enrolled_students', [])
-                course.enrolled_students = []
-                for s_id in enrolled_student_ids:
-                    if s_id in students:
-                        course.enrolled_students.append(students[s_id])
-                    else:
-                        messagebox.showwarning("Warning", f"Student ID '{s_id}' enrolled in course '{course.course_name}' not found.")
-
-            for instructor_data in data['instructors']:
-                instructor = instructors[instructor_data['instructor_id']]
-                assigned_course_ids = instructor_data.get('assigned_courses', [])
-                instructor.assigned_courses = []
-                for c_id in assigned_course_ids:
-                    if c_id in courses:
-                        instructor.assigned_courses.append(courses[c_id])
-                    else:
-                        messagebox.showwarning("Warning", f"Course ID '{c_id}' assigned to instructor '{instructor.name}' not found.")
-
-            for student_data in data['students']:
-                student = students[student_data['student_id']]
-                registered_course_ids = student_data.get('registered_courses', [])
-                student.registered_courses = []
-                for c_id in registered_course_ids:
-                    if c_id in courses:
-                        student.registered_courses.append(courses[c_id])
-                    else:
-                        messagebox.showwarning("Warning", f"Course ID '{c_id}' registered by student '{student.name}' not found.")
-
-            inconsistencies_found = False
-
-            for student in students.values():
-                for course in student.registered_courses:
-                    if student not in course.enrolled_students:
-                        course.enrolled_students.append(student)
-                        inconsistencies_found = True
-                        messagebox.showwarning("Warning", f"Student '{student.name}' registered for course '{course.course_name}' but was not enrolled. Auto-corrected.")
-
-            for course in courses.values():
-                for student in course.enrolled_students:
-                    if course not in student.registered_courses:
-                        student.registered_courses.append(course)
-                        inconsistencies_found = True
-                        messagebox.showwarning("Warning", f"Student '{student.name}' enrolled in course '{course.course_name}' but had not registered. Auto-corrected.")
-
-            for course in courses.values():
-                instructor = course.instructor
-                if instructor:
-                    if course not in instructor.assigned_courses:
-                        instructor.assigned_courses.append(course)
-                        inconsistencies_found = True
-                        messagebox.showwarning("Warning", f"Course '{course.course_name}' is assigned to instructor '{instructor.name}' but was not in the instructor's assigned courses. Auto-corrected.")
-
-            for instructor in instructors.values():
-                for course in instructor.assigned_courses:
-                    if course.instructor != instructor:
-                        course.instructor = instructor
-                        inconsistencies_found = True
-                        messagebox.showwarning("Warning", f"Instructor '{instructor.name}' has course '{course.course_name}' in assigned courses but was not set as the course's instructor. Auto-corrected.")
-
-            if inconsistencies_found:
-                messagebox.showinfo("Notice", "Inconsistencies found in data were auto-corrected. Please review your data.")
-
-            clear_db = db.clear_all_tables()
-            if(not(clear_db)):
-                messagebox.showerror("Error", f"An error occurred while clearing the tables")
-                return 
-            for course in courses.values():
-                course.save_to_db()
-            
-            for student in students.values():
-                student.save_to_db()
-            
-            for instructor in instructors.values():
-                instructor.save_to_db()
-            
-            for student in students.values():
-                student.handle_course_enrollment()
-                        
-            for instructor in instructors.values():
-                instructor.handle_course_assignment()
-
-            self.student_tab.students = list(students.values())
-            self.instructors_tab.instructors = list(instructors.values())
-            self.courses_tab.courses = list(courses.values())
-
-            self.student_tab.update_student_treeview()
-            self.instructors_tab.update_instructor_treeview()
-            self.courses_tab.update_course_treeview()
-
-            self.enroll_students_tab.update_students()
-            self.enroll_students_tab.update_courses()
-            self.assign_instructor_tab.update_instructors()
-            self.assign_instructor_tab.update_courses()
+            db.replace_all(students.values(), instructors.values(), courses.values())
+
+            self.student_tab.students.replace(students.values())
+            self.instructors_tab.instructors.replace(instructors.values())
+            self.courses_tab.courses.replace(courses.values())
+
+            self.bus.publish(DataReplaced())
 
             messagebox.showinfo("Success", "Data loaded successfully.")
         except Exception as e:
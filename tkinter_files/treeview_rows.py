@@ -0,0 +1,616 @@
+import time
+from bisect import bisect_left, insort
+
+"""
+Keyed Treeview rows for the school management system.
+
+This module provides `TreeviewRows`, which shows a collection of entities in a `ttk.Treeview`
+with one row per entity, using the entity's ID as the row's item ID. It remembers the values each
+row shows, so updating the view only inserts, changes, or deletes the rows whose entities were
+added, edited, or removed. A change to a single entity costs a constant number of Tk calls no
+matter how many rows are shown.
+
+Large updates can be rendered progressively with `TreeviewRows.render`, which works through the
+rows in short time-boxed chunks scheduled with `after`, so the window keeps handling scrolling and
+typing while a table fills. `RowCountLabel` shows the number of rows, with a spinner while a
+render is running.
+
+For very large lists, `VirtualRows` offers the same interface but keeps only a window of rows,
+the visible ones plus a buffer on each side, in the Treeview. It pages through the full list as
+the view scrolls, so the widget's memory use does not grow with the number of entities.
+"""
+
+CHUNK_TIME = 0.02
+"""
+The longest time, in seconds, a progressive render spends on one chunk of rows before letting
+Tk handle other events.
+"""
+
+CHUNK_DELAY = 1
+"""
+The delay, in milliseconds, between two chunks of a progressive render.
+"""
+
+CHECK_EVERY = 64
+"""
+The number of rows rendered between two checks of the clock.
+"""
+
+SPINNER = "|/-\\"
+"""
+The frames of the spinner shown while a render is running.
+"""
+
+VIRTUAL_BUFFER = 100
+"""
+The number of rows `VirtualRows` keeps in the Treeview above and below the visible ones.
+"""
+
+COMPACT_RATIO = 8
+"""
+`VirtualRows` rebuilds its index of positions once more than one in this many of its entities
+have been removed since the index was built.
+"""
+
+
+class TreeviewRows:
+    """
+    The rows of a Treeview, one per entity, keyed by entity ID.
+
+    :param treeview: The Treeview the rows are shown in.
+    :type treeview: ttk.Treeview
+    :param key: The name of the attribute that uniquely identifies an entity, e.g. 'student_id'.
+    :type key: str
+    :param values: A function returning the tuple of column values shown for an entity.
+    :type values: callable
+    :param status: A function called with the rows whenever the number of rows or the progress of
+        a render changes, such as a `RowCountLabel`.
+    :type status: callable or None
+    """
+    def __init__(self, treeview, key, values, status=None):
+        self.treeview = treeview
+        self.key = key
+        self.values = values
+        self.status = status
+        self.shown = {}
+        self.job = None
+
+    def iid(self, item):
+        """
+        Get the Treeview item ID of an entity's row.
+
+        :param item: The entity.
+        :type item: object
+        :returns: The entity's ID as a string.
+        :rtype: str
+        """
+        return str(getattr(item, self.key))
+
+    def notify(self):
+        """
+        Report the current number of rows and render progress to the status function, if any.
+        """
+        if self.status is not None:
+            self.status(self)
+
+    def place(self, item):
+        """
+        Insert or update an entity's row without reporting the change.
+
+        :param item: The entity to show.
+        :type item: object
+        :returns: The row's item ID.
+        :rtype: str
+        """
+        iid = self.iid(item)
+        values = tuple(self.values(item))
+        current = self.shown.get(iid)
+        if current is None:
+            self.treeview.insert("", "end", iid=iid, values=values)
+        elif current != values:
+            self.treeview.item(iid, values=values)
+        self.shown[iid] = values
+        return iid
+
+    def show(self, item):
+        """
+        Add an entity's row to the end of the Treeview, or update it if it is already shown.
+
+        :param item: The entity to show.
+        :type item: object
+        """
+        self.place(item)
+        self.notify()
+
+    def refresh(self, item):
+        """
+        Update an entity's row if it is shown. Entities hidden by a search stay hidden.
+
+        :param item: The entity whose row should be updated.
+        :type item: object
+        """
+        if self.iid(item) in self.shown:
+            self.place(item)
+
+    def remove(self, item):
+        """
+        Delete an entity's row, if it is shown. A render that is running will not show it again.
+
+        :param item: The entity, or its ID.
+        :type item: object or str
+        """
+        iid = item if isinstance(item, str) else self.iid(item)
+        if self.job is not None:
+            self.job.skipped.add(iid)
+        if self.shown.pop(iid, None) is not None:
+            self.treeview.delete(iid)
+            self.notify()
+
+    def prune(self, candidates, order):
+        """
+        Delete the rows among `candidates` that are not in `order`, then put the rows in `order`
+        first, in that order, followed by any others. Each step is a single Tk call, and only made
+        if needed.
+
+        :param candidates: The IDs of the rows that may be deleted.
+        :type candidates: iterable[str]
+        :param order: The IDs of the rows to keep, in order.
+        :type order: list[str]
+        """
+        wanted = set(order)
+        stale = [iid for iid in candidates if iid in self.shown and iid not in wanted]
+        if stale:
+            self.treeview.delete(*stale)
+            for iid in stale:
+                del self.shown[iid]
+        if len(self.shown) > len(order):
+            order = order + [iid for iid in self.shown if iid not in wanted]
+        if list(self.shown) != order:
+            self.treeview.set_children("", *order)
+            self.shown = {iid: self.shown[iid] for iid in order}
+
+    def sync(self, items):
+        """
+        Make the Treeview show exactly the given entities, in order, before returning.
+
+        Rows that are already shown with the same values are left alone, rows whose values changed
+        are updated, and rows for entities that are no longer given are deleted in a single call.
+        The rows are only reordered, also in a single call, if their order differs from the order
+        of `items`. A render that is running is cancelled.
+
+        :param items: The entities to show.
+        :type items: iterable
+        """
+        self.cancel()
+        order = [self.place(item) for item in items]
+        self.prune(list(self.shown), order)
+        self.notify()
+
+    def render(self, items):
+        """
+        Make the Treeview show exactly the given entities, in order, a chunk at a time.
+
+        This works like `sync`, but rows are inserted or updated for at most `CHUNK_TIME` seconds
+        at a time, with the rest scheduled with `after`, so the window stays responsive. Rows that
+        are no longer given are deleted once every row has been rendered. A render that is already
+        running is cancelled, so the latest render always wins.
+
+        :param items: The entities to show. They are copied before the render starts.
+        :type items: iterable
+        """
+        self.cancel()
+        self.job = RenderJob(self, list(items))
+        self.job.step()
+
+    def cancel(self):
+        """
+        Stop the render that is running, if any, leaving the rows rendered so far.
+        """
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+
+    @property
+    def rendering(self):
+        """
+        Whether a render is running.
+        """
+        return self.job is not None
+
+    def clear(self):
+        """
+        Delete every row, cancelling any render that is running.
+        """
+        self.cancel()
+        if self.shown:
+            self.treeview.delete(*self.shown)
+            self.shown = {}
+        self.notify()
+
+    def selected(self):
+        """
+        Get the IDs of the selected entities.
+
+        :returns: The IDs of the selected rows, in selection order.
+        :rtype: tuple[str]
+        """
+        return self.treeview.selection()
+
+    def __contains__(self, item_id):
+        return item_id in self.shown
+
+    def __len__(self):
+        return len(self.shown)
+
+
+class RenderJob:
+    """
+    A progressive render of a list of entities into a `TreeviewRows`, started by `TreeviewRows.render`.
+
+    :param rows: The rows to render into.
+    :type rows: TreeviewRows
+    :param items: The entities to show, in order.
+    :type items: list
+    """
+    def __init__(self, rows, items):
+        self.rows = rows
+        self.items = items
+        self.position = 0
+        self.order = []
+        self.previous = list(rows.shown)
+        self.skipped = set()
+        self.after_id = None
+
+    @property
+    def total(self):
+        """
+        The number of entities being rendered.
+        """
+        return len(self.items)
+
+    def step(self):
+        """
+        Render rows until `CHUNK_TIME` has passed, then schedule the next chunk or finish.
+        """
+        self.after_id = None
+        rows, items, skipped = self.rows, self.items, self.skipped
+        deadline = time.perf_counter() + CHUNK_TIME
+        end = len(items)
+        position = self.position
+        while position < end:
+            stop = min(position + CHECK_EVERY, end)
+            for item in items[position:stop]:
+                iid = rows.iid(item)
+                if iid not in skipped:
+                    rows.place(item)
+                    self.order.append(iid)
+            position = stop
+            if time.perf_counter() >= deadline:
+                break
+        self.position = position
+        if position < end:
+            rows.notify()
+            self.after_id = rows.treeview.after(CHUNK_DELAY, self.step)
+        else:
+            self.finish()
+
+    def finish(self):
+        """
+        Delete the rows that were shown before the render but are no longer wanted, and put the
+        rows in order.
+        """
+        rows = self.rows
+        rows.job = None
+        rows.prune(self.previous, [iid for iid in self.order if iid in rows.shown])
+        rows.notify()
+
+    def cancel(self):
+        """
+        Stop rendering, leaving the rows rendered so far.
+        """
+        if self.after_id is not None:
+            self.rows.treeview.after_cancel(self.after_id)
+            self.after_id = None
+
+
+class RowCountLabel:
+    """
+    Shows the number of rows in a label, with a spinner and progress while a render is running.
+
+    An instance can be passed as the `status` of a `TreeviewRows`.
+
+    :param label: The label to show the count in.
+    :type label: tk.Label
+    :param noun: The plural name of the rows, e.g. 'students'.
+    :type noun: str
+    """
+    def __init__(self, label, noun="rows"):
+        self.label = label
+        self.noun = noun
+
+    def __call__(self, rows):
+        if rows.rendering:
+            frame = SPINNER[int(time.monotonic() * 8) % len(SPINNER)]
+            text = f"{frame} Loading {self.noun}... {rows.job.position:,} of {rows.job.total:,}"
+        else:
+            text = f"{len(rows):,} {self.noun}"
+        self.label.config(text=text)
+
+
+class VirtualRows:
+    """
+    A virtual list of entities in a Treeview, which holds only a window of their rows.
+
+    The window covers the visible rows plus `VIRTUAL_BUFFER` rows above and below them, so
+    scrolling a little with the mouse wheel or the keyboard stays within the Treeview. When the
+    view gets close to either end of the window, the window moves to the rows around it, reusing
+    the rows the two windows share. The scrollbar shows the position in the full list, and
+    dragging it pages straight to the matching rows.
+
+    It has the same interface as `TreeviewRows`. Showing, refreshing, or removing an entity only
+    touches the Treeview if the entity's row is in the window, and selecting works on the rows
+    in the window.
+
+    :param treeview: The Treeview the rows are shown in.
+    :type treeview: ttk.Treeview
+    :param scrollbar: The vertical scrollbar of the Treeview.
+    :type scrollbar: ttk.Scrollbar
+    :param key: The name of the attribute that uniquely identifies an entity, e.g. 'student_id'.
+    :type key: str
+    :param values: A function returning the tuple of column values shown for an entity.
+    :type values: callable
+    :param status: A function called with the rows whenever the number of entities changes, such
+        as a `RowCountLabel`.
+    :type status: callable or None
+    """
+    def __init__(self, treeview, scrollbar, key, values, status=None):
+        self.window = TreeviewRows(treeview, key, values)
+        self.scrollbar = scrollbar
+        self.status = status
+        self.items = []
+        self.positions = {}
+        self.removed = []
+        self.start = 0
+        self.top = 0
+        self.visible = int(treeview.cget('height')) or 10
+        treeview.configure(yscrollcommand=self.on_view)
+        scrollbar.configure(command=self.yview)
+
+    @property
+    def treeview(self):
+        """
+        The Treeview the rows are shown in.
+        """
+        return self.window.treeview
+
+    @property
+    def size(self):
+        """
+        The largest number of rows kept in the Treeview.
+        """
+        return self.visible + 2 * VIRTUAL_BUFFER
+
+    @property
+    def rendering(self):
+        """
+        Whether a render is running, which is never the case since only the window is rendered.
+        """
+        return False
+
+    def iid(self, item):
+        """
+        Get the Treeview item ID of an entity's row.
+
+        :param item: The entity.
+        :type item: object
+        :returns: The entity's ID as a string.
+        :rtype: str
+        """
+        return self.window.iid(item)
+
+    def notify(self):
+        """
+        Report the current number of entities to the status function, if any.
+        """
+        if self.status is not None:
+            self.status(self)
+
+    def position(self, iid):
+        """
+        Get the position of an entity in the list.
+
+        `positions` maps each ID to the entity's slot, its position when the index was built or
+        the entity was added, and `removed` holds the sorted slots of the entities removed since.
+        An entity's position is its slot less the number of removed slots before it, so removing
+        an entity does not renumber the others. The index is rebuilt when the removed slots grow
+        past `COMPACT_RATIO`, so a removal costs amortized constant time.
+
+        :param iid: The entity's ID.
+        :type iid: str
+        :returns: The position, or None if the entity is not listed.
+        :rtype: int or None
+        """
+        if self.positions is None:
+            self.positions = {self.iid(item): position for position, item in enumerate(self.items)}
+            self.removed = []
+        slot = self.positions.get(iid)
+        if slot is None or not self.removed:
+            return slot
+        return slot - bisect_left(self.removed, slot)
+
+    def draw(self):
+        """
+        Show the rows of the window, changing only the rows that differ, and update the scrollbar.
+        """
+        self.start = max(0, min(self.start, len(self.items) - self.size))
+        self.window.sync(self.items[self.start:self.start + self.size])
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        """
+        Set the scrollbar to the position of the visible rows in the full list.
+        """
+        total = len(self.items)
+        if total <= self.visible:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.visible) / total))
+
+    def scroll_to(self, top):
+        """
+        Move the window so the entity at position `top` is the first visible row.
+
+        :param top: The position of the entity to show first.
+        :type top: int
+        """
+        self.top = max(0, min(top, len(self.items) - self.visible))
+        self.start = max(0, self.top - VIRTUAL_BUFFER)
+        self.draw()
+        if self.window.shown:
+            self.treeview.yview_moveto((self.top - self.start) / len(self.window.shown))
+
+    def on_view(self, first, last):
+        """
+        Follow the Treeview's own scrolling, moving the window when the view nears one of its ends.
+
+        This is the Treeview's `yscrollcommand`.
+
+        :param first: The fraction of the window above the view.
+        :type first: str
+        :param last: The fraction of the window above the bottom of the view.
+        :type last: str
+        """
+        count = len(self.window.shown)
+        if not count:
+            self.top = 0
+            self.update_scrollbar()
+            return
+        first, last = float(first), float(last)
+        self.top = self.start + round(first * count)
+        self.visible = max(1, round((last - first) * count))
+        margin = VIRTUAL_BUFFER // 2
+        near_start = self.start > 0 and self.top - self.start < margin
+        end = self.start + count
+        near_end = end < len(self.items) and end - (self.top + self.visible) < margin
+        if near_start or near_end:
+            self.scroll_to(self.top)
+        else:
+            self.update_scrollbar()
+
+    def yview(self, *args):
+        """
+        Scroll the full list, as the scrollbar's `command`.
+
+        :param args: `('moveto', fraction)` or `('scroll', count, 'units' or 'pages')`.
+        """
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.items)))
+        elif args[0] == 'scroll':
+            count = int(args[1])
+            if args[2] == 'pages':
+                count *= self.visible
+            self.scroll_to(self.top + count)
+
+    def show(self, item):
+        """
+        Add an entity to the end of the list, or update its row if it is already listed.
+
+        :param item: The entity to show.
+        :type item: object
+        """
+        iid = self.iid(item)
+        if self.position(iid) is None:
+            self.positions[iid] = len(self.items) + len(self.removed)
+            self.items.append(item)
+            if self.start + len(self.window.shown) == len(self.items) - 1:
+                if len(self.window.shown) >= self.size:
+                    self.start += 1
+                self.draw()
+            else:
+                self.update_scrollbar()
+            self.notify()
+        else:
+            self.window.refresh(item)
+
+    def refresh(self, item):
+        """
+        Update an entity's row if it is in the window.
+
+        :param item: The entity whose row should be updated.
+        :type item: object
+        """
+        self.window.refresh(item)
+
+    def remove(self, item):
+        """
+        Remove an entity from the list, if it is listed.
+
+        :param item: The entity, or its ID.
+        :type item: object or str
+        """
+        iid = item if isinstance(item, str) else self.iid(item)
+        position = self.position(iid)
+        if position is not None:
+            del self.items[position]
+            insort(self.removed, self.positions.pop(iid))
+            if len(self.removed) * COMPACT_RATIO > len(self.items):
+                self.positions = None
+            if position < self.start + self.size:
+                self.draw()
+            else:
+                self.update_scrollbar()
+            self.notify()
+
+    def sync(self, items):
+        """
+        Make the list hold exactly the given entities, in order, and redraw the window.
+
+        :param items: The entities to list.
+        :type items: iterable
+        """
+        self.items = list(items)
+        self.positions = None
+        self.draw()
+        self.notify()
+
+    def render(self, items):
+        """
+        Make the list hold exactly the given entities. This is the same as `sync`, since only
+        the window's rows are added to the Treeview.
+
+        :param items: The entities to list.
+        :type items: iterable
+        """
+        self.sync(items)
+
+    def cancel(self):
+        """
+        Do nothing, since renders are never left running.
+        """
+
+    def clear(self):
+        """
+        Remove every entity and delete every row.
+        """
+        self.items = []
+        self.positions = {}
+        self.removed = []
+        self.start = self.top = 0
+        self.window.clear()
+        self.update_scrollbar()
+        self.notify()
+
+    def selected(self):
+        """
+        Get the IDs of the selected entities.
+
+        :returns: The IDs of the selected rows, in selection order.
+        :rtype: tuple[str]
+        """
+        return self.window.selected()
+
+    def __contains__(self, item_id):
+        return self.position(item_id) is not None
+
+    def __len__(self):
+        return len(self.items)